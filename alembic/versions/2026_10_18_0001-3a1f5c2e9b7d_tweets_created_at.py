@@ -0,0 +1,42 @@
+"""Tweets created_at and keyset index.
+
+Revision ID: 3a1f5c2e9b7d
+Revises: d0bdedb4e116
+Create Date: 2026-10-18 00:01:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3a1f5c2e9b7d"
+down_revision: Union[str, None] = "d0bdedb4e116"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:  # noqa D103
+    op.add_column(
+        "tweets",
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_tweets_created_at_id",
+        "tweets",
+        ["created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:  # noqa D103
+    op.drop_index("ix_tweets_created_at_id", table_name="tweets")
+    op.drop_column("tweets", "created_at")
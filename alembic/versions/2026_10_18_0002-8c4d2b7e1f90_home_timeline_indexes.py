@@ -0,0 +1,47 @@
+"""Home timeline indexes.
+
+Revision ID: 8c4d2b7e1f90
+Revises: 3a1f5c2e9b7d
+Create Date: 2026-10-18 00:02:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c4d2b7e1f90"
+down_revision: Union[str, None] = "3a1f5c2e9b7d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:  # noqa D103
+    op.create_unique_constraint(
+        "uq_followers_followed_id_follower_id",
+        "followers",
+        ["followed_id", "follower_id"],
+    )
+    op.create_index(
+        "ix_tweets_author_created_at",
+        "tweets",
+        ["author", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_likes_tweet_id_user_id",
+        "likes",
+        ["tweet_id", "user_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:  # noqa D103
+    op.drop_index("ix_likes_tweet_id_user_id", table_name="likes")
+    op.drop_index("ix_tweets_author_created_at", table_name="tweets")
+    op.drop_constraint(
+        "uq_followers_followed_id_follower_id",
+        "followers",
+        type_="unique",
+    )
@@ -0,0 +1,30 @@
+"""Followers follower_id index for timeline fan-out.
+
+Revision ID: 5e9a0c3d7b21
+Revises: 8c4d2b7e1f90
+Create Date: 2026-10-18 00:03:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e9a0c3d7b21"
+down_revision: Union[str, None] = "8c4d2b7e1f90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:  # noqa D103
+    op.create_index(
+        "ix_followers_follower_id",
+        "followers",
+        ["follower_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:  # noqa D103
+    op.drop_index("ix_followers_follower_id", table_name="followers")
@@ -0,0 +1,41 @@
+"""Tweets denormalized like_count.
+
+Revision ID: b7e3f1a9c6d4
+Revises: 5e9a0c3d7b21
+Create Date: 2026-10-18 00:04:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e3f1a9c6d4"
+down_revision: Union[str, None] = "5e9a0c3d7b21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:  # noqa D103
+    op.add_column(
+        "tweets",
+        sa.Column(
+            "like_count",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+        ),
+    )
+    op.execute(
+        "UPDATE tweets SET like_count = counts.like_count "
+        "FROM (SELECT tweet_id, count(*) AS like_count "
+        "FROM likes GROUP BY tweet_id) AS counts "
+        "WHERE tweets.id = counts.tweet_id"
+    )
+
+
+def downgrade() -> None:  # noqa D103
+    op.drop_column("tweets", "like_count")
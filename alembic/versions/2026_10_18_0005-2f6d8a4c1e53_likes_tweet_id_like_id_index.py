@@ -0,0 +1,30 @@
+"""Likes (tweet_id, like_id) index for recent likers.
+
+Revision ID: 2f6d8a4c1e53
+Revises: b7e3f1a9c6d4
+Create Date: 2026-10-18 00:05:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2f6d8a4c1e53"
+down_revision: Union[str, None] = "b7e3f1a9c6d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:  # noqa D103
+    op.create_index(
+        "ix_likes_tweet_id_like_id",
+        "likes",
+        ["tweet_id", "like_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:  # noqa D103
+    op.drop_index("ix_likes_tweet_id_like_id", table_name="likes")
@@ -0,0 +1,42 @@
+"""Tweets precomputed popularity score.
+
+Revision ID: 9a4e7c2b5d18
+Revises: 2f6d8a4c1e53
+Create Date: 2026-10-18 00:06:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a4e7c2b5d18"
+down_revision: Union[str, None] = "2f6d8a4c1e53"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:  # noqa D103
+    op.add_column(
+        "tweets",
+        sa.Column(
+            "score",
+            sa.Float(),
+            server_default="0",
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_tweets_score_created_at_id",
+        "tweets",
+        ["score", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:  # noqa D103
+    op.drop_index("ix_tweets_score_created_at_id", table_name="tweets")
+    op.drop_column("tweets", "score")
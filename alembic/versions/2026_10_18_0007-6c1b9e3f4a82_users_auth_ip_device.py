@@ -0,0 +1,35 @@
+"""Users auth ip (user_id, fingerprint) unique constraint.
+
+Revision ID: 6c1b9e3f4a82
+Revises: 9a4e7c2b5d18
+Create Date: 2026-10-18 00:07:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6c1b9e3f4a82"
+down_revision: Union[str, None] = "9a4e7c2b5d18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:  # noqa D103
+    # One refresh token per device, the table wasn't written before.
+    op.execute("DELETE FROM users_auth_ip")
+    op.create_unique_constraint(
+        "uq_users_auth_ip_user_id_fingerprint",
+        "users_auth_ip",
+        ["user_id", "fingerprint"],
+    )
+
+
+def downgrade() -> None:  # noqa D103
+    op.drop_constraint(
+        "uq_users_auth_ip_user_id_fingerprint",
+        "users_auth_ip",
+        type_="unique",
+    )
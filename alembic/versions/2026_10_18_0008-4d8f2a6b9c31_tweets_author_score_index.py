@@ -0,0 +1,50 @@
+"""Tweets score indexes by author.
+
+Revision ID: 4d8f2a6b9c31
+Revises: 6c1b9e3f4a82
+Create Date: 2026-10-18 00:08:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4d8f2a6b9c31"
+down_revision: Union[str, None] = "6c1b9e3f4a82"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:  # noqa D103
+    # The home feed ranks tweets of followed authors, a global score
+    # index made it walk other authors' tweets.
+    op.drop_index("ix_tweets_score_created_at_id", table_name="tweets")
+    op.create_index(
+        "ix_tweets_author_score_created_at_id",
+        "tweets",
+        ["author", "score", "created_at", "id"],
+        unique=False,
+    )
+    # Scored tweets only, for the reset of the scoring job.
+    op.create_index(
+        "ix_tweets_scored_created_at",
+        "tweets",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("score > 0"),
+    )
+
+
+def downgrade() -> None:  # noqa D103
+    op.drop_index("ix_tweets_scored_created_at", table_name="tweets")
+    op.drop_index("ix_tweets_author_score_created_at_id", table_name="tweets")
+    op.create_index(
+        "ix_tweets_score_created_at_id",
+        "tweets",
+        ["score", "created_at", "id"],
+        unique=False,
+    )
@@ -11,13 +11,14 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, status
 from fastapi.responses import JSONResponse
-from fastapi.security import APIKeyCookie, HTTPBearer
+from fastapi.security import HTTPBearer
 
 from src.core.controllers.depends.auth.check_token import up_tokens_by_refresh
 from src.core.controllers.depends.auth.login_user import (
     login_user_form,
     login_user_json,
 )
+from src.core.controllers.depends.auth.logout_user import logout_device
 from src.core.controllers.depends.auth.post_user_form import user_form
 from src.core.controllers.depends.auth.post_user_json import user_json
 from src.core.settings.const import (
@@ -159,18 +160,19 @@ async def patch_access_token(
     status_code=status.HTTP_200_OK,
     response_model=StatusResponse,
     responses=Response500.responses,
-    dependencies=[
-        Depends(HTTPBearer()),
-        Depends(APIKeyCookie(name=JWT.TOKEN_TYPE_REFRESH)),
-    ],
+    dependencies=[Depends(HTTPBearer(auto_error=False))],
 )
-async def logout_user() -> "JSONResponse":
+async def logout_user(
+    _: Annotated[bool, Depends(logout_device)],
+) -> "JSONResponse":
     """**Delete loging user**.
 
     Requirement :
         - Cookie:  `refresh_token`
-        - Authorization: Bearer
+        - Authorization: Bearer, optional
 
+    The refresh token of the device is revoked, the access token too if
+    it's still valid.
     """
     response = JSONResponse(
         content=StatusResponse().model_dump(),
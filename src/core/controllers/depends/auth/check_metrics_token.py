@@ -0,0 +1,33 @@
+"""Depends-Check access to metrics and admin routes."""
+
+import hmac
+from typing import Annotated
+
+from fastapi import Header, status
+
+from src.core.controllers.depends.utils.return_error import http_exception
+from src.core.settings.const import MessageError
+from src.core.settings.settings import settings
+
+
+async def check_metrics_token(
+    x_metrics_token: Annotated[str | None, Header()] = None,
+) -> None:
+    """Validate `X-Metrics-Token` header.
+
+    Raises:
+        HTTPException:
+            - status 404 if `METRICS_TOKEN` isn't set, routes are disabled.
+            - status 401 if the token doesn't match.
+    """
+    expected = settings.metrics.METRICS_TOKEN
+    if expected is None:
+        raise http_exception(
+            status_code=status.HTTP_404_NOT_FOUND,
+            error_type=MessageError.TYPE_ERROR_404,
+            error_message=MessageError.MESSAGE_SERVER_ERROR,
+        )
+    if x_metrics_token is None or not hmac.compare_digest(
+        x_metrics_token, expected
+    ):
+        raise http_exception()
@@ -1,21 +1,52 @@
 """Depends-Check active user."""
 
-from typing import Annotated
+import logging
+from typing import TYPE_CHECKING, Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Request, status
 from fastapi.security import APIKeyCookie, OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
 
+from src.core.controllers.depends.utils.access_denylist import (
+    is_access_denied,
+)
+from src.core.controllers.depends.utils.connect_db import get_crud, get_session
 from src.core.controllers.depends.utils.jsonresponse_new_jwt import response
-from src.core.controllers.depends.utils.jwt_token import decode_jwt
+from src.core.controllers.depends.utils.jwt_token import (
+    decode_jwt,
+    decode_jwt_cached,
+)
+from src.core.controllers.depends.utils.refresh_tokens import (
+    device_fingerprint,
+    is_revoked,
+    new_jti,
+    remember_rotation,
+    revoke_device,
+    revoke_tokens,
+    rotated_to,
+    token_ttl,
+)
 from src.core.controllers.depends.utils.return_error import http_exception
-from src.core.settings.const import JWT, Headers, TypeEncoding
+from src.core.settings.const import JWT, Headers, MessageError, TypeEncoding
 from src.core.settings.routes_path import AuthRoutes
 
+if TYPE_CHECKING:
+    from fastapi.responses import JSONResponse
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.core.models_orm.crud import Crud
+
+logger = logging.getLogger(__name__)
+
 oauth_bearer = OAuth2PasswordBearer(
     tokenUrl=f"{AuthRoutes.PREFIX}{AuthRoutes.POST_LOGIN_USER_FORM}",
 )
 
+oauth_bearer_optional = OAuth2PasswordBearer(
+    tokenUrl=f"{AuthRoutes.PREFIX}{AuthRoutes.POST_LOGIN_USER_FORM}",
+    auto_error=False,
+)
+
 cookie_refresh = APIKeyCookie(name=JWT.TOKEN_TYPE_REFRESH)
 
 
@@ -30,11 +61,36 @@ async def token_is_alive(
         HTTPException:
             - status 401
             - headers={"WWW-Authenticate": "Bearer"}
+    Notes:
+        Signature of a token is verified once per worker, see
+        `decode_jwt_cached`. Tokens revoked by logout are rejected, see
+        `is_access_denied`.
     """
     try:
-        return decode_jwt(jwt_token=token)
+        payload = decode_jwt_cached(jwt_token=token)
     except InvalidTokenError:
         raise http_exception(headers=Headers.WWW_AUTH_BEARER)
+    jti = payload.get(JWT.PAYLOAD_JTI_KEY)
+    if jti and await is_access_denied(jti):
+        raise http_exception(headers=Headers.WWW_AUTH_BEARER)
+    return payload
+
+
+async def access_token_if_alive(
+    token: Annotated[str | None, Depends(oauth_bearer_optional)],
+) -> dict | None:
+    """Return payload of the access token, None if it's missing or invalid.
+
+    Notes:
+        For routes that must work with an expired access token, e.g.
+        logout.
+    """
+    if token is None:
+        return None
+    try:
+        return decode_jwt_cached(jwt_token=token)
+    except InvalidTokenError:
+        return None
 
 
 async def refresh_token_is_alive(
@@ -82,9 +138,32 @@ async def get_user_id_by_token_access(
         raise http_exception(headers=Headers.WWW_AUTH_BEARER)
 
 
+def refresh_device(token: dict, request: Request) -> tuple[str, str, str]:
+    """Return user id, jti and fingerprint of the device's refresh token.
+
+    Raises:
+        InvalidTokenError: if token is not "refresh_token", has no jti or
+            was issued to another device.
+    """
+    user_id = token.get(JWT.PAYLOAD_SUB_KEY)
+    jti = token.get(JWT.PAYLOAD_JTI_KEY)
+    fingerprint = token.get(JWT.PAYLOAD_FINGERPRINT_KEY)
+    if (
+        token.get(JWT.TOKEN_TYPE_FIELD) != JWT.TOKEN_TYPE_REFRESH
+        or not user_id
+        or not jti
+        or fingerprint != device_fingerprint(request)
+    ):
+        raise InvalidTokenError
+    return user_id, jti, fingerprint
+
+
 async def up_tokens_by_refresh(
+    request: Request,
     token: Annotated[dict, Depends(refresh_token_is_alive)],
-):
+    crud: Annotated["Crud", Depends(get_crud)],
+    session: Annotated["AsyncSession", Depends(get_session)],
+) -> "JSONResponse":
     """Token refresh update.
 
     Args:
@@ -95,15 +174,61 @@ async def up_tokens_by_refresh(
             - status 401
             - headers="WWW-Authenticate": "Bearer realm=Refresh token expired"
     Notes:
-        if token is not "refresh_token", it'll raise InvalidTokenError.
+        The refresh token is rotated: it's replaced by a new one and
+        revoked. A revoked token is rejected by Redis without a DB query.
+        Reuse of a rotated token means it leaked, the device's session
+        is ended then. Reuse within `JWTconf.ROTATED_GRACE_SECONDS` is
+        taken for a concurrent refresh of another tab and gets the
+        successor token, see `rotated_to`.
     """
     try:
-
-        if token.get(JWT.TOKEN_TYPE_FIELD) == JWT.TOKEN_TYPE_REFRESH:
-            token.pop(JWT.TOKEN_TYPE_FIELD)
-            return response(payload=token)
-
-        raise InvalidTokenError
-
+        user_id, jti, fingerprint = refresh_device(token, request)
     except InvalidTokenError:
         raise http_exception(headers=Headers.WWW_AUTH_BEARER_EXPIRED)
+
+    rotated: bool | None = False
+    next_jti = new_jti()
+    if not await is_revoked(jti):
+        rotated = await crud.auth_users.rotate_refresh_token(
+            user_id=user_id,
+            old_jti=jti,
+            new_jti=next_jti,
+            fingerprint=fingerprint,
+            session=session,
+        )
+    if rotated is None:
+        # todo: add log info - fail rotate refresh token, error data from db
+        raise http_exception(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            error_type=MessageError.TYPE_ERROR_INTERNAL_SERVER_ERROR,
+            error_message=MessageError.MESSAGE_SERVER_ERROR,
+        )
+    if rotated:
+        await remember_rotation(jti, next_jti)
+        await revoke_tokens([jti], ttl=token_ttl(token))
+    elif rotated_jti := await rotated_to(jti):
+        # Another tab rotated the token moments ago, share its successor.
+        next_jti = rotated_jti
+    else:
+        logger.warning(
+            "reuse of a rotated refresh token, session of user %s ended",
+            user_id,
+        )
+        await revoke_device(
+            user_id=user_id,
+            fingerprint=fingerprint,
+            crud=crud,
+            session=session,
+        )
+        raise http_exception(headers=Headers.WWW_AUTH_BEARER_EXPIRED)
+
+    return response(
+        payload={
+            JWT.PAYLOAD_SUB_KEY: user_id,
+            JWT.PAYLOAD_USERNAME_KEY: token.get(JWT.PAYLOAD_USERNAME_KEY),
+        },
+        refresh_claims={
+            JWT.PAYLOAD_JTI_KEY: next_jti,
+            JWT.PAYLOAD_FINGERPRINT_KEY: fingerprint,
+        },
+    )
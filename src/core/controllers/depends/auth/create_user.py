@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 
 from fastapi import status
 
-from src.core.controllers.depends.utils.hash_password import hash_pwd
+from src.core.controllers.depends.utils.hash_password import hash_pwd_async
 from src.core.controllers.depends.utils.return_error import http_exception
 from src.core.settings.const import MessageError, TypeEncoding
 
@@ -44,7 +44,7 @@ async def create_user(
         )
 
     # TODO: HASH AND SOLT AND PAPER PASSWORD
-    password_hash = hash_pwd(password)
+    password_hash = await hash_pwd_async(password)
     new_user = dict(
         name=name,
         hashed_password=password_hash.decode(TypeEncoding.UTF8),
@@ -3,11 +3,17 @@
 from typing import TYPE_CHECKING, Annotated
 
 import pydantic
-from fastapi import Depends, Form, status
+from fastapi import Depends, Form, Request, status
 
 from src.core.controllers.depends.utils.connect_db import get_crud, get_session
-from src.core.controllers.depends.utils.hash_password import validate_pwd
+from src.core.controllers.depends.utils.hash_password import (
+    validate_pwd_async,
+)
 from src.core.controllers.depends.utils.jsonresponse_new_jwt import response
+from src.core.controllers.depends.utils.refresh_tokens import (
+    device_fingerprint,
+    new_jti,
+)
 from src.core.controllers.depends.utils.return_error import http_exception
 from src.core.settings.const import JWT, MessageError, TypeEncoding
 from src.core.validators import LoginUser
@@ -20,6 +26,7 @@ if TYPE_CHECKING:
 
 
 async def login_user_json(
+    request: Request,
     validate_user: LoginUser,
     crud: Annotated["Crud", Depends(get_crud)],
     session: Annotated["AsyncSession", Depends(get_session)],
@@ -40,12 +47,14 @@ async def login_user_json(
     return await login_user(
         username=validate_user.user_email,
         password=validate_user.password.decode(TypeEncoding.UTF8),
+        fingerprint=device_fingerprint(request),
         session=session,
         crud=crud,
     )
 
 
 async def login_user_form(
+    request: Request,
     username: Annotated[
         pydantic.EmailStr,
         Form(
@@ -78,13 +87,18 @@ async def login_user_form(
         Return new JWT access token and refresh token.
     """
     return await login_user(
-        username=username, password=password, session=session, crud=crud
+        username=username,
+        password=password,
+        fingerprint=device_fingerprint(request),
+        session=session,
+        crud=crud,
     )
 
 
 async def login_user(
     username: str,
     password: str,
+    fingerprint: str,
     crud: "Crud",
     session: "AsyncSession",
 ) -> "JSONResponse":
@@ -93,6 +107,7 @@ async def login_user(
     Args:
         username: str: user_email
         password: srt: secret
+        fingerprint: str: digest of the device fingerprint
         crud: Crud()
         session: AsyncSession
     Return:
@@ -100,7 +115,9 @@ async def login_user(
     Raises:
         HTTPException()
     Notes:
-        Return new JWT access token and refresh token.
+        Return new JWT access token and refresh token. User data is read
+        with one DB query, then the password is checked off the loop.
+        The refresh token replaces the previous one of the device.
     """
     user_data = await crud.auth_users.login_user(
         email=username, session=session
@@ -114,25 +131,40 @@ async def login_user(
             error_message=MessageError.MESSAGE_SERVER_ERROR,
         )
 
-    user_hash_pwd, user_id = user_data
+    user_hash_pwd, user_id, user_name = user_data
 
-    if user_hash_pwd and validate_pwd(
+    if user_hash_pwd and await validate_pwd_async(
         password=password,
         hash_password=user_hash_pwd.encode(TypeEncoding.UTF8),
     ):
         # TODO ADD LOGER DEBUG : successful login
 
-        user_profile = await crud.users.get_user(
-            id_user=user_id,
-            session=session,
-        )
-
         payload = {
-            JWT.PAYLOAD_SUB_KEY: str(user_profile.id),
-            JWT.PAYLOAD_USERNAME_KEY: user_profile.name,
+            JWT.PAYLOAD_SUB_KEY: str(user_id),
+            JWT.PAYLOAD_USERNAME_KEY: user_name,
         }
-
-        return response(payload=payload)
+        jti = new_jti()
+        saved = await crud.auth_users.save_refresh_token(
+            user_id=str(user_id),
+            fingerprint=fingerprint,
+            jti=jti,
+            session=session,
+        )
+        if saved is None:
+            # todo: add log info - fail save refresh token, error data from db
+            raise http_exception(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                error_type=MessageError.TYPE_ERROR_INTERNAL_SERVER_ERROR,
+                error_message=MessageError.MESSAGE_SERVER_ERROR,
+            )
+
+        return response(
+            payload=payload,
+            refresh_claims={
+                JWT.PAYLOAD_JTI_KEY: jti,
+                JWT.PAYLOAD_FINGERPRINT_KEY: fingerprint,
+            },
+        )
 
     # TODO ADD LOGER DEBUG : unsuccessful login
     raise http_exception(
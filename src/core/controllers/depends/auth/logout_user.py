@@ -0,0 +1,74 @@
+"""Depends for logout of users."""
+
+from typing import TYPE_CHECKING, Annotated
+
+from fastapi import Depends, Request, status
+from jwt.exceptions import InvalidTokenError
+
+from src.core.controllers.depends.auth.check_token import (
+    access_token_if_alive,
+    refresh_device,
+    refresh_token_is_alive,
+)
+from src.core.controllers.depends.utils.access_denylist import (
+    deny_access_token,
+)
+from src.core.controllers.depends.utils.connect_db import get_crud, get_session
+from src.core.controllers.depends.utils.refresh_tokens import (
+    revoke_device,
+    revoke_tokens,
+    token_ttl,
+)
+from src.core.controllers.depends.utils.return_error import http_exception
+from src.core.settings.const import JWT, Headers, MessageError
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.core.models_orm.crud import Crud
+
+
+async def logout_device(
+    request: Request,
+    access_token: Annotated[dict | None, Depends(access_token_if_alive)],
+    token: Annotated[dict, Depends(refresh_token_is_alive)],
+    crud: Annotated["Crud", Depends(get_crud)],
+    session: Annotated["AsyncSession", Depends(get_session)],
+) -> bool:
+    """End the session of the device.
+
+    Args:
+        - access_token (dict | None): Access token from the Bearer header,
+          None if it's missing or expired.
+        - token (dict): Refresh token from the cookie.
+    Raises:
+        HTTPException:
+            - status 401 if the token isn't a refresh token of the device.
+            - status 500 if the DB failed.
+    Notes:
+        The device's refresh token is deleted from DB and revoked in
+        Redis, a valid access token is denied until it expires. Every
+        worker rejects both at once. The access token is optional, so a
+        client whose access token expired can still end the session.
+    """
+    try:
+        user_id, jti, fingerprint = refresh_device(token, request)
+    except InvalidTokenError:
+        raise http_exception(headers=Headers.WWW_AUTH_BEARER)
+
+    if not await revoke_device(
+        user_id=user_id,
+        fingerprint=fingerprint,
+        crud=crud,
+        session=session,
+    ):
+        # todo: add log info - fail logout, error data from db
+        raise http_exception(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            error_type=MessageError.TYPE_ERROR_INTERNAL_SERVER_ERROR,
+            error_message=MessageError.MESSAGE_SERVER_ERROR,
+        )
+    await revoke_tokens([jti], ttl=token_ttl(token))
+    if access_token and (access_jti := access_token.get(JWT.PAYLOAD_JTI_KEY)):
+        await deny_access_token(access_jti, ttl=token_ttl(access_token))
+    return True
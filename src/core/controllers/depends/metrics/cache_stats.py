@@ -0,0 +1,130 @@
+"""Cache metrics and Redis keyspace stats."""
+
+import logging
+from collections import defaultdict
+from typing import TypedDict
+
+from redis import asyncio as aioredis
+from redis.asyncio.client import Redis
+from starlette.status import HTTP_503_SERVICE_UNAVAILABLE
+
+from src.core.controllers.depends.utils.cache_metrics import cache_metrics
+from src.core.controllers.depends.utils.redis_chash import (
+    get_local_cache,
+    redis_breaker,
+    setup_redis_bytes,
+)
+from src.core.controllers.depends.utils.return_error import http_exception
+from src.core.settings.const import MessageError, MetricsConf, TypeEncoding
+from src.core.validators import CacheKeyspace
+
+logger = logging.getLogger(__name__)
+
+
+class _PrefixStats(TypedDict):
+    prefix: str
+    keys: int
+    sampled: int
+    avg_bytes: int
+    estimated_bytes: int
+
+
+def keyspace_prefix(key: str) -> str:
+    """Return known prefix of the key, `other` if it has none."""
+    for prefix in MetricsConf.KEYSPACE_PREFIXES:
+        if key == prefix or key.startswith(
+            f"{prefix}{MetricsConf.KEYSPACE_SEPARATOR}"
+        ):
+            return prefix
+    return MetricsConf.KEYSPACE_OTHER
+
+
+async def get_cache_metrics() -> str:
+    """Return cache metrics of the worker in the Prometheus text format."""
+    gauges: dict[str, float] = {
+        MetricsConf.GAUGE_BREAKER_OPEN: int(redis_breaker.is_open)
+    }
+    local_cache = get_local_cache()
+    if local_cache is not None:
+        gauges[MetricsConf.GAUGE_LOCAL_ENTRIES] = len(local_cache)
+        gauges[MetricsConf.GAUGE_LOCAL_BYTES] = local_cache.size
+    return cache_metrics.render(gauges=gauges)
+
+
+async def get_cache_keyspace() -> CacheKeyspace:
+    """Return Redis memory by key prefix, estimated from samples.
+
+    Keys are counted with SCAN, up to `MetricsConf.SCAN_LIMIT` of them,
+    and `MetricsConf.SAMPLE_SIZE` keys per prefix are measured with
+    MEMORY USAGE in one pipeline.
+
+    Raises:
+        HTTPException: status 503 if Redis is unavailable.
+    """
+    redis_client: Redis = await setup_redis_bytes()
+    counts: defaultdict[str, int] = defaultdict(int)
+    samples: defaultdict[str, list[bytes]] = defaultdict(list)
+    scanned = 0
+    complete = False
+    try:
+        cursor = 0
+        while scanned < MetricsConf.SCAN_LIMIT:
+            cursor, keys = await redis_client.scan(
+                cursor=cursor, count=MetricsConf.SCAN_COUNT
+            )
+            for key in keys:
+                prefix = keyspace_prefix(
+                    key.decode(TypeEncoding.UTF8, errors="replace")
+                )
+                counts[prefix] += 1
+                if len(samples[prefix]) < MetricsConf.SAMPLE_SIZE:
+                    samples[prefix].append(key)
+            scanned += len(keys)
+            if cursor == 0:
+                complete = True
+                break
+
+        sampled = [
+            (prefix, key) for prefix, keys in samples.items() for key in keys
+        ]
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for _, key in sampled:
+                pipe.memory_usage(key)
+            pipe.info("memory")
+            *usages, memory = await pipe.execute()
+    except aioredis.RedisError as e:
+        logger.error("cache keyspace stats failed: %s", e)
+        raise http_exception(
+            status_code=HTTP_503_SERVICE_UNAVAILABLE,
+            error_type=MessageError.TYPE_ERROR_INTERNAL_SERVER_ERROR,
+            error_message=MessageError.MESSAGE_SERVER_ERROR,
+        )
+
+    measured: defaultdict[str, list[int]] = defaultdict(list)
+    for (prefix, _), usage in zip(sampled, usages):
+        if usage is not None:
+            # Key may expire between SCAN and MEMORY USAGE.
+            measured[prefix].append(usage)
+
+    prefixes: list[_PrefixStats] = []
+    for prefix, count in counts.items():
+        sizes = measured[prefix]
+        avg_bytes = sum(sizes) // len(sizes) if sizes else 0
+        prefixes.append(
+            {
+                "prefix": prefix,
+                "keys": count,
+                "sampled": len(sizes),
+                "avg_bytes": avg_bytes,
+                "estimated_bytes": avg_bytes * count,
+            }
+        )
+    prefixes.sort(key=lambda item: item["estimated_bytes"], reverse=True)
+
+    return CacheKeyspace(
+        used_memory=memory.get("used_memory", 0),
+        maxmemory=memory.get("maxmemory", 0),
+        scanned_keys=scanned,
+        complete=complete,
+        prefixes=prefixes,
+    )
@@ -11,8 +11,9 @@ from src.core.controllers.depends.auth.check_token import (
     get_user_id_by_token_access,
 )
 from src.core.controllers.depends.utils.connect_db import get_crud, get_session
+from src.core.controllers.depends.utils.redis_chash import bump_generations
 from src.core.controllers.depends.utils.return_error import http_exception
-from src.core.settings.const import MessageError
+from src.core.settings.const import CacheConf, MessageError
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -36,4 +37,5 @@ async def del_tweet(
             error_type=MessageError.TYPE_ERROR_INTERNAL_SERVER_ERROR,
             error_message=MessageError.MESSAGE_SERVER_ERROR,
         )
+    await bump_generations(CacheConf.NAMESPACE_FEED)
     return True
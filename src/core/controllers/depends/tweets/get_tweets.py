@@ -1,62 +1,186 @@
 """Return tweets."""
 
-from typing import TYPE_CHECKING, Annotated
+import json
+import logging
+from typing import TYPE_CHECKING, Annotated, AsyncIterator, Sequence
 
-from fastapi import Depends, Header, Request, Response
+from fastapi import Depends, Header, Query, Request, Response
+from sqlalchemy.exc import SQLAlchemyError
 from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
 
-from src.core.controllers.depends.utils.connect_db import get_crud, get_session
+from src.core.controllers.depends.auth.check_token import (
+    get_user_id_by_token_access,
+)
+from src.core.controllers.depends.utils.connect_db import (
+    get_crud,
+    get_db_manager,
+    get_session,
+)
+from src.core.controllers.depends.utils.pagination import (
+    decode_cursor,
+    decode_rank_cursor,
+    encode_cursor,
+    encode_rank_cursor,
+)
 from src.core.controllers.depends.utils.redis_chash import cache_get_response
+from src.core.controllers.depends.utils.redis_timeline import (
+    fill_timeline,
+    filter_celebrities,
+    get_timeline,
+)
 from src.core.controllers.depends.utils.return_error import (
     http_exception,
     raise_http_500_if_none,
 )
-from src.core.settings.const import CacheConf, MessageError
-from src.core.validators import GetAllTweets, Like, User
+from src.core.settings.const import (
+    CacheConf,
+    MessageError,
+    MimeTypes,
+    PaginationConf,
+    TypeEncoding,
+)
+from src.core.settings.settings import settings
+from src.core.validators import GetAllTweets, Like, Tweet, User
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from src.core.models_orm.crud import Crud
+    from src.core.models_orm.engine_conf import ManagerDB
+    from src.core.models_orm.models.tweet_orm import TweetsORM
+
+logger = logging.getLogger(__name__)
+
+
+def serialize_tweet(
+    tweet: "TweetsORM", liked_ids: set[str] | None = None
+) -> "Tweet":
+    """Return Tweet built from ORM tweet with loaded relations.
+
+    `liked_by_me` is set only if the viewer's liked ids are given.
+    """
+    return Tweet(
+        id=str(tweet.id),
+        content=tweet.content,
+        attachments=tweet.attachments,
+        author=User(
+            id=str(tweet.owner.id),
+            name=tweet.owner.name,
+        ),
+        like_count=tweet.like_count,
+        likes=[
+            Like(
+                user_id=like.user.id,
+                name=like.user.name,
+            )
+            for like in tweet.likes
+            if like
+        ],
+        liked_by_me=None if liked_ids is None else str(tweet.id) in liked_ids,
+    )
+
+
+def serialize_tweets(
+    tweets: Sequence["TweetsORM"],
+    next_cursor: str | None,
+    liked_ids: set[str] | None = None,
+) -> "GetAllTweets":
+    """Return GetAllTweets built from ORM tweets with loaded relations."""
+    return GetAllTweets(
+        next_cursor=next_cursor,
+        tweets=[
+            serialize_tweet(tweet, liked_ids=liked_ids)
+            for tweet in tweets
+            if tweet
+        ],
+    )
+
+
+async def get_liked_ids(
+    id_user: str,
+    tweets: Sequence["TweetsORM"],
+    session: "AsyncSession",
+    crud: "Crud",
+) -> set[str]:
+    """Return ids of the page's tweets liked by the viewer."""
+    liked_ids = await crud.tweets.get_liked_tweet_ids(
+        session=session,
+        id_user=id_user,
+        ids=[str(tweet.id) for tweet in tweets],
+    )
+    raise_http_500_if_none(is_none_result=liked_ids)
+    return liked_ids
 
 
 @cache_get_response(
     expire=CacheConf.CACHE_EXPIRATION_TIME_GET_TWEETS,
     prefix_key=CacheConf.PREFIX_GET_TWEETS,
+    namespaces=lambda **_: [CacheConf.NAMESPACE_FEED],
+    stale_ttl=CacheConf.STALE_TTL_GET_TWEETS,
 )
 async def get_tweets_data(
     session: Annotated["AsyncSession", Depends(get_session)],
     crud: Annotated["Crud", Depends(get_crud)],
     request: Request,
     response: Response,
+    limit: int = Query(
+        default=PaginationConf.DEFAULT_LIMIT,
+        ge=PaginationConf.MIN_LIMIT,
+        le=PaginationConf.MAX_LIMIT,
+        description=PaginationConf.LIMIT_DESCRIPTION,
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description=PaginationConf.CURSOR_DESCRIPTION,
+    ),
     if_none_match: str | None = Header(default=None),
-) -> "GetAllTweets":
+) -> "Response | GetAllTweets":
     """
-    Retrieve and return all tweets.
+    Retrieve and return a page of tweets.
 
-    This function fetches tweets from the database, validates the response,
-    and returns a list of tweets along with their authors and likes.
+    This function fetches a page of tweets from the database, newest first,
+    validates the response, and returns a list of tweets along with their
+    authors and likes.
 
     Args:
         session (AsyncSession): Database session used for querying.
         crud (Crud): CRUD instance for handling tweet operations.
         request (Request): HTTP request object for cache handling.
         response (Response): HTTP response object to set cache headers.
+        limit (int): Max number of tweets on the page.
+        cursor (str | None): Opaque cursor from the previous page.
         if_none_match (str | None): Optional ETag header for cache validation.
 
     Returns:
         GetAllTweets: Pydantic model representing the list of tweets with authors
-        and likes.
+        and likes, plus `next_cursor` if there is a next page.
+        Response: The same JSON body if `SQL_JSON_FEED` is on.
 
     Raises:
-        HTTPException: If no tweets are found or there's an internal server error.
+        HTTPException: If the cursor is malformed or there's an internal server error.
 
     Notes:
         The function uses caching to reduce load on the database and improve
-        performance. The sleep of 3 seconds is used for testing purposes.
+        performance. The cache key includes `limit` and `cursor`, entries
+        are invalidated by writes to tweets and likes. An expired page is
+        served for `STALE_TTL_GET_TWEETS` more seconds while it's refreshed.
+        One extra row is requested to know whether a next page exists.
+        If `SQL_JSON_FEED` is on, the payload is built by PostgreSQL, see
+        `get_tweets_json_response`.
     """  # noqa E501
 
-    tweets = await crud.tweets.get_tweets(session=session)
+    if settings.db.SQL_JSON_FEED:
+        return await get_tweets_json_response(
+            session=session, crud=crud, limit=limit, cursor=cursor
+        )
+
+    tweets = await crud.tweets.get_tweets(
+        session=session,
+        limit=limit + 1,
+        cursor=decode_cursor(cursor) if cursor else None,
+    )
     raise_http_500_if_none(is_none_result=tweets)
 
     if not tweets:
@@ -68,26 +192,323 @@ async def get_tweets_data(
             error_type=MessageError.TYPE_ERROR_500,
         )
 
-    return GetAllTweets(
-        tweets=[
-            dict(
-                id=str(tweet.id),
-                content=tweet.content,
-                attachments=tweet.attachments,
-                author=User(
-                    id=str(tweet.owner.id),
-                    name=tweet.owner.name,
-                ),
-                likes=[
-                    Like(
-                        user_id=like.user.id,
-                        name=like.user.name,
-                    )
-                    for like in tweet.likes
-                    if like
-                ],
-            )
-            for tweet in tweets
-            if tweet
-        ]
+    next_cursor = None
+    if len(tweets) > limit:
+        tweets = tweets[:limit]
+        next_cursor = encode_cursor(
+            created_at=tweets[-1].created_at, id_row=str(tweets[-1].id)
+        )
+
+    return serialize_tweets(tweets=tweets, next_cursor=next_cursor)
+
+
+async def get_tweets_json_response(
+    session: "AsyncSession",
+    crud: "Crud",
+    limit: int,
+    cursor: str | None,
+) -> Response:
+    """
+    Return a page of tweets with the JSON body built by PostgreSQL.
+
+    The JSON array of tweets is returned by one query and is passed to the
+    client as is, without ORM entities and pydantic models. Only the
+    envelope (`result`, `next_cursor`) is added here.
+
+    Args:
+        session (AsyncSession): Database session used for querying.
+        crud (Crud): CRUD instance for handling tweet operations.
+        limit (int): Max number of tweets on the page.
+        cursor (str | None): Opaque cursor from the previous page.
+
+    Returns:
+        Response: `GetAllTweets` JSON body.
+    """
+    page = await crud.tweets.get_tweets_json(
+        session=session,
+        limit=limit,
+        cursor=decode_cursor(cursor) if cursor else None,
+    )
+    raise_http_500_if_none(is_none_result=page)
+    tweets_json, selected, last_created_at, last_id = page
+
+    next_cursor = None
+    if selected > limit:
+        next_cursor = encode_cursor(created_at=last_created_at, id_row=last_id)
+
+    body = "".join(
+        (
+            '{"result":true,"tweets":',
+            tweets_json,
+            ',"next_cursor":',
+            json.dumps(next_cursor),
+            "}",
+        )
+    )
+    return Response(
+        content=body.encode(TypeEncoding.UTF8),
+        media_type=MimeTypes.APPLICATION_JSON,
+    )
+
+
+async def get_tweets_stream(
+    engine: Annotated["ManagerDB", Depends(get_db_manager)],
+    crud: Annotated["Crud", Depends(get_crud)],
+    limit: int = Query(
+        default=PaginationConf.STREAM_MAX_LIMIT,
+        ge=PaginationConf.MIN_LIMIT,
+        le=PaginationConf.STREAM_MAX_LIMIT,
+        description=PaginationConf.STREAM_LIMIT_DESCRIPTION,
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description=PaginationConf.CURSOR_DESCRIPTION,
+    ),
+) -> AsyncIterator[bytes]:
+    """
+    Return tweets, newest first, as chunks of a `GetAllTweets` JSON body.
+
+    Args:
+        engine (ManagerDB): DB manager, the stream opens its own session.
+        crud (Crud): CRUD instance for handling tweet operations.
+        limit (int): Max number of tweets, `next_cursor` is set if there
+            are more.
+        cursor (str | None): Opaque cursor of the last received tweet.
+
+    Returns:
+        AsyncIterator[bytes]: JSON body chunks, one per tweet.
+
+    Notes:
+        Rows are read from a server-side cursor in batches and each batch
+        is expunged from the session once written, so memory doesn't grow
+        with the result size. The request session is closed before the
+        body is sent, hence the dedicated one. The status is sent before
+        the rows are read, so if the DB fails mid-stream the error is
+        logged and the response is aborted, the client gets an incomplete
+        body instead of a valid short one.
+    """
+    start = decode_cursor(cursor) if cursor else None
+
+    async def _stream() -> AsyncIterator[bytes]:
+        async with engine.get_scoped_session() as session:
+            yield b'{"result":true,"tweets":['
+            separator, sent, last, has_next = b"", 0, None, False
+            try:
+                async for tweets in crud.tweets.stream_tweets(
+                    session=session, cursor=start, limit=limit + 1
+                ):
+                    for tweet in tweets:
+                        if sent == limit:
+                            has_next = True
+                            break
+                        yield separator + serialize_tweet(
+                            tweet
+                        ).model_dump_json().encode(TypeEncoding.UTF8)
+                        separator, sent, last = b",", sent + 1, tweet
+                    session.expunge_all()
+            except SQLAlchemyError:
+                logger.exception("tweets export failed after %d tweets", sent)
+                raise
+            next_cursor = None
+            if has_next and last is not None:
+                next_cursor = encode_cursor(
+                    created_at=last.created_at, id_row=str(last.id)
+                )
+            yield b'],"next_cursor":' + json.dumps(next_cursor).encode(
+                TypeEncoding.UTF8
+            ) + b"}"
+
+    return _stream()
+
+
+async def get_home_tweets_data(
+    id_user: Annotated[str, Depends(get_user_id_by_token_access)],
+    session: Annotated["AsyncSession", Depends(get_session)],
+    crud: Annotated["Crud", Depends(get_crud)],
+    limit: int = Query(
+        default=PaginationConf.DEFAULT_LIMIT,
+        ge=PaginationConf.MIN_LIMIT,
+        le=PaginationConf.MAX_LIMIT,
+        description=PaginationConf.LIMIT_DESCRIPTION,
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description=PaginationConf.CURSOR_DESCRIPTION,
+    ),
+) -> "GetAllTweets":
+    """
+    Retrieve and return a page of the user's home timeline.
+
+    Args:
+        id_user (str): User ID retrieved from the access token.
+        session (AsyncSession): Database session used for querying.
+        crud (Crud): CRUD instance for handling tweet operations.
+        limit (int): Max number of tweets on the page.
+        cursor (str | None): Opaque cursor from the previous page.
+
+    Returns:
+        GetAllTweets: Tweets of followed users, most popular first, plus
+        `next_cursor` if there is a next page.
+
+    Raises:
+        HTTPException: If the cursor is malformed or there's an internal
+        server error.
+
+    Notes:
+        The timeline is personal, so it isn't stored in the shared cache.
+        `liked_by_me` is computed for the page by one lookup of the
+        viewer's likes, other users' likes aren't loaded for it.
+        Scores are rewritten by the scoring job, a scroll across its run
+        may skip or repeat a tweet whose score crossed the cursor.
+        If `REDIS_TIMELINE_FAN_OUT` is on, the timeline is read from Redis
+        and ordered by time instead, see `get_materialized_home_tweets`.
+    """
+    if settings.redis.REDIS_TIMELINE_FAN_OUT:
+        return await get_materialized_home_tweets(
+            id_user=id_user,
+            session=session,
+            crud=crud,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    rows = await crud.tweets.get_home_tweets(
+        session=session,
+        id_user=id_user,
+        limit=limit + 1,
+        cursor=decode_rank_cursor(cursor) if cursor else None,
+    )
+    raise_http_500_if_none(is_none_result=rows)
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_tweet, last_score = rows[-1]
+        next_cursor = encode_rank_cursor(
+            rank=last_score,
+            created_at=last_tweet.created_at,
+            id_row=str(last_tweet.id),
+        )
+
+    tweets = [tweet for tweet, _ in rows]
+    return serialize_tweets(
+        tweets=tweets,
+        next_cursor=next_cursor,
+        liked_ids=await get_liked_ids(
+            id_user=id_user, tweets=tweets, session=session, crud=crud
+        ),
+    )
+
+
+async def get_materialized_home_tweets(
+    id_user: str,
+    session: "AsyncSession",
+    crud: "Crud",
+    limit: int,
+    cursor: str | None,
+) -> "GetAllTweets":
+    """
+    Return page of the home timeline materialized in Redis, newest first.
+
+    Tweet ids are read from the user's ZSET and hydrated in one batch,
+    tweets of followed celebrities are read from DB and merged in. If the
+    ZSET doesn't exist yet, it is rebuilt from the followed users' tweets.
+    If Redis is unavailable, tweets of all followed users are read from DB
+    in the same order, so the cursor stays valid.
+
+    Args:
+        id_user (str): User ID retrieved from the access token.
+        session (AsyncSession): Database session used for querying.
+        crud (Crud): CRUD instance for handling tweet operations.
+        limit (int): Max number of tweets on the page.
+        cursor (str | None): Opaque cursor from the previous page.
+
+    Returns:
+        GetAllTweets: Tweets of followed users plus `next_cursor`.
+
+    Notes:
+        Deleted tweets and tweets of unfollowed users stay in the ZSETs
+        until they are trimmed, they are skipped on hydrate.
+    """
+    before = decode_cursor(cursor) if cursor else None
+
+    followed_ids = await crud.users.get_followed_ids(
+        id_user=id_user, session=session
+    )
+    raise_http_500_if_none(is_none_result=followed_ids)
+    celebrities = await filter_celebrities(authors_ids=followed_ids)
+
+    timeline: list[tuple[str, "datetime"]] | None = []
+    if celebrities is None:
+        # Redis is unavailable: all followed users are read from DB.
+        celebrities = followed_ids
+    else:
+        timeline = await get_timeline(
+            id_user=id_user, limit=limit + 1, before=before
+        )
+    if timeline is None:
+        regular_ids = set(followed_ids).difference(celebrities)
+        timeline = await crud.tweets.get_authors_tweet_keys(
+            session=session,
+            authors_ids=list(regular_ids),
+            limit=settings.redis.REDIS_TIMELINE_MAX_LEN,
+        )
+        raise_http_500_if_none(is_none_result=timeline)
+        await fill_timeline(id_user=id_user, tweets=timeline)
+        timeline = [
+            (id_tweet, created_at)
+            for id_tweet, created_at in timeline
+            if before is None or (created_at, id_tweet) < before
+        ][: limit + 1]
+
+    timeline_tweets = await crud.tweets.get_tweets_by_ids(
+        session=session, ids=[id_tweet for id_tweet, _ in timeline]
+    )
+    celebrities_tweets = await crud.tweets.get_authors_tweets(
+        session=session,
+        authors_ids=celebrities,
+        limit=limit + 1,
+        cursor=before,
+    )
+    raise_http_500_if_none(is_none_result=timeline_tweets)
+    raise_http_500_if_none(is_none_result=celebrities_tweets)
+
+    followed = set(followed_ids)
+    hydrated = {
+        str(tweet.id): tweet
+        for tweet in timeline_tweets
+        if str(tweet.author) in followed
+    }
+    merged = {
+        str(tweet.id): (tweet.created_at, tweet)
+        for tweet in celebrities_tweets
+    }
+    for id_tweet, created_at in timeline:
+        if tweet := hydrated.get(id_tweet):
+            merged.setdefault(id_tweet, (created_at, tweet))
+
+    page = sorted(
+        merged.items(),
+        key=lambda item: (item[1][0], item[0]),
+        reverse=True,
+    )
+    has_next = (
+        len(page) > limit
+        or len(timeline) > limit
+        or len(celebrities_tweets) > limit
+    )
+    page = page[:limit]
+
+    next_cursor = None
+    if has_next and page:
+        id_last, (created_at_last, _) = page[-1]
+        next_cursor = encode_cursor(created_at=created_at_last, id_row=id_last)
+
+    tweets = [tweet for _, (_, tweet) in page]
+    return serialize_tweets(
+        tweets=tweets,
+        next_cursor=next_cursor,
+        liked_ids=await get_liked_ids(
+            id_user=id_user, tweets=tweets, session=session, crud=crud
+        ),
     )
@@ -1,21 +1,29 @@
-"""Create/Delete like for tweets.
+"""Create/Delete/Get likes of tweets.
 
 /api/tweets/{id}/like
+/api/tweets/{id}/likes
 """
 
 from typing import TYPE_CHECKING, Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Query
 
 from src.core.controllers.depends.auth.check_token import (
     get_user_id_by_token_access,
 )
 from src.core.controllers.depends.utils.connect_db import get_crud, get_session
+from src.core.controllers.depends.utils.pagination import (
+    decode_id_cursor,
+    encode_id_cursor,
+)
+from src.core.controllers.depends.utils.redis_chash import bump_generations
 from src.core.controllers.depends.utils.return_error import (
     raise_http_404,
     raise_http_500_if_none,
     valid_id_or_error_422,
 )
+from src.core.settings.const import CacheConf, LikesConf, PaginationConf
+from src.core.validators import GetLikes, Like
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -36,8 +44,11 @@ async def post_like(
         session=session, id_user=id_user, id_tweet=id
     )
     raise_http_500_if_none(is_none_result=like_result)
+    if not like_result:
+        raise_http_404()
 
-    return True if like_result else raise_http_404()
+    await bump_generations(CacheConf.NAMESPACE_FEED)
+    return True
 
 
 async def delete_like(
@@ -55,4 +66,44 @@ async def delete_like(
 
     raise_http_500_if_none(is_none_result=like_result)
 
+    await bump_generations(CacheConf.NAMESPACE_FEED)
     return True
+
+
+async def get_likes(
+    id: str,  # noqa
+    session: Annotated["AsyncSession", Depends(get_session)],
+    crud: Annotated["Crud", Depends(get_crud)],
+    limit: int = Query(
+        default=PaginationConf.DEFAULT_LIMIT,
+        ge=PaginationConf.MIN_LIMIT,
+        le=PaginationConf.MAX_LIMIT,
+        description=LikesConf.LIMIT_DESCRIPTION,
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description=PaginationConf.CURSOR_DESCRIPTION,
+    ),
+) -> "GetLikes":
+    """Return page of the tweet's likes, newest first."""
+    valid_id_or_error_422(request_id=id)
+
+    likes = await crud.tweets.get_tweet_likes(
+        session=session,
+        id_tweet=id,
+        limit=limit + 1,
+        cursor=decode_id_cursor(cursor) if cursor else None,
+    )
+    raise_http_500_if_none(is_none_result=likes)
+    if likes is False:
+        raise_http_404()
+
+    next_cursor = None
+    if len(likes) > limit:
+        likes = likes[:limit]
+        next_cursor = encode_id_cursor(id_row=likes[-1].like_id)
+
+    return GetLikes(
+        likes=[Like(user_id=user_id, name=name) for _, user_id, name in likes],
+        next_cursor=next_cursor,
+    )
@@ -1,38 +1,82 @@
 """Post new tweet."""
 
+import uuid
 from typing import TYPE_CHECKING, Annotated
 
-from fastapi import Depends, status
+from fastapi import BackgroundTasks, Depends, status
 
 from src.core.controllers.depends.auth.check_token import (
     get_user_id_by_token_access,
 )
 from src.core.controllers.depends.utils.connect_db import get_crud, get_session
+from src.core.controllers.depends.utils.redis_chash import bump_generations
+from src.core.controllers.depends.utils.redis_timeline import (
+    fan_out_tweet,
+    mark_celebrity,
+)
 from src.core.controllers.depends.utils.return_error import http_exception
-from src.core.settings.const import MessageError
+from src.core.settings.const import CacheConf, MessageError
+from src.core.settings.settings import settings
 from src.core.validators import PostNewTweet, ReturnNewTweet
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from src.core.models_orm.crud import Crud
 
 
+async def push_to_timelines(
+    id_user: str,
+    tweet_id: str,
+    created_at: "datetime",
+    background_tasks: BackgroundTasks,
+    session: "AsyncSession",
+    crud: "Crud",
+) -> None:
+    """Fan out new tweet to the subscribers' timelines.
+
+    Subscribers are read in the request, the Redis pipeline is sent in
+    background after the response. Authors with too many subscribers are
+    marked as celebrities instead. The tweet is scored by its `created_at`
+    in DB, so it's ordered as in the rebuilt timelines.
+    """
+    follower_ids = await crud.users.get_follower_ids(
+        id_user=id_user, session=session
+    )
+    if not follower_ids:
+        # todo: add logger info fail get followers from db
+        return
+
+    if len(follower_ids) > settings.redis.REDIS_TIMELINE_CELEBRITY_FOLLOWERS:
+        await mark_celebrity(id_author=id_user)
+        return
+
+    background_tasks.add_task(
+        fan_out_tweet,
+        id_tweet=str(uuid.UUID(tweet_id)),
+        created_at=created_at,
+        follower_ids=follower_ids,
+    )
+
+
 async def tweet_data(
     id_user: Annotated[str, Depends(get_user_id_by_token_access)],
     tweet: PostNewTweet,
     session: Annotated["AsyncSession", Depends(get_session)],
     crud: Annotated["Crud", Depends(get_crud)],
+    background_tasks: BackgroundTasks,
 ) -> "ReturnNewTweet":
     """Return tweets."""
-    tweet_id = await crud.tweets.post_tweet(
+    new_tweet = await crud.tweets.post_tweet(
         user_id=id_user,
         session=session,
         content_test=tweet.tweet_data,
         content_media_ids=tweet.tweet_media_ids,
     )
 
-    if tweet_id is None:
+    if new_tweet is None:
         # todo: add logger info fail get tweets data from db
         raise http_exception(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -40,4 +84,17 @@ async def tweet_data(
             error_message=MessageError.MESSAGE_SERVER_ERROR,
         )
 
+    tweet_id, created_at = new_tweet
+    await bump_generations(CacheConf.NAMESPACE_FEED)
+
+    if settings.redis.REDIS_TIMELINE_FAN_OUT:
+        await push_to_timelines(
+            id_user=id_user,
+            tweet_id=tweet_id,
+            created_at=created_at,
+            background_tasks=background_tasks,
+            session=session,
+            crud=crud,
+        )
+
     return ReturnNewTweet(tweet_id=tweet_id)
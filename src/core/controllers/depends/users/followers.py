@@ -13,12 +13,18 @@ from src.core.controllers.depends.auth.check_token import (
     get_user_id_by_token_access,
 )
 from src.core.controllers.depends.utils.connect_db import get_crud, get_session
+from src.core.controllers.depends.utils.redis_chash import (
+    bump_generations,
+    user_namespace,
+)
+from src.core.controllers.depends.utils.redis_timeline import drop_timeline
 from src.core.controllers.depends.utils.return_error import (
     raise_http_404,
     raise_http_500_if_none,
     valid_id_or_error_422,
 )
 from src.core.settings.const import MessageError
+from src.core.settings.settings import settings
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -44,14 +50,22 @@ async def post_follow(
         bool: True if successful or raise HTTPException.
     Raises:
         HTTPException: if db return None.
+    Notes:
+        The owner's materialized timeline is dropped, it's rebuilt with
+        the new followed users on next read.
     """
     valid_id_or_error_422(request_id=id)
     is_follow: Optional[bool] = await crud.users.post_user_follow(
         followed_id=followed_id, follower_id=id, session=session
     )
     raise_http_500_if_none(is_follow)
+    if not is_follow:
+        raise_http_404()
 
-    return True if is_follow else raise_http_404()
+    await bump_generations(user_namespace(followed_id), user_namespace(id))
+    if settings.redis.REDIS_TIMELINE_FAN_OUT:
+        await drop_timeline(id_user=followed_id)
+    return True
 
 
 async def del_follow(
@@ -72,6 +86,9 @@ async def del_follow(
         bool: True if successful or raise HTTPException.
     Raises:
         HTTPException: if db return None.
+    Notes:
+        The owner's materialized timeline is dropped, it's rebuilt with
+        the new followed users on next read.
     """
     valid_id_or_error_422(request_id=id)
 
@@ -80,4 +97,7 @@ async def del_follow(
     )
     raise_http_500_if_none(is_follow)
 
+    await bump_generations(user_namespace(followed_id), user_namespace(id))
+    if settings.redis.REDIS_TIMELINE_FAN_OUT:
+        await drop_timeline(id_user=followed_id)
     return True
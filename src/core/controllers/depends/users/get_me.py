@@ -9,7 +9,10 @@ from src.core.controllers.depends.auth.check_token import (
     get_user_id_by_token_access,
 )
 from src.core.controllers.depends.utils.connect_db import get_crud, get_session
-from src.core.controllers.depends.utils.redis_chash import cache_get_response
+from src.core.controllers.depends.utils.redis_chash import (
+    cache_get_response,
+    user_namespace,
+)
 from src.core.controllers.depends.utils.return_error import http_exception
 from src.core.controllers.depends.utils.serialize_user import serialize_user
 from src.core.settings.const import CacheConf, MessageError
@@ -24,6 +27,7 @@ if TYPE_CHECKING:
 @cache_get_response(
     expire=CacheConf.CACHE_EXPIRATION_TIME_GET_USER,
     prefix_key=CacheConf.PREFIX_USER_ME,
+    namespaces=lambda id_user, **_: [user_namespace(id_user)],
 )
 async def get_me(
     id_user: Annotated[str, Depends(get_user_id_by_token_access)],
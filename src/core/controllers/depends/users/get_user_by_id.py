@@ -15,7 +15,10 @@ if TYPE_CHECKING:
 
 from fastapi import Header, Request, Response, status
 
-from src.core.controllers.depends.utils.redis_chash import cache_get_response
+from src.core.controllers.depends.utils.redis_chash import (
+    cache_get_response,
+    user_namespace,
+)
 from src.core.controllers.depends.utils.return_error import http_exception
 from src.core.settings.const import CacheConf, MessageError
 
@@ -23,6 +26,7 @@ from src.core.settings.const import CacheConf, MessageError
 @cache_get_response(
     expire=CacheConf.CACHE_EXPIRATION_TIME_GET_USER,
     prefix_key=CacheConf.PREFIX_USER_BY_ID,
+    namespaces=lambda id, **_: [user_namespace(id)],  # noqa
 )
 async def get_user_by_id(
     id: str,  # noqa
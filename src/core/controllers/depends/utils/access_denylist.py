@@ -0,0 +1,135 @@
+"""
+Denylist of access tokens revoked by logout.
+
+The `jti` of a revoked access token is kept in Redis until the token
+expires. Every worker mirrors the denylist in a bloom filter, kept in
+sync by pub/sub, so the check of a request is done in memory. Only a
+filter hit, true or false positive, is confirmed by Redis. The filter
+is rebuilt from Redis on every (re)subscribe, as messages may be lost
+meanwhile, and once per access token lifetime to drop expired tokens.
+
+Functions:
+    denied_key(jti): Redis key of a denied access token.
+    new_denylist_filter(): Empty bloom filter of the denylist.
+    deny_access_token(jti, ttl): Deny the token in every worker.
+    is_access_denied(jti): Check whether the token is denied.
+    load_access_denylist(redis_client): Rebuild the filter from Redis.
+    listen_access_denylist(): Add tokens denied by any worker to the filter.
+
+"""  # noqa E501
+
+import asyncio
+import datetime
+import logging
+import time
+
+from redis import asyncio as aioredis
+from redis.asyncio.client import Redis
+
+from src.core.controllers.depends.utils.bloom_filter import BloomFilter
+from src.core.controllers.depends.utils.redis_chash import setup_redis
+from src.core.settings.const import DenylistConf
+from src.core.settings.settings import settings
+
+logger = logging.getLogger(__name__)
+
+REBUILD_INTERVAL = datetime.timedelta(
+    minutes=settings.jwt.access_token_expire_minutes
+).total_seconds()
+
+
+def denied_key(jti: str) -> str:
+    """Return Redis key of a denied access token."""
+    return f"{DenylistConf.PREFIX}:{jti}"
+
+
+def new_denylist_filter() -> BloomFilter:
+    """Return empty bloom filter of the denylist."""
+    return BloomFilter(
+        capacity=DenylistConf.CAPACITY, error_rate=DenylistConf.ERROR_RATE
+    )
+
+
+_denied = new_denylist_filter()
+
+
+async def deny_access_token(jti: str, ttl: int) -> bool:
+    """Deny the access token for `ttl` seconds in every worker.
+
+    Returns:
+        bool: False if Redis failed, the token is denied only by this
+            worker then.
+    """
+    _denied.add(jti)
+    redis_client: Redis = await setup_redis()
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.set(denied_key(jti), 1, ex=ttl)
+            pipe.publish(DenylistConf.CHANNEL, jti)
+            await pipe.execute()
+    except aioredis.RedisError as e:
+        logger.error(
+            "deny of access token failed, denied by this worker only: %s", e
+        )
+        return False
+    return True
+
+
+async def is_access_denied(jti: str) -> bool:
+    """Return whether the access token is denied.
+
+    Tokens absent from the filter are allowed without a round trip. A hit
+    is confirmed by Redis, if Redis fails the token is denied.
+    """
+    if jti not in _denied:
+        return False
+    redis_client: Redis = await setup_redis()
+    try:
+        return bool(await redis_client.exists(denied_key(jti)))
+    except aioredis.RedisError as e:
+        logger.error("denylist check failed, token is denied: %s", e)
+        return True
+
+
+async def load_access_denylist(redis_client: Redis) -> None:
+    """Rebuild the filter from the denied tokens in Redis."""
+    denied = new_denylist_filter()
+    prefix_length = len(DenylistConf.PREFIX) + 1
+    async for key in redis_client.scan_iter(
+        match=denied_key("*"), count=DenylistConf.SCAN_COUNT
+    ):
+        denied.add(key[prefix_length:])
+    global _denied
+    _denied = denied
+
+
+async def listen_access_denylist() -> None:
+    """Add access tokens denied by any worker to the filter.
+
+    Runs for the app lifetime. The filter is rebuilt after subscribing,
+    so tokens denied meanwhile are buffered by the subscription.
+    """
+    redis_client: Redis = await setup_redis()
+    while True:
+        try:
+            async with redis_client.pubsub() as pubsub:
+                await pubsub.subscribe(DenylistConf.CHANNEL)
+                await load_access_denylist(redis_client)
+                rebuilt_at = time.monotonic()
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True,
+                        timeout=DenylistConf.LISTEN_TIMEOUT,
+                    )
+                    if message is not None:
+                        _denied.add(message["data"])
+                    if time.monotonic() - rebuilt_at >= REBUILD_INTERVAL:
+                        await load_access_denylist(redis_client)
+                        rebuilt_at = time.monotonic()
+        except aioredis.RedisError as e:
+            logger.error(
+                "denylist subscription lost, tokens denied meanwhile may be"
+                " allowed until the rebuild: %s",
+                e,
+            )
+            await asyncio.sleep(DenylistConf.RECONNECT_DELAY)
@@ -0,0 +1,54 @@
+"""Bloom filter of strings.
+
+A set that answers "maybe present" or "surely absent" in constant time
+and fixed memory. False positives happen at about `error_rate` when the
+filter holds `capacity` items, false negatives never do.
+"""
+
+import hashlib
+import math
+
+from src.core.settings.const import TypeEncoding
+
+
+class BloomFilter:
+    """Bloom filter sized for `capacity` items at `error_rate`.
+
+    Notes:
+        Items can't be removed, build a new filter to drop them.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        """Init empty filter."""
+        self.size = max(
+            int(-capacity * math.log(error_rate) / math.log(2) ** 2), 8
+        )
+        self.hashes = max(round(self.size / capacity * math.log(2)), 1)
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def __len__(self) -> int:
+        """Return number of added items, repeats included."""
+        return self.count
+
+    def __contains__(self, item: str) -> bool:
+        """Return False if item was surely never added."""
+        return all(
+            self._bits[index >> 3] & (1 << (index & 7))
+            for index in self._indexes(item)
+        )
+
+    def add(self, item: str) -> None:
+        """Add item."""
+        for index in self._indexes(item):
+            self._bits[index >> 3] |= 1 << (index & 7)
+        self.count += 1
+
+    def _indexes(self, item: str) -> list[int]:
+        # Double hashing: k indexes from two halves of one digest.
+        digest = hashlib.blake2b(
+            item.encode(TypeEncoding.UTF8), digest_size=16
+        ).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hashes)]
@@ -0,0 +1,108 @@
+"""In-process metrics of the response cache.
+
+Counters of cache outcomes, Redis latency histograms and sizes of stored
+values, per cache prefix. They are rendered in the Prometheus text
+format. Every worker process keeps its own metrics, the `pid` label
+tells them apart.
+"""
+
+import bisect
+import os
+from collections import defaultdict
+from typing import Sequence
+
+from src.core.settings.const import MetricsConf
+
+
+def _labels(**labels: str | int) -> str:
+    items = ",".join(
+        '{}="{}"'.format(
+            name, str(value).replace("\\", "\\\\").replace('"', '\\"')
+        )
+        for name, value in labels.items()
+    )
+    return f"{{{items}}}"
+
+
+class CacheMetrics:
+    """Cache counters, latency histograms and value sizes by prefix."""
+
+    def __init__(self, latency_buckets: Sequence[float]) -> None:
+        """Init empty metrics."""
+        self.latency_buckets = tuple(sorted(latency_buckets))
+        self.events: defaultdict[tuple[str, str], int] = defaultdict(int)
+        self.latency: dict[tuple[str, str], list[int]] = {}
+        self.latency_sum: defaultdict[tuple[str, str], float] = defaultdict(
+            float
+        )
+        self.size_count: defaultdict[str, int] = defaultdict(int)
+        self.size_sum: defaultdict[str, int] = defaultdict(int)
+        self.size_max: defaultdict[str, int] = defaultdict(int)
+
+    def inc(self, prefix: str, event: str) -> None:
+        """Count cache outcome, e.g. X-Cache value of a response."""
+        self.events[prefix, event] += 1
+
+    def observe_latency(self, prefix: str, op: str, seconds: float) -> None:
+        """Add duration of a Redis round trip to the histogram."""
+        buckets = self.latency.setdefault(
+            (prefix, op), [0] * (len(self.latency_buckets) + 1)
+        )
+        buckets[bisect.bisect_left(self.latency_buckets, seconds)] += 1
+        self.latency_sum[prefix, op] += seconds
+
+    def observe_size(self, prefix: str, size: int) -> None:
+        """Add size of a stored value in bytes."""
+        self.size_count[prefix] += 1
+        self.size_sum[prefix] += size
+        self.size_max[prefix] = max(self.size_max[prefix], size)
+
+    def render(self, gauges: dict[str, float] | None = None) -> str:
+        """Return metrics in the Prometheus text format."""
+        pid = os.getpid()
+        name = MetricsConf.NAMESPACE
+        lines = [f"# TYPE {name}_events_total counter"]
+        for (prefix, event), count in sorted(self.events.items()):
+            lines.append(
+                f"{name}_events_total"
+                f"{_labels(pid=pid, prefix=prefix, event=event)} {count}"
+            )
+
+        lines.append(f"# TYPE {name}_redis_seconds histogram")
+        for (prefix, op), buckets in sorted(self.latency.items()):
+            cumulative = 0
+            bounds = [*map(str, self.latency_buckets), "+Inf"]
+            for bound, count in zip(bounds, buckets):
+                cumulative += count
+                labels = _labels(pid=pid, prefix=prefix, op=op, le=bound)
+                lines.append(
+                    f"{name}_redis_seconds_bucket{labels} {cumulative}"
+                )
+            labels = _labels(pid=pid, prefix=prefix, op=op)
+            lines.append(
+                f"{name}_redis_seconds_sum{labels} "
+                f"{self.latency_sum[prefix, op]}"
+            )
+            lines.append(f"{name}_redis_seconds_count{labels} {cumulative}")
+
+        lines.append(f"# TYPE {name}_value_bytes summary")
+        for prefix, count in sorted(self.size_count.items()):
+            labels = _labels(pid=pid, prefix=prefix)
+            lines.append(
+                f"{name}_value_bytes_sum{labels} {self.size_sum[prefix]}"
+            )
+            lines.append(f"{name}_value_bytes_count{labels} {count}")
+        lines.append(f"# TYPE {name}_value_bytes_max gauge")
+        for prefix, size in sorted(self.size_max.items()):
+            lines.append(
+                f"{name}_value_bytes_max{_labels(pid=pid, prefix=prefix)} "
+                f"{size}"
+            )
+
+        for gauge, value in (gauges or {}).items():
+            lines.append(f"# TYPE {name}_{gauge} gauge")
+            lines.append(f"{name}_{gauge}{_labels(pid=pid)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+cache_metrics = CacheMetrics(latency_buckets=MetricsConf.LATENCY_BUCKETS)
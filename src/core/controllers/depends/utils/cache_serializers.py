@@ -0,0 +1,72 @@
+"""Serializers of cached responses.
+
+A serializer turns the response model into the stored body and back.
+Cached bodies are sent to clients as is, so only JSON serializers may
+back the response cache. orjson is used only if the optional package is
+installed, see the `serializers` extra.
+"""
+
+import json
+from functools import lru_cache
+from typing import Any
+
+import pydantic
+
+from src.core.settings.const import CacheConf, TypeEncoding
+from src.core.settings.settings import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+class CacheSerializer:
+    """JSON serializer of pydantic, the default one."""
+
+    name = CacheConf.SERIALIZER_JSON
+
+    def dumps(self, data: pydantic.BaseModel) -> bytes:
+        """Return serialized model."""
+        return data.model_dump_json().encode(TypeEncoding.UTF8)
+
+    def loads(self, body: bytes) -> Any:
+        """Return plain data of the serialized model."""
+        return json.loads(body)
+
+
+class OrjsonSerializer(CacheSerializer):
+    """JSON serializer of orjson, the same output as pydantic's.
+
+    The model is dumped in pydantic's JSON mode, so datetimes, UUIDs and
+    custom serializers are converted by pydantic as in `model_dump_json`.
+    """
+
+    name = CacheConf.SERIALIZER_ORJSON
+
+    def dumps(self, data: pydantic.BaseModel) -> bytes:
+        """Return serialized model."""
+        return orjson.dumps(data.model_dump(mode="json"))
+
+    def loads(self, body: bytes) -> Any:
+        """Return plain data of the serialized model."""
+        return orjson.loads(body)
+
+
+def available_serializers() -> dict[str, CacheSerializer]:
+    """Return serializers whose packages are installed, by name."""
+    serializers: list[CacheSerializer] = [CacheSerializer()]
+    if orjson is not None:
+        serializers.append(OrjsonSerializer())
+    return {serializer.name: serializer for serializer in serializers}
+
+
+@lru_cache
+def get_cache_serializer(
+    name: str = settings.redis.REDIS_CACHE_SERIALIZER,
+) -> CacheSerializer:
+    """Return JSON serializer of the response cache.
+
+    Falls back to pydantic's one if the package of `name` isn't installed.
+    """
+    return available_serializers().get(name, CacheSerializer())
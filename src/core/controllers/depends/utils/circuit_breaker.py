@@ -0,0 +1,52 @@
+"""Circuit breaker for calls to an optional backend, e.g. Redis cache.
+
+After `threshold` consecutive failures the circuit opens and callers skip
+the backend. Once per `cooldown` seconds one call is let through as a
+probe, its success closes the circuit.
+"""
+
+import time
+
+
+class CircuitBreaker:
+    """Consecutive-failures circuit breaker of one process.
+
+    Notes:
+        Not thread-safe, it's meant for one event loop.
+    """
+
+    def __init__(self, threshold: int, cooldown: float) -> None:
+        """Init closed circuit."""
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether the backend is considered unhealthy."""
+        return self.opened_at is not None
+
+    def allow(self) -> bool:
+        """Return whether the call may go to the backend.
+
+        While open, one probe per cooldown is allowed.
+        """
+        if self.opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self.opened_at < self.cooldown:
+            return False
+        self.opened_at = now
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        """Count failure, open the circuit on threshold or failed probe."""
+        self.failures += 1
+        if self.opened_at is not None or self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
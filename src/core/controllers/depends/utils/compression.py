@@ -0,0 +1,108 @@
+"""Precompressed response bodies and Accept-Encoding negotiation.
+
+Cached bodies are compressed once, when they are stored, and every hit
+sends the variant the client accepts. gzip is always available, brotli
+and zstd only if the optional `brotli` and `zstandard` packages are
+installed, see the `compression` extra. zstd variant is stored only for
+bodies of at least `ContentEncoding.ZSTD_MIN_SIZE` bytes.
+"""
+
+import gzip
+from typing import Iterable
+
+from src.core.settings.const import ContentEncoding
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore[assignment]
+
+
+def available_encodings() -> tuple[str, ...]:
+    """Return supported codings, most preferred first."""
+    encodings = []
+    if zstandard is not None:
+        encodings.append(ContentEncoding.ZSTD)
+    if brotli is not None:
+        encodings.append(ContentEncoding.BR)
+    encodings.append(ContentEncoding.GZIP)
+    return tuple(encodings)
+
+
+def compress_variants(body: bytes) -> dict[str, bytes]:
+    """Return body compressed with every supported coding.
+
+    Args:
+        body (bytes): Identity body.
+
+    Returns:
+        dict[str, bytes]: Compressed bodies by coding name.
+    """
+    variants = {
+        ContentEncoding.GZIP: gzip.compress(
+            body, compresslevel=ContentEncoding.GZIP_LEVEL
+        )
+    }
+    if brotli is not None:
+        variants[ContentEncoding.BR] = brotli.compress(
+            body, quality=ContentEncoding.BR_QUALITY
+        )
+    if zstandard is not None and len(body) >= ContentEncoding.ZSTD_MIN_SIZE:
+        variants[ContentEncoding.ZSTD] = zstandard.ZstdCompressor(
+            level=ContentEncoding.ZSTD_LEVEL
+        ).compress(body)
+    return variants
+
+
+def decompress_gzip(body: bytes) -> bytes:
+    """Return identity body of the gzip variant."""
+    return gzip.decompress(body)
+
+
+def _parse_accept_encoding(accept_encoding: str) -> dict[str, float]:
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, *params = (part.strip() for part in item.split(";"))
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == ContentEncoding.QUALITY:
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.lower()] = quality
+    return qualities
+
+
+def choose_encoding(
+    accept_encoding: str | None, available: Iterable[str]
+) -> str:
+    """Return the coding to send for the request's Accept-Encoding.
+
+    Args:
+        accept_encoding (str | None): Accept-Encoding request header.
+        available (Iterable[str]): Stored codings, most preferred first.
+
+    Returns:
+        str: Coding with the highest client quality, server preference
+        breaks ties. `identity` if no stored coding is acceptable.
+    """
+    if not accept_encoding:
+        return ContentEncoding.IDENTITY
+
+    qualities = _parse_accept_encoding(accept_encoding)
+    wildcard = qualities.get(ContentEncoding.ANY, 0.0)
+    best, best_quality = ContentEncoding.IDENTITY, 0.0
+    for coding in available:
+        quality = qualities.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
@@ -24,6 +24,11 @@ async def _init_engine() -> "ManagerDB":
     )
 
 
+async def get_db_manager() -> "ManagerDB":
+    """Return db manager, e.g. to open a session outliving the dependency."""
+    return await _init_engine()
+
+
 async def disconnect_db() -> None:
     """Disconnect db."""
     connect = await get_engine(
@@ -40,4 +45,4 @@ async def get_session(engine: Annotated["ManagerDB", Depends(_init_engine)]):
         await session.close()
 
 
-__all__ = ["get_crud", "get_session", "disconnect_db"]
+__all__ = ["get_crud", "get_session", "get_db_manager", "disconnect_db"]
@@ -1,6 +1,25 @@
-"""Hash user password."""
+"""Hash user password.
+
+bcrypt is slow on purpose and releases the GIL, so the async helpers run
+it in a dedicated thread pool instead of the event loop. At most
+`PASSWORD_HASH_WORKERS` hashes run at once per worker process, a caller
+waits for a free thread at most `PASSWORD_HASH_QUEUE_TIMEOUT` seconds
+and is rejected with 503 after it.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, TypeVar
 
 import bcrypt
+from fastapi import status
+
+from src.core.controllers.depends.utils.return_error import http_exception
+from src.core.settings.const import Headers, MessageError, PasswordHashConf
+from src.core.settings.settings import settings
+
+T = TypeVar("T")
 
 
 def hash_pwd(
@@ -17,3 +36,57 @@ def validate_pwd(password: str, hash_password: bytes) -> bool:
         password=password.encode("UTF-8"),
         hashed_password=hash_password,
     )
+
+
+@lru_cache
+def get_hash_executor() -> ThreadPoolExecutor:
+    """Return the worker's thread pool of bcrypt."""
+    return ThreadPoolExecutor(
+        max_workers=settings.password_hash.PASSWORD_HASH_WORKERS,
+        thread_name_prefix=PasswordHashConf.THREAD_NAME_PREFIX,
+    )
+
+
+@lru_cache
+def get_hash_slots() -> asyncio.Semaphore:
+    """Return free threads of the pool, callers wait on it in a queue."""
+    return asyncio.Semaphore(settings.password_hash.PASSWORD_HASH_WORKERS)
+
+
+async def run_in_hash_pool(
+    func: Callable[..., T],
+    *args,
+    queue_timeout: float = settings.password_hash.PASSWORD_HASH_QUEUE_TIMEOUT,
+) -> T:
+    """Run bcrypt function in the thread pool.
+
+    Raises:
+        HTTPException: 503 if no thread is free within `queue_timeout`.
+    """
+    slots = get_hash_slots()
+    try:
+        await asyncio.wait_for(slots.acquire(), timeout=queue_timeout)
+    except TimeoutError:
+        # TODO: LOGGER WARNING, auth requests are queued too long
+        raise http_exception(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            error_type=MessageError.TYPE_ERROR_SERVICE_UNAVAILABLE,
+            error_message=MessageError.MESSAGE_AUTH_BUSY,
+            headers=Headers.RETRY_AFTER_AUTH_BUSY,
+        )
+    try:
+        return await asyncio.get_running_loop().run_in_executor(
+            get_hash_executor(), func, *args
+        )
+    finally:
+        slots.release()
+
+
+async def hash_pwd_async(password: str) -> bytes:
+    """Create crypt hash password off the event loop."""
+    return await run_in_hash_pool(hash_pwd, password)
+
+
+async def validate_pwd_async(password: str, hash_password: bytes) -> bool:
+    """Validate crypt hash password off the event loop."""
+    return await run_in_hash_pool(validate_pwd, password, hash_password)
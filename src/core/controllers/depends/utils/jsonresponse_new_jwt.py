@@ -8,14 +8,21 @@ from src.core.settings.const import JWT
 from src.core.validators import UserToken
 
 
-def response(payload: dict) -> "JSONResponse":
-    """Return JSONResponse with new tokens."""
+def response(
+    payload: dict, refresh_claims: dict | None = None
+) -> "JSONResponse":
+    """Return JSONResponse with new tokens.
+
+    `refresh_claims` are added only to the refresh token, e.g. its `jti`
+    and device fingerprint.
+    """
     user_token = UserToken(
         access_token=create_token(
             payload=payload, type_token=JWT.TOKEN_TYPE_ACCESS
         ),
         refresh_token=create_token(
-            payload=payload, type_token=JWT.TOKEN_TYPE_REFRESH
+            payload={**payload, **(refresh_claims or {})},
+            type_token=JWT.TOKEN_TYPE_REFRESH,
         ),
     )
 
@@ -1,21 +1,58 @@
 """TODO DOCS."""
 
 import datetime
+from functools import lru_cache
+from typing import Any
+from uuid import uuid4
 
 import jwt
 
+from src.core.controllers.depends.utils.token_cache import (
+    VerifiedTokenCache,
+)
 from src.core.settings.const import JWT
 from src.core.settings.settings import settings
 
 
+@lru_cache
+def load_key(pem: str, algorithm: str = settings.jwt.algorithm) -> Any:
+    """Return key object parsed from PEM, once per process."""
+    return jwt.get_algorithm_by_name(algorithm).prepare_key(pem)
+
+
+def get_private_key() -> Any:
+    """Return parsed private key of the settings."""
+    return load_key(settings.jwt.jwt_private)
+
+
+def get_public_key() -> Any:
+    """Return parsed public key of the settings."""
+    return load_key(settings.jwt.jwt_public)
+
+
+def load_signing_keys() -> None:
+    """Parse the keys at startup, invalid keys fail it."""
+    get_private_key()
+    get_public_key()
+
+
+@lru_cache
+def get_verified_tokens() -> VerifiedTokenCache:
+    """Return the worker's cache of verified tokens."""
+    return VerifiedTokenCache(max_entries=settings.jwt.verified_cache_size)
+
+
 def encode_jwt(
     payload: dict,
-    private_key: str = settings.jwt.jwt_private,
+    private_key: Any = None,
     algorithm: str = settings.jwt.algorithm,
     expire_minutes: int = settings.jwt.access_token_expire_minutes,
     expire_delta: datetime.timedelta | None = None,
 ) -> str:
-    """Return encoded token."""
+    """Return encoded token.
+
+    The private key of the settings is used if `private_key` is None.
+    """
     now = datetime.datetime.now(datetime.UTC)
 
     if expire_delta:
@@ -28,7 +65,7 @@ def encode_jwt(
     to_encode[JWT.PAYLOAD_IAT_KEY] = now
     encode = jwt.encode(
         payload=to_encode,
-        key=private_key,
+        key=private_key if private_key is not None else get_private_key(),
         algorithm=algorithm,
     )
     return encode
@@ -36,18 +73,35 @@ def encode_jwt(
 
 def decode_jwt(
     jwt_token: str | bytes,
-    public_key: str = settings.jwt.jwt_public,
+    public_key: Any = None,
     algorithm: str = settings.jwt.algorithm,
 ) -> dict:
-    """Return decoded token."""
+    """Return decoded token.
+
+    The public key of the settings is used if `public_key` is None.
+    """
     decoded = jwt.decode(
         jwt=jwt_token,
-        key=public_key,
+        key=public_key if public_key is not None else get_public_key(),
         algorithms=[algorithm],
     )
     return decoded
 
 
+def decode_jwt_cached(jwt_token: str | bytes) -> dict:
+    """Return decoded token, verified once per worker until its `exp`.
+
+    Raises:
+        InvalidTokenError: as `decode_jwt`, invalid tokens aren't cached.
+    """
+    verified_tokens = get_verified_tokens()
+    payload = verified_tokens.get(jwt_token)
+    if payload is None:
+        payload = decode_jwt(jwt_token=jwt_token)
+        verified_tokens.set(jwt_token, payload)
+    return payload
+
+
 def create_token(
     payload: dict,
     type_token: str,
@@ -63,8 +117,14 @@ def create_token(
         expire_delta (int): for refresh token.
     Returns:
         jwt token (str)
+    Notes:
+        Every token gets a random `jti` unless payload has one, so it can
+        be revoked.
     """
-    jwt_payload = {JWT.TOKEN_TYPE_FIELD: type_token}
+    jwt_payload = {
+        JWT.TOKEN_TYPE_FIELD: type_token,
+        JWT.PAYLOAD_JTI_KEY: uuid4().hex,
+    }
     jwt_payload.update(payload)
     set_expire_delta: datetime.timedelta | None = (
         expire_delta
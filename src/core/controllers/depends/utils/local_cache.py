@@ -0,0 +1,113 @@
+"""In-process L1 cache in front of Redis.
+
+Every worker keeps a small LRU of cache entries, so hot keys are served
+without a Redis round trip. Entries are dropped on TTL, on size limits,
+and when a write invalidates one of their namespaces (broadcast by Redis
+pub/sub, see `redis_chash.listen_invalidations`).
+"""
+
+import time
+from collections import OrderedDict, defaultdict
+from typing import Iterable, NamedTuple
+
+
+class CachedEntry(NamedTuple):
+    """Cached response: ETag and body by content coding.
+
+    `fresh_until` is a unix time, the entry is stale after it.
+    """
+
+    etag: str
+    variants: dict[str, bytes]
+    namespaces: tuple[str, ...] = ()
+    fresh_until: int | None = None
+
+    @property
+    def size(self) -> int:
+        """Return size of the stored bodies in bytes."""
+        return sum(len(body) for body in self.variants.values())
+
+
+class LocalCache:
+    """Size- and TTL-bounded LRU of cache entries of one worker process.
+
+    Notes:
+        `epoch` grows on every invalidation. A caller reads it before
+        going to Redis and passes it to `set`, so an entry read before an
+        invalidation isn't stored after it.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: int) -> None:
+        """Init empty cache."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.epoch = 0
+        self._size = 0
+        self._entries: OrderedDict[str, tuple[float, CachedEntry]] = (
+            OrderedDict()
+        )
+        self._keys_by_namespace: defaultdict[str, set[str]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        """Return number of entries."""
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Return size of the stored bodies in bytes."""
+        return self._size
+
+    def get(self, key: str) -> CachedEntry | None:
+        """Return fresh entry and mark it as recently used."""
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, entry = item
+        if expires_at <= time.monotonic():
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CachedEntry, epoch: int) -> None:
+        """Store entry unless it's too big or was invalidated meanwhile."""
+        if epoch != self.epoch or entry.size > self.max_bytes:
+            return
+        self._drop(key)
+        self._entries[key] = (time.monotonic() + self.ttl, entry)
+        self._size += entry.size
+        for namespace in entry.namespaces:
+            self._keys_by_namespace[namespace].add(key)
+        while (
+            len(self._entries) > self.max_entries
+            or self._size > self.max_bytes
+        ):
+            self._drop(next(iter(self._entries)))
+
+    def invalidate(self, namespaces: Iterable[str]) -> None:
+        """Drop all entries of the namespaces."""
+        self.epoch += 1
+        for namespace in namespaces:
+            for key in self._keys_by_namespace.pop(namespace, set()):
+                self._drop(key)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self.epoch += 1
+        self._entries.clear()
+        self._keys_by_namespace.clear()
+        self._size = 0
+
+    def _drop(self, key: str) -> None:
+        item = self._entries.pop(key, None)
+        if item is None:
+            return
+        _, entry = item
+        self._size -= entry.size
+        for namespace in entry.namespaces:
+            keys = self._keys_by_namespace.get(namespace)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_namespace[namespace]
@@ -0,0 +1,141 @@
+"""Keyset pagination cursors.
+
+A cursor is an opaque url-safe token built from the sort key of the last
+row of a page: `created_at` plus `id` as a tie-breaker, optionally led by
+a rank (e.g. popularity score for the home timeline). Rows with a
+monotonic integer key (likes) use that key alone.
+"""
+
+import base64
+import binascii
+import math
+import uuid
+from datetime import datetime
+
+from fastapi import HTTPException, status
+
+from src.core.controllers.depends.utils.return_error import http_exception
+from src.core.settings.const import MessageError, PaginationConf, TypeEncoding
+
+
+def _encode(*parts: str) -> str:
+    raw = PaginationConf.CURSOR_SEPARATOR.join(parts)
+    return base64.urlsafe_b64encode(raw.encode(TypeEncoding.UTF8)).decode(
+        TypeEncoding.UTF8
+    )
+
+
+def _decode(cursor: str) -> list[str]:
+    raw = base64.urlsafe_b64decode(cursor.encode(TypeEncoding.UTF8))
+    return raw.decode(TypeEncoding.UTF8).split(PaginationConf.CURSOR_SEPARATOR)
+
+
+def _invalid_cursor() -> HTTPException:
+    return http_exception(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        error_type=MessageError.INVALID_CURSOR_ERR,
+        error_message=MessageError.INVALID_CURSOR_ERR_MESSAGE,
+    )
+
+
+def encode_cursor(created_at: datetime, id_row: str) -> str:
+    """Return opaque cursor for the row sort key.
+
+    Args:
+        created_at (datetime): Creation time of the last row on the page.
+        id_row (str): ID of the last row on the page.
+
+    Returns:
+        str: url-safe cursor.
+    """
+    return _encode(created_at.isoformat(), id_row)
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Return sort key from an opaque cursor.
+
+    Args:
+        cursor (str): Cursor received from a previous page.
+
+    Returns:
+        tuple[datetime, str]: `created_at` and `id` of the last seen row.
+
+    Raises:
+        HTTPException: 422 if the cursor is malformed.
+    """
+    try:
+        created_at, id_row = _decode(cursor)
+        return datetime.fromisoformat(created_at), str(uuid.UUID(id_row))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise _invalid_cursor()
+
+
+def encode_rank_cursor(rank: float, created_at: datetime, id_row: str) -> str:
+    """Return opaque cursor for the ranked row sort key.
+
+    Args:
+        rank (float): Rank of the last row on the page.
+        created_at (datetime): Creation time of the last row on the page.
+        id_row (str): ID of the last row on the page.
+
+    Returns:
+        str: url-safe cursor.
+    """
+    return _encode(repr(float(rank)), created_at.isoformat(), id_row)
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, datetime, str]:
+    """Return ranked sort key from an opaque cursor.
+
+    Args:
+        cursor (str): Cursor received from a previous page.
+
+    Returns:
+        tuple[float, datetime, str]: rank, `created_at` and `id` of the last
+            seen row.
+
+    Raises:
+        HTTPException: 422 if the cursor is malformed.
+    """
+    try:
+        rank, created_at, id_row = _decode(cursor)
+        if not math.isfinite(float(rank)):
+            raise ValueError(rank)
+        return (
+            float(rank),
+            datetime.fromisoformat(created_at),
+            str(uuid.UUID(id_row)),
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise _invalid_cursor()
+
+
+def encode_id_cursor(id_row: int) -> str:
+    """Return opaque cursor for a monotonic integer key.
+
+    Args:
+        id_row (int): ID of the last row on the page.
+
+    Returns:
+        str: url-safe cursor.
+    """
+    return _encode(str(id_row))
+
+
+def decode_id_cursor(cursor: str) -> int:
+    """Return monotonic integer key from an opaque cursor.
+
+    Args:
+        cursor (str): Cursor received from a previous page.
+
+    Returns:
+        int: ID of the last seen row.
+
+    Raises:
+        HTTPException: 422 if the cursor is malformed.
+    """
+    try:
+        (id_row,) = _decode(cursor)
+        return int(id_row)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise _invalid_cursor()
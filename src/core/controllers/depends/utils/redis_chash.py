@@ -3,36 +3,85 @@ Cache module for caching API responses with Redis and ETag support.
 
 Functions:
     singleton(func): Singleton pattern decorator for caching instances.
+    create_pool(url, **kwargs): Bounded connection pool with timeouts.
     setup_redis(url, encoding, decode_responses): Initialize Redis client.
+    setup_redis_bytes(url): Initialize Redis client for binary values.
     close_redis(client): Close Redis connection.
     init_redis(): Initialize and return Redis client.
-    serialize_data(data): Serialize Pydantic model to JSON string.
-    deserialize_data(data, return_type): Deserialize JSON string to Pydantic model.
-    get_request_key(prefix_key, func, request): Generate cache key based on request.
+    serialize_data(data): Serialize Pydantic model with the cache serializer.
+    content_hash(data): Stable hex digest of data.
+    get_request_key(prefix_key, func, request, principal): Generate cache key based on request.
     gen_etag(cached_value): Generate ETag from cached value.
-    set_response_headers(response, exp, cached_value, update): Set cache headers (Cache-Control, ETag).
+    set_response_headers(response, etag, cache_status, private): Set cache headers (Cache-Control, ETag, Vary, X-Cache).
+    etag_matches(if_none_match, etag): Weak comparison of If-None-Match and ETag.
     check_etag(request, response): Validate ETag in request and response.
-    get_cache(cache_key): Retrieve cached data from Redis by key.
-    set_cache(cache_key, value, ex): Store data in Redis with expiration time.
-    cache_get_response(expire, prefix_key): Decorator for caching GET responses.
+    user_namespace(id_user): Cache namespace of the user's profile.
+    get_local_cache(): Worker's L1 cache, None if disabled.
+    bump_generations(*namespaces): Invalidate cache namespaces.
+    listen_invalidations(local_cache): Drop L1 entries invalidated by any worker.
+    meta_key(cache_key): Key of the entry's metadata.
+    get_cache(cache_key, fields, namespaces): Retrieve entry metadata, fields and namespace generations.
+    set_cache(cache_key, meta, value, ex): Store entry metadata and fields in Redis with expiration time.
+    load_entry(cache_key, encoding, namespaces): Fresh cached entry and generations stamp.
+    fill_entry(cache_key, stamp, call, expire, stale_ttl, namespaces, prefix_key): Run dependency and cache its response.
+    acquire_fill_lock(cache_key): Lock the cache key for filling across workers.
+    release_fill_lock(cache_key, token): Release the fill lock.
+    wait_for_fill(cache_key, encoding, namespaces): Poll for the entry filled by another worker.
+    single_flight(cache_key, fill, poll): Fill a missed cache key once for concurrent requests.
+    revalidate_in_background(cache_key, refresh): Refresh a stale entry in a background task.
+    send_cached(request, response, entry): Response for a cache hit.
+    etag_guard(prefix_key, func, namespaces, stale_ttl): Dependency answering 304 before DB dependencies.
+    cache_get_response(expire, prefix_key, namespaces, stale_ttl): Decorator for caching GET responses.
 
 """  # noqa E501
 
+import asyncio
+import hashlib
+import inspect
 import json
-from functools import update_wrapper, wraps
-from typing import Any, Callable, Type
+import logging
+import time
+from functools import lru_cache, update_wrapper, wraps
+from typing import Annotated, Any, Awaitable, Callable, Mapping, Sequence
+from uuid import uuid4
 
 import pydantic
-from fastapi import Request, Response
-from fastapi.dependencies.utils import get_typed_return_annotation
-from fastapi.responses import JSONResponse
+from fastapi import Depends, HTTPException, Request, Response
 from redis import asyncio as aioredis
-from redis.asyncio.client import Redis
+from redis.asyncio import BlockingConnectionPool
+from redis.asyncio.client import Pipeline, Redis
 from starlette.status import HTTP_200_OK, HTTP_304_NOT_MODIFIED
 
-from src.core.settings.const import Headers, Keys, MimeTypes, TypeEncoding
+from src.core.controllers.depends.utils.cache_metrics import cache_metrics
+from src.core.controllers.depends.utils.cache_serializers import (
+    get_cache_serializer,
+)
+from src.core.controllers.depends.utils.circuit_breaker import CircuitBreaker
+from src.core.controllers.depends.utils.compression import (
+    available_encodings,
+    choose_encoding,
+    compress_variants,
+    decompress_gzip,
+)
+from src.core.controllers.depends.utils.connect_db import get_db_manager
+from src.core.controllers.depends.utils.local_cache import (
+    CachedEntry,
+    LocalCache,
+)
+from src.core.settings.const import (
+    CacheConf,
+    ContentEncoding,
+    Headers,
+    Keys,
+    LocalCacheConf,
+    MetricsConf,
+    MimeTypes,
+    TypeEncoding,
+)
 from src.core.settings.settings import settings
 
+logger = logging.getLogger(__name__)
+
 
 def singleton(func: Callable) -> Callable:
     """Singleton pattern decorator for caching instances."""
@@ -49,6 +98,23 @@ def singleton(func: Callable) -> Callable:
     return wrapper
 
 
+def create_pool(url: str, **kwargs: Any) -> BlockingConnectionPool:
+    """Return bounded connection pool with timeouts from settings.
+
+    A request waits up to `REDIS_POOL_TIMEOUT` for a free connection, and
+    a command fails after `REDIS_SOCKET_TIMEOUT` instead of hanging.
+    """
+    return BlockingConnectionPool.from_url(
+        url,
+        max_connections=settings.redis.REDIS_MAX_CONNECTIONS,
+        timeout=settings.redis.REDIS_POOL_TIMEOUT,
+        socket_timeout=settings.redis.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.redis.REDIS_CONNECT_TIMEOUT,
+        health_check_interval=settings.redis.REDIS_HEALTH_CHECK_INTERVAL,
+        **kwargs,
+    )
+
+
 @singleton
 async def setup_redis(
     url: str = settings.redis.redis_url,
@@ -57,16 +123,34 @@ async def setup_redis(
 ) -> Redis:
     """Initialize Redis client."""
     try:
-        return await aioredis.from_url(
-            url=url,
-            encoding=encoding,
-            decode_responses=decode_responses,
+        # types-redis predates Redis.from_pool of redis 5.
+        return await Redis.from_pool(  # type: ignore[attr-defined]
+            create_pool(
+                url, encoding=encoding, decode_responses=decode_responses
+            )
         )
     except aioredis.RedisError as e:
         # TODO: LOGGER ERROR
         raise e
 
 
+@singleton
+async def setup_redis_bytes(url: str = settings.redis.redis_url) -> Redis:
+    """Initialize Redis client which returns values as bytes."""
+    try:
+        pool = create_pool(url, decode_responses=False)
+        return await Redis.from_pool(pool)  # type: ignore[attr-defined]
+    except aioredis.RedisError as e:
+        # TODO: LOGGER ERROR
+        raise e
+
+
+redis_breaker = CircuitBreaker(
+    threshold=settings.redis.REDIS_BREAKER_THRESHOLD,
+    cooldown=settings.redis.REDIS_BREAKER_COOLDOWN,
+)
+
+
 async def close_redis(client: Redis) -> None:
     """Close the Redis connection."""
     try:
@@ -81,83 +165,716 @@ async def init_redis() -> Redis:
     return await setup_redis()
 
 
-def serialize_data(data: pydantic.BaseModel) -> str:
-    """Convert Pydantic model to JSON string."""
-    return data.model_dump_json()
+def serialize_data(data: pydantic.BaseModel) -> bytes:
+    """Convert Pydantic model to JSON with `REDIS_CACHE_SERIALIZER`."""
+    return get_cache_serializer().dumps(data)
+
+
+def content_hash(data: bytes) -> str:
+    """Return stable hex digest of data, the same in every process."""
+    return hashlib.blake2b(
+        data, digest_size=CacheConf.HASH_DIGEST_SIZE
+    ).hexdigest()
+
+
+def get_request_key(
+    prefix_key: str,
+    func: Callable,
+    request: Request,
+    principal: str | None = None,
+) -> str:
+    """Generate cache key from request.
+
+    The key is a digest of the canonical method, path, path params, query
+    params and principal (the user the response is built for, None for
+    public responses), so all workers compute the same key.
+    """
+    canonical = json.dumps(
+        [
+            request.method,
+            request.url.path,
+            sorted(request.path_params.items()),
+            sorted(request.query_params.multi_items()),
+            principal,
+        ],
+        separators=(",", ":"),
+        default=str,
+    )
+    digest = content_hash(canonical.encode(TypeEncoding.UTF8))
+    return f"{prefix_key}:{func.__name__}:{digest}"
 
 
-def deserialize_data(
-    data: str, return_type: Type[pydantic.BaseModel]
-) -> pydantic.BaseModel:
-    """Convert JSON string to Pydantic model."""
-    try:
-        return return_type(**json.loads(data))
-    except (json.JSONDecodeError, pydantic.ValidationError) as e:
-        # TODO: LOGGER ERROR
-        raise e
+def gen_etag(cached_value: str | bytes) -> str:
+    """Generate weak ETag from cached value.
 
+    Weak, because the same ETag is sent for every content coding.
+    """
+    if isinstance(cached_value, str):
+        cached_value = cached_value.encode(TypeEncoding.UTF8)
+    digest = content_hash(cached_value)
+    return f'{Headers.ETAG_WEAK_PREFIX}"{digest}"'
 
-def get_request_key(prefix_key: str, func: Callable, request: Request) -> str:
-    """Generate cache key from request."""
-    request_to_hash = ":".join(f"{k}={v}" for k, v in request.query_params)
-    return f"{prefix_key}:{func.__name__}:{hash(request_to_hash)}"
 
+def set_response_headers(
+    response: Response,
+    etag: str,
+    cache_status: str = Headers.X_CACHE_MISS,
+    private: bool = False,
+):
+    """Set cache headers in the response.
 
-def gen_etag(cached_value: str) -> str:
-    """Generate ETag from cached value."""
-    return f"W/{hash(cached_value)}"
+    Clients revalidate every request by the ETag, so writes show up at
+    once: the TTL of an entry applies to Redis only. Responses built for
+    a principal are `private`, shared caches don't store them.
+    """
+    cache_control = Headers.CACHE_NO_CACHE
+    if private:
+        cache_control = f"{Headers.CACHE_PRIVATE}, {cache_control}"
+    response.headers[Headers.CACHE_CONTROL] = cache_control
+    response.headers[Headers.ETAG] = etag
+    response.headers[Headers.VARY] = Headers.ACCEPT_ENCODING
+    response.headers[Headers.X_CACHE] = cache_status
 
 
-def set_response_headers(
-    response: Response, exp: int, cached_value: str, update: bool = False
-):
-    """Set cache headers in the response."""
-    response.headers[Headers.CACHE_CONTROL] = f"{Headers.CACHE_MAX_AGE}{exp}"
-    response.headers[Headers.ETAG] = gen_etag(cached_value)
-    response.headers[Headers.X_CACHE] = (
-        Headers.X_CACHE_MISS if update is False else Headers.X_CACHE_HIT
-    )
+def _opaque_tag(etag: str) -> str:
+    return etag.strip().removeprefix(Headers.ETAG_WEAK_PREFIX)
+
+
+def etag_matches(if_none_match: str | None, etag: str | None) -> bool:
+    """Return whether `If-None-Match` matches the ETag.
+
+    `If-None-Match` may list several ETags, they are compared weakly.
+    """
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == Headers.ETAG_ANY:
+        return True
+    return _opaque_tag(etag) in {
+        _opaque_tag(tag) for tag in if_none_match.split(",")
+    }
 
 
 def check_etag(request: Request, response: Response) -> bool:
     """Validate ETag to check cache validity."""
-    return request.headers.get(Headers.IF_NONE_MATCH) == response.headers.get(
-        Headers.ETAG
+    return etag_matches(
+        if_none_match=request.headers.get(Headers.IF_NONE_MATCH),
+        etag=response.headers.get(Headers.ETAG),
+    )
+
+
+def user_namespace(id_user: str) -> str:
+    """Return cache namespace of the user's profile."""
+    return f"{CacheConf.NAMESPACE_USER}:{id_user}"
+
+
+def generation_key(namespace: str) -> str:
+    """Return Redis key of the namespace generation counter."""
+    return f"{CacheConf.GENERATION_PREFIX}:{namespace}"
+
+
+@lru_cache(maxsize=1)
+def get_local_cache() -> LocalCache | None:
+    """Return the worker's L1 cache, None if it's disabled."""
+    if not settings.redis.REDIS_L1_CACHE:
+        return None
+    return LocalCache(
+        max_entries=settings.redis.REDIS_L1_MAX_ENTRIES,
+        max_bytes=settings.redis.REDIS_L1_MAX_BYTES,
+        ttl=settings.redis.REDIS_L1_TTL,
+    )
+
+
+_pending_bumps: set[str] = set()
+
+
+def _queue_bumps(pipe: Pipeline, namespaces: Sequence[str]) -> None:
+    for namespace in namespaces:
+        pipe.incr(generation_key(namespace))
+    pipe.publish(
+        LocalCacheConf.CHANNEL,
+        LocalCacheConf.SEPARATOR.join(namespaces),
     )
 
 
-async def get_cache(cache_key: str) -> str | None:
-    """Retrieve cached data from Redis by key."""
-    redis_client: Redis = await setup_redis()
+async def bump_generations(*namespaces: str) -> None:
+    """Invalidate every cached entry of the namespaces.
+
+    Entries are stamped with the generations they were built for, a bump
+    turns them into misses without scanning or deleting keys. Workers'
+    L1 caches are told by a pub/sub message. Bumps failed while Redis is
+    down are retried with the next cache read or bump.
+    """
+    local_cache = get_local_cache()
+    if local_cache is not None:
+        local_cache.invalidate(namespaces)
+
+    bumps = sorted(_pending_bumps.union(namespaces))
+    redis_client: Redis = await setup_redis_bytes()
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            _queue_bumps(pipe, bumps)
+            await pipe.execute()
+    except aioredis.RedisError as e:
+        logger.error("bump of cache generations failed: %s", e)
+        redis_breaker.record_failure()
+        _pending_bumps.update(namespaces)
+        return
+    redis_breaker.record_success()
+    _pending_bumps.difference_update(bumps)
+
+
+async def listen_invalidations(local_cache: LocalCache) -> None:
+    """Drop L1 entries of namespaces invalidated by any worker.
+
+    Runs for the app lifetime. While the subscription is down messages
+    may be lost, so the L1 cache is cleared on every (re)subscribe.
+    """
+    redis_client: Redis = await setup_redis_bytes()
+    while True:
+        try:
+            async with redis_client.pubsub() as pubsub:
+                await pubsub.subscribe(LocalCacheConf.CHANNEL)
+                local_cache.clear()
+                while True:
+                    # Reads time out after REDIS_SOCKET_TIMEOUT unless
+                    # the timeout is given explicitly.
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True,
+                        timeout=LocalCacheConf.LISTEN_TIMEOUT,
+                    )
+                    if message is None:
+                        continue
+                    local_cache.invalidate(
+                        message["data"]
+                        .decode(TypeEncoding.UTF8)
+                        .split(LocalCacheConf.SEPARATOR)
+                    )
+        except aioredis.RedisError as e:
+            logger.error("cache invalidation subscription lost: %s", e)
+            local_cache.clear()
+            await asyncio.sleep(LocalCacheConf.RECONNECT_DELAY)
+
+
+def meta_key(cache_key: str) -> str:
+    """Return key of the entry's metadata: generations, ETag, freshness."""
+    return f"{CacheConf.META_PREFIX}:{cache_key}"
+
+
+META_FIELDS = (
+    CacheConf.FIELD_GENERATION,
+    CacheConf.FIELD_ETAG,
+    CacheConf.FIELD_FRESH_UNTIL,
+)
+
+
+async def get_cache(
+    cache_key: str, fields: Sequence[str] = (), namespaces: Sequence[str] = ()
+) -> tuple[list[bytes | None], list[bytes | None], bytes]:
+    """Retrieve entry metadata, body fields and current generations.
+
+    All are read in one round trip. Without `fields` only the small
+    metadata key is read.
+
+    Returns:
+        Values of `META_FIELDS`, values of `fields` and generations stamp.
+    """
+    bumps = sorted(_pending_bumps)
+    redis_client: Redis = await setup_redis_bytes()
     try:
-        return await redis_client.get(cache_key)
+        async with redis_client.pipeline(transaction=False) as pipe:
+            if bumps:
+                # Bumps failed during an outage go first, so no entry
+                # outdated by them is served.
+                _queue_bumps(pipe, bumps)
+            pipe.hmget(meta_key(cache_key), META_FIELDS)
+            if fields:
+                pipe.hmget(cache_key, fields)
+            if namespaces:
+                pipe.mget([generation_key(name) for name in namespaces])
+            results = await pipe.execute()
     except aioredis.RedisError as e:
         # TODO: LOGGER ERROR
+        redis_breaker.record_failure()
         raise e
+    redis_breaker.record_success()
+    _pending_bumps.difference_update(bumps)
+    del results[: len(bumps) + 1 if bumps else 0]
+    meta = results.pop(0)
+    values = results.pop(0) if fields else []
+    counters = results[0] if namespaces else []
+    stamp = CacheConf.GENERATION_SEPARATOR.encode(TypeEncoding.UTF8).join(
+        counter or b"0" for counter in counters
+    )
+    return meta, values, stamp
 
 
-async def set_cache(cache_key, value, ex) -> None:
-    """Store data in Redis with expiration time."""
-    redis_client: Redis = await setup_redis()
+async def set_cache(
+    cache_key: str,
+    meta: Mapping[str, bytes],
+    value: Mapping[str, bytes],
+    ex: int,
+) -> None:
+    """Store entry metadata and bodies in Redis with expiration time."""
+    redis_client: Redis = await setup_redis_bytes()
     try:
-        await redis_client.set(
-            name=cache_key,
-            value=value,
-            ex=ex,
-        )
+        async with redis_client.pipeline(transaction=True) as pipe:
+            for key, mapping in (
+                (meta_key(cache_key), meta),
+                (cache_key, value),
+            ):
+                fields: dict[str | bytes, bytes] = {
+                    field: body for field, body in mapping.items()
+                }
+                pipe.delete(key)
+                pipe.hset(key, mapping=fields)
+                pipe.expire(key, ex)
+            await pipe.execute()
     except aioredis.RedisError as e:
         # TODO: LOGGER ERROR
+        redis_breaker.record_failure()
         raise e
+    redis_breaker.record_success()
+
+
+def encoded_response(body: bytes, encoding: str, response: Response):
+    """Return raw JSON response with the body in the given coding."""
+    headers = dict(response.headers)
+    if encoding != ContentEncoding.IDENTITY:
+        headers[Headers.CONTENT_ENCODING] = encoding
+    return Response(
+        content=body,
+        status_code=HTTP_200_OK,
+        media_type=MimeTypes.APPLICATION_JSON,
+        headers=headers,
+    )
 
 
-def cache_get_response(expire: int, prefix_key: str) -> Callable:
-    """Cache decorator for GET requests."""
+_revalidating: set[str] = set()
+_background_tasks: set[asyncio.Task] = set()
+
+
+def revalidate_in_background(
+    cache_key: str, refresh: Callable[[], Awaitable[CachedEntry]]
+) -> None:
+    """Refresh a stale entry in a background task.
+
+    One task per key runs in a worker, and only the worker holding the
+    fill lock refreshes. Meanwhile the stale entry is served.
+    """
+    if cache_key in _revalidating:
+        return
+    _revalidating.add(cache_key)
+
+    async def _revalidate() -> None:
+        try:
+            token = await acquire_fill_lock(cache_key)
+            if token is None:
+                return
+            try:
+                await refresh()
+            finally:
+                await release_fill_lock(cache_key, token)
+        except Exception:
+            logger.exception(
+                "revalidation failed, stale entry is served until it expires"
+            )
+        finally:
+            _revalidating.discard(cache_key)
+
+    task = asyncio.create_task(_revalidate())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def send_cached(
+    request: Request, response: Response, entry: CachedEntry
+) -> Response:
+    """Return response for a cache hit, 304 if the client's ETag matches.
+
+    Stored bytes are sent as is, without parsing or validation. The
+    variant is negotiated among the stored ones, clients without
+    compression get the gzip variant decompressed.
+    """
+    if check_etag(request=request, response=response):
+        return Response(
+            status_code=HTTP_304_NOT_MODIFIED,
+            headers=response.headers,
+        )
+
+    encoding = choose_encoding(
+        accept_encoding=request.headers.get(Headers.ACCEPT_ENCODING),
+        available=[
+            coding
+            for coding in available_encodings()
+            if coding in entry.variants
+        ],
+    )
+    if encoding != ContentEncoding.IDENTITY:
+        body = entry.variants[encoding]
+    else:
+        body = decompress_gzip(entry.variants[ContentEncoding.GZIP])
+    return encoded_response(body=body, encoding=encoding, response=response)
+
+
+async def load_entry(
+    cache_key: str,
+    encoding: str,
+    namespaces: Sequence[str] = (),
+) -> tuple[CachedEntry | None, bytes]:
+    """Return fresh cached entry and current generations stamp.
+
+    Only the gzip variant and the negotiated one are fetched. The entry
+    is None on miss or if it was built for older generations.
+    """
+    fields = [ContentEncoding.GZIP]
+    if encoding not in fields:
+        fields.append(encoding)
+
+    (
+        (generation, etag, fresh_until),
+        (gzip_body, *encoded),
+        stamp,
+    ) = await get_cache(
+        cache_key=cache_key,
+        fields=fields,
+        namespaces=namespaces,
+    )
+    if etag is None or gzip_body is None or generation != stamp:
+        return None, stamp
+
+    variants = {ContentEncoding.GZIP: gzip_body}
+    if encoded and encoded[0] is not None:
+        variants[encoding] = encoded[0]
+    entry = CachedEntry(
+        etag=etag.decode(TypeEncoding.UTF8),
+        variants=variants,
+        namespaces=tuple(namespaces),
+        fresh_until=int(fresh_until) if fresh_until is not None else None,
+    )
+    return entry, stamp
+
+
+async def fill_entry(
+    cache_key: str,
+    stamp: bytes,
+    call: Callable[[], Awaitable[Any]],
+    expire: int,
+    stale_ttl: int = 0,
+    namespaces: Sequence[str] = (),
+    prefix_key: str = "",
+) -> CachedEntry:
+    """Run the dependency and store its response as a cache entry.
+
+    The entry is fresh for `expire` seconds and kept `stale_ttl` seconds
+    longer to be served while it's refreshed. Write latency and entry
+    size are recorded under `prefix_key`.
+    """
+    data_response = await call()
+    if isinstance(data_response, Response):
+        # Body is already serialized, e.g. JSON built by the DB.
+        cached_value = bytes(data_response.body)
+    else:
+        cached_value = serialize_data(data_response)
+    entry = CachedEntry(
+        etag=gen_etag(cached_value),
+        variants=compress_variants(cached_value),
+        namespaces=tuple(namespaces),
+        fresh_until=int(time.time()) + expire,
+    )
+    cache_metrics.observe_size(prefix_key, entry.size)
+    started = time.perf_counter()
+    try:
+        await set_cache(
+            cache_key=cache_key,
+            meta={
+                CacheConf.FIELD_GENERATION: stamp,
+                CacheConf.FIELD_ETAG: entry.etag.encode(TypeEncoding.UTF8),
+                CacheConf.FIELD_FRESH_UNTIL: str(entry.fresh_until).encode(
+                    TypeEncoding.UTF8
+                ),
+            },
+            value=entry.variants,
+            ex=expire + stale_ttl,
+        )
+    except aioredis.RedisError as e:
+        logger.error(
+            "cache write failed, the response is sent uncached: %s", e
+        )
+        cache_metrics.inc(prefix_key, MetricsConf.EVENT_ERROR)
+    else:
+        cache_metrics.observe_latency(
+            prefix_key, MetricsConf.OP_WRITE, time.perf_counter() - started
+        )
+    return entry
+
+
+def lock_key(cache_key: str) -> str:
+    """Return key of the lock held by the worker filling the cache key."""
+    return f"{CacheConf.LOCK_PREFIX}:{cache_key}"
+
+
+async def acquire_fill_lock(cache_key: str) -> str | None:
+    """Try to become the only worker filling the cache key.
+
+    Returns:
+        Lock token, None if another worker holds the lock. If Redis is
+        unavailable a token is returned, so the caller fills anyway.
+    """
+    token = uuid4().hex
+    redis_client: Redis = await setup_redis_bytes()
+    try:
+        acquired = await redis_client.set(
+            lock_key(cache_key), token, nx=True, px=CacheConf.LOCK_TTL_MS
+        )
+    except aioredis.RedisError as e:
+        logger.error("fill lock acquire failed: %s", e)
+        redis_breaker.record_failure()
+        return token
+    return token if acquired else None
+
+
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+async def release_fill_lock(cache_key: str, token: str) -> None:
+    """Release the lock if it's still held with the token."""
+    redis_client: Redis = await setup_redis_bytes()
+    try:
+        await redis_client.eval(
+            _RELEASE_LOCK_SCRIPT, 1, lock_key(cache_key), token
+        )
+    except aioredis.RedisError as e:
+        logger.error("fill lock release failed, it expires by PX: %s", e)
+        redis_breaker.record_failure()
+
+
+async def wait_for_fill(
+    cache_key: str, encoding: str, namespaces: Sequence[str] = ()
+) -> CachedEntry | None:
+    """Poll for the entry filled by the worker holding the lock.
+
+    Returns:
+        Entry, None if the lock is released or expires without one,
+        or after `CacheConf.LOCK_WAIT` seconds.
+    """
+    redis_client: Redis = await setup_redis_bytes()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + CacheConf.LOCK_WAIT
+    while loop.time() < deadline:
+        await asyncio.sleep(CacheConf.LOCK_POLL_INTERVAL)
+        try:
+            entry, _ = await load_entry(cache_key, encoding, namespaces)
+        except aioredis.RedisError as e:
+            logger.error("wait for fill failed: %s", e)
+            return None
+        if entry is not None:
+            return entry
+        try:
+            if not await redis_client.exists(lock_key(cache_key)):
+                return None
+        except aioredis.RedisError as e:
+            logger.error("fill lock check failed: %s", e)
+            redis_breaker.record_failure()
+            return None
+    return None
+
+
+_inflight: dict[str, asyncio.Future] = {}
+
+
+async def _fill_once(
+    cache_key: str,
+    fill: Callable[[], Awaitable[CachedEntry]],
+    poll: Callable[[], Awaitable[CachedEntry | None]],
+) -> tuple[CachedEntry, str]:
+    token = await acquire_fill_lock(cache_key)
+    if token is None:
+        if (entry := await poll()) is not None:
+            return entry, Headers.X_CACHE_HIT
+        return await fill(), Headers.X_CACHE_MISS
+    try:
+        return await fill(), Headers.X_CACHE_MISS
+    finally:
+        await release_fill_lock(cache_key, token)
+
+
+async def single_flight(
+    cache_key: str,
+    fill: Callable[[], Awaitable[CachedEntry]],
+    poll: Callable[[], Awaitable[CachedEntry | None]],
+) -> tuple[CachedEntry, str]:
+    """Fill a missed cache key once for all concurrent requests.
+
+    Concurrent misses of one worker share one future. Across workers
+    only the holder of a short Redis lock runs `fill`, the others `poll`
+    for its entry. A follower fills itself if the leader gives up.
+
+    Returns:
+        Entry and its X-Cache status.
+    """
+    inflight = _inflight.get(cache_key)
+    if inflight is not None:
+        entry = await asyncio.shield(inflight)
+        if entry is not None:
+            return entry, Headers.X_CACHE_HIT
+        return await fill(), Headers.X_CACHE_MISS
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[cache_key] = future
+    try:
+        entry, status = await _fill_once(cache_key, fill, poll)
+    except Exception as e:
+        future.set_exception(e)
+        # Mark as retrieved, the leader re-raises it.
+        future.exception()
+        raise
+    else:
+        future.set_result(entry)
+        return entry, status
+    finally:
+        del _inflight[cache_key]
+        if not future.done():
+            future.set_result(None)
+
+
+def etag_guard(
+    prefix_key: str,
+    func: Callable,
+    namespaces: Callable[..., Sequence[str]] | None = None,
+    stale_ttl: int = 0,
+) -> Callable:
+    """Return dependency answering 304 before `func`'s dependencies run.
+
+    It reads only the entry's metadata key and the generations, so a
+    conditional GET of a fresh entry doesn't open a DB session. The
+    principal is resolved by the same dependency as in `func`, FastAPI
+    runs it once per request.
+    """
+    principal = inspect.signature(func).parameters.get(Keys.ID_USER)
+
+    async def _guard(request: Request, response: Response, **kwargs) -> None:
+        def _not_modified(etag: str, cache_status: str) -> None:
+            cache_metrics.inc(prefix_key, MetricsConf.EVENT_NOT_MODIFIED)
+            set_response_headers(
+                response=response,
+                etag=etag,
+                cache_status=cache_status,
+                private=kwargs.get(Keys.ID_USER) is not None,
+            )
+            raise HTTPException(
+                status_code=HTTP_304_NOT_MODIFIED,
+                headers=dict(response.headers),
+            )
+
+        if_none_match = request.headers.get(Headers.IF_NONE_MATCH)
+        if request.method != Keys.GET or not if_none_match:
+            return
+        cache_key = get_request_key(
+            prefix_key=prefix_key,
+            func=func,
+            request=request,
+            principal=kwargs.get(Keys.ID_USER),
+        )
+        local_cache = get_local_cache()
+        if local_cache is not None and (entry := local_cache.get(cache_key)):
+            if etag_matches(if_none_match, entry.etag):
+                _not_modified(entry.etag, Headers.X_CACHE_HIT_LOCAL)
+            return
+        if not redis_breaker.allow():
+            return
+        entry_namespaces = (
+            namespaces(**request.path_params, **kwargs) if namespaces else ()
+        )
+        try:
+            (generation, etag, fresh_until), _, stamp = await get_cache(
+                cache_key=cache_key, namespaces=entry_namespaces
+            )
+        except aioredis.RedisError:
+            cache_metrics.inc(prefix_key, MetricsConf.EVENT_ERROR)
+            return
+        if (
+            etag is None
+            or generation != stamp
+            or (
+                stale_ttl
+                and fresh_until is not None
+                and int(fresh_until) <= time.time()
+            )
+        ):
+            # Missed, outdated or stale: the full path handles it.
+            return
+        etag_value = etag.decode(TypeEncoding.UTF8)
+        if etag_matches(if_none_match, etag_value):
+            _not_modified(etag_value, Headers.X_CACHE_HIT)
+
+    parameters = [
+        inspect.Parameter(
+            Keys.REQUEST, inspect.Parameter.KEYWORD_ONLY, annotation=Request
+        ),
+        inspect.Parameter(
+            Keys.RESPONSE, inspect.Parameter.KEYWORD_ONLY, annotation=Response
+        ),
+    ]
+    if principal is not None:
+        parameters.append(
+            principal.replace(kind=inspect.Parameter.KEYWORD_ONLY)
+        )
+    setattr(_guard, "__signature__", inspect.Signature(parameters))
+    return _guard
 
-    def _decorator(func: Callable) -> Callable:
-        return_type = get_typed_return_annotation(func)
 
+def cache_get_response(
+    expire: int,
+    prefix_key: str,
+    namespaces: Callable[..., Sequence[str]] | None = None,
+    stale_ttl: int = 0,
+) -> Callable:
+    """Cache decorator for GET requests.
+
+    A cache entry is a Redis hash: the ETag plus the body compressed with
+    every supported coding, compressed once on miss. The body is built
+    by the `REDIS_CACHE_SERIALIZER` serializer. Hits send the
+    variant negotiated from `Accept-Encoding`, clients without
+    compression get the gzip variant decompressed.
+
+    `namespaces` gets the dependency kwargs and returns the namespaces
+    the response depends on. The entry is stamped with their generations
+    and is a miss once any of them is bumped by a write.
+
+    Concurrent misses of a key run `func` once, see `single_flight`.
+
+    `expire` is the lifetime of the entry in Redis only. Clients get
+    `Cache-Control: no-cache` and revalidate every request by the ETag,
+    responses of a principal are also `private`.
+
+    With `stale_ttl` an entry older than `expire` seconds is still served
+    for `stale_ttl` seconds (X-Cache: STALE) while one background task
+    refreshes it. Bumped generations are never served stale.
+
+    If `REDIS_L1_CACHE` is on, entries are also kept in the worker's
+    memory for `REDIS_L1_TTL` seconds and hits skip Redis entirely.
+
+    Matching `If-None-Match` is answered by `etag_guard`, resolved before
+    the other dependencies. Hence `namespaces` may use only path params
+    and the principal.
+
+    Outcomes, Redis latency and entry sizes are recorded by prefix in
+    `cache_metrics`.
+
+    If Redis fails, responses are served from the DB uncached (X-Cache:
+    BYPASS). After `REDIS_BREAKER_THRESHOLD` failures in a row Redis is
+    skipped, and one request per `REDIS_BREAKER_COOLDOWN` probes it.
+    """
+
+    def _decorator(func: Callable) -> Callable:
         @wraps(func)
         async def _wrapper(*args: Any, **kwargs: Any):
+            kwargs.pop(Keys.ETAG_GUARD, None)
             request: Request = kwargs.get(Keys.REQUEST)
             response: Response = kwargs.get(Keys.RESPONSE)
 
@@ -165,41 +882,133 @@ def cache_get_response(expire: int, prefix_key: str) -> Callable:
                 return await func(*args, **kwargs)
 
             cache_key = get_request_key(
-                prefix_key=prefix_key, func=func, request=request
+                prefix_key=prefix_key,
+                func=func,
+                request=request,
+                principal=kwargs.get(Keys.ID_USER),
             )
 
-            cached_value = await get_cache(cache_key=cache_key)
-
-            if cached_value is None:
-
-                data_response = await func(*args, **kwargs)
-                cached_value = serialize_data(data_response)
-                await set_cache(
-                    cache_key=cache_key, value=cached_value, ex=expire
-                )
-                set_response_headers(response, expire, cached_value)
-
-            else:
-
+            def _send(entry: CachedEntry, cache_status: str) -> Response:
                 set_response_headers(
                     response=response,
-                    exp=expire,
-                    cached_value=cached_value,
-                    update=True,
+                    etag=entry.etag,
+                    cache_status=cache_status,
+                    private=kwargs.get(Keys.ID_USER) is not None,
                 )
-                if check_etag(request=request, response=response):
-                    return Response(status_code=HTTP_304_NOT_MODIFIED)
+                sent = send_cached(request, response, entry)
+                cache_metrics.inc(
+                    prefix_key,
+                    (
+                        MetricsConf.EVENT_NOT_MODIFIED
+                        if sent.status_code == HTTP_304_NOT_MODIFIED
+                        else cache_status
+                    ),
+                )
+                return sent
 
-                data_response = deserialize_data(cached_value, return_type)
+            async def _bypass() -> Any:
+                response.headers[Headers.X_CACHE] = Headers.X_CACHE_BYPASS
+                cache_metrics.inc(prefix_key, Headers.X_CACHE_BYPASS)
+                return await func(*args, **kwargs)
+
+            local_cache = get_local_cache()
+            if local_cache is not None:
+                if entry := local_cache.get(cache_key):
+                    return _send(entry, Headers.X_CACHE_HIT_LOCAL)
+                epoch = local_cache.epoch
+
+            encoding = choose_encoding(
+                accept_encoding=request.headers.get(Headers.ACCEPT_ENCODING),
+                available=available_encodings(),
+            )
+            entry_namespaces = (
+                tuple(namespaces(**kwargs)) if namespaces else ()
+            )
 
-            return JSONResponse(
-                content=data_response.model_dump(),
-                status_code=HTTP_200_OK,
-                media_type=MimeTypes.APPLICATION_JSON,
-                headers=response.headers,
+            if not redis_breaker.allow():
+                return await _bypass()
+            started = time.perf_counter()
+            try:
+                entry, stamp = await load_entry(
+                    cache_key=cache_key,
+                    encoding=encoding,
+                    namespaces=entry_namespaces,
+                )
+            except aioredis.RedisError as e:
+                logger.error("cache read failed, served from DB: %s", e)
+                cache_metrics.inc(prefix_key, MetricsConf.EVENT_ERROR)
+                return await _bypass()
+            cache_metrics.observe_latency(
+                prefix_key, MetricsConf.OP_READ, time.perf_counter() - started
             )
+            cache_status = Headers.X_CACHE_HIT
+
+            def _fill(call_kwargs: dict[str, Any]) -> Awaitable[CachedEntry]:
+                return fill_entry(
+                    cache_key=cache_key,
+                    stamp=stamp,
+                    call=lambda: func(*args, **call_kwargs),
+                    expire=expire,
+                    stale_ttl=stale_ttl,
+                    namespaces=entry_namespaces,
+                    prefix_key=prefix_key,
+                )
+
+            async def _refresh() -> CachedEntry:
+                # The request session is closed once the response is sent.
+                if Keys.SESSION not in kwargs:
+                    return await _fill(kwargs)
+                engine = await get_db_manager()
+                async with engine.get_scoped_session() as session:
+                    return await _fill({**kwargs, Keys.SESSION: session})
+
+            if entry is None:
+                entry, cache_status = await single_flight(
+                    cache_key=cache_key,
+                    fill=lambda: _fill(kwargs),
+                    poll=lambda: wait_for_fill(
+                        cache_key, encoding, entry_namespaces
+                    ),
+                )
+            elif (
+                stale_ttl
+                and entry.fresh_until is not None
+                and entry.fresh_until <= time.time()
+            ):
+                cache_status = Headers.X_CACHE_STALE
+                revalidate_in_background(cache_key, _refresh)
+
+            if local_cache is not None and (
+                cache_status != Headers.X_CACHE_STALE
+            ):
+                local_cache.set(cache_key, entry, epoch)
+            return _send(entry, cache_status)
 
         update_wrapper(_wrapper, func)
+        signature = inspect.signature(func)
+        guard = inspect.Parameter(
+            Keys.ETAG_GUARD,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            annotation=Annotated[
+                None,
+                Depends(
+                    etag_guard(
+                        prefix_key=prefix_key,
+                        func=func,
+                        namespaces=namespaces,
+                        stale_ttl=stale_ttl,
+                    )
+                ),
+            ],
+        )
+        # The guard goes first, FastAPI resolves dependencies in order.
+        setattr(
+            _wrapper,
+            "__signature__",
+            signature.replace(
+                parameters=[guard, *signature.parameters.values()]
+            ),
+        )
         return _wrapper
 
     return _decorator
@@ -0,0 +1,219 @@
+"""
+Home timelines materialized in Redis sorted sets.
+
+Fan-out-on-write: the id of a new tweet is pushed to a bounded ZSET of
+every subscriber of the author, scored by creation time. Only timelines
+already built are pushed to, a missing one is rebuilt from DB on read.
+Authors with more than `REDIS_TIMELINE_CELEBRITY_FOLLOWERS` subscribers
+are not fanned out: they are marked as celebrities and their tweets are
+merged in at read time.
+
+Redis errors are not raised: writes are skipped, a failed read is
+reported as a missing timeline or unknown celebrities.
+
+Functions:
+    timeline_key(id_user): Return timeline key of the user.
+    to_score(created_at): Convert creation time to ZSET score.
+    from_score(score): Convert ZSET score to creation time.
+    fan_out_tweet(id_tweet, created_at, follower_ids): Push tweet to timelines.
+    mark_celebrity(id_author): Exclude author from fan-out.
+    filter_celebrities(authors_ids): Return celebrities among authors.
+    get_timeline(id_user, limit, before): Read page of timeline.
+    fill_timeline(id_user, tweets): Store rebuilt timeline.
+    drop_timeline(id_user): Delete timeline, it's rebuilt on next read.
+
+"""  # noqa E501
+
+import datetime
+import logging
+from typing import Sequence
+
+from redis import asyncio as aioredis
+from redis.asyncio.client import Redis
+
+from src.core.controllers.depends.utils.redis_chash import setup_redis
+from src.core.settings.const import TimelineConf
+from src.core.settings.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def timeline_key(id_user: str) -> str:
+    """Return timeline key of the user."""
+    return f"{TimelineConf.PREFIX}:{id_user}"
+
+
+def to_score(created_at: datetime.datetime) -> float:
+    """Convert creation time (UTC) to ZSET score."""
+    return created_at.replace(tzinfo=datetime.UTC).timestamp()
+
+
+def from_score(score: float) -> datetime.datetime:
+    """Convert ZSET score to naive UTC creation time."""
+    return datetime.datetime.fromtimestamp(score, datetime.UTC).replace(
+        tzinfo=None
+    )
+
+
+_FAN_OUT_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 1 then
+    redis.call("ZADD", KEYS[1], ARGV[1], ARGV[2])
+    redis.call("ZREMRANGEBYRANK", KEYS[1], 0, -tonumber(ARGV[3]) - 1)
+end
+return 0
+"""
+
+
+async def fan_out_tweet(
+    id_tweet: str,
+    created_at: datetime.datetime,
+    follower_ids: Sequence[str],
+    max_len: int = settings.redis.REDIS_TIMELINE_MAX_LEN,
+) -> None:
+    """Push tweet to the built timelines of the author's subscribers.
+
+    Every timeline keeps only `max_len` newest tweets. Missing timelines
+    are left missing, a partial one would hide the older tweets from the
+    rebuild on read. All commands are sent in one pipeline.
+    """
+    redis_client: Redis = await setup_redis()
+    push = redis_client.register_script(_FAN_OUT_SCRIPT)
+    score = to_score(created_at)
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for id_follower in follower_ids:
+                await push(
+                    keys=[timeline_key(id_follower)],
+                    args=[score, id_tweet, max_len],
+                    client=pipe,
+                )
+            await pipe.execute()
+    except aioredis.RedisError as e:
+        logger.error(
+            "fan-out failed, timelines will be rebuilt from DB: %s", e
+        )
+
+
+async def mark_celebrity(id_author: str) -> None:
+    """Exclude author from fan-out, their tweets are merged at read time."""
+    redis_client: Redis = await setup_redis()
+    try:
+        await redis_client.sadd(TimelineConf.CELEBRITIES_KEY, id_author)
+    except aioredis.RedisError as e:
+        logger.error(
+            "mark of celebrity failed, the tweet is missing in timelines"
+            " until rebuild: %s",
+            e,
+        )
+
+
+async def filter_celebrities(
+    authors_ids: Sequence[str],
+) -> list[str] | None:
+    """Return celebrities among the authors, None if Redis failed."""
+    if not authors_ids:
+        return []
+    redis_client: Redis = await setup_redis()
+    try:
+        is_member = await redis_client.smismember(
+            TimelineConf.CELEBRITIES_KEY, list(authors_ids)
+        )
+    except aioredis.RedisError as e:
+        logger.error("celebrities lookup failed: %s", e)
+        return None
+    return [id_ for id_, member in zip(authors_ids, is_member) if member]
+
+
+async def get_timeline(
+    id_user: str,
+    limit: int,
+    before: tuple[datetime.datetime, str] | None = None,
+) -> list[tuple[str, datetime.datetime]] | None:
+    """Read page of the user's timeline, newest first.
+
+    Args:
+        id_user (str): Timeline owner.
+        limit (int): Max number of tweets.
+        before (tuple[datetime, str] | None): `created_at` and `id` of the
+            last tweet of the previous page, only older tweets are returned.
+
+    Returns:
+        list[tuple[str, datetime]] | None: Tweet ids with creation time or
+        None if the timeline isn't materialized yet or Redis failed.
+
+    Notes:
+        Tweets with equal score are ordered by id as in DB. The ones sharing
+        the score of `before` are read separately and the ids up to it are
+        dropped, so the page boundary doesn't skip them.
+    """
+    redis_client: Redis = await setup_redis()
+    key = timeline_key(id_user)
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.exists(key)
+            if before is None:
+                pipe.zrevrangebyscore(
+                    key, "+inf", "-inf", start=0, num=limit, withscores=True
+                )
+            else:
+                score = to_score(before[0])
+                pipe.zrevrangebyscore(key, score, score, withscores=True)
+                pipe.zrevrangebyscore(
+                    key,
+                    f"({score}",
+                    "-inf",
+                    start=0,
+                    num=limit,
+                    withscores=True,
+                )
+            exists, *pages = await pipe.execute()
+    except aioredis.RedisError as e:
+        logger.error("timeline read failed, it will be read from DB: %s", e)
+        return None
+    if not exists:
+        return None
+    items = [item for page in pages for item in page]
+    if before is not None:
+        items = [
+            (id_tweet, score)
+            for id_tweet, score in items
+            if (score, id_tweet) < (to_score(before[0]), before[1])
+        ]
+    return [(id_tweet, from_score(score)) for id_tweet, score in items][:limit]
+
+
+async def fill_timeline(
+    id_user: str,
+    tweets: Sequence[tuple[str, datetime.datetime]],
+    max_len: int = settings.redis.REDIS_TIMELINE_MAX_LEN,
+) -> None:
+    """Store timeline rebuilt from DB."""
+    if not tweets:
+        return
+    redis_client: Redis = await setup_redis()
+    key = timeline_key(id_user)
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.zadd(
+                key,
+                {
+                    id_tweet: to_score(created_at)
+                    for id_tweet, created_at in tweets
+                },
+            )
+            pipe.zremrangebyrank(key, 0, -max_len - 1)
+            await pipe.execute()
+    except aioredis.RedisError as e:
+        logger.error("timeline fill failed, it will be rebuilt on read: %s", e)
+
+
+async def drop_timeline(id_user: str) -> None:
+    """Delete the user's timeline, it's rebuilt on next read.
+
+    Used when the followed users change, as the timeline has no TTL.
+    """
+    redis_client: Redis = await setup_redis()
+    try:
+        await redis_client.delete(timeline_key(id_user))
+    except aioredis.RedisError as e:
+        logger.error("timeline drop failed: %s", e)
@@ -0,0 +1,184 @@
+"""
+Rotation and revocation of refresh tokens.
+
+Every device of a user has one valid refresh token: its `jti` is kept in
+`users_auth_ip` by user and device fingerprint and is replaced on every
+refresh. Used and revoked tokens are marked in Redis until they expire,
+so every worker rejects them without a Postgres query. Postgres stays
+the source of truth: if Redis is down, a replayed token still fails the
+rotation compare-and-set.
+
+Tabs of one browser share the refresh cookie and may refresh at once:
+only one of them rotates the token. The successor of a rotated token is
+kept in Redis for `JWTconf.ROTATED_GRACE_SECONDS`, so the other requests
+get it too instead of being taken for a replay. Within that window a
+stolen token also gets the successor, as with any reuse interval; after
+it, or if Redis is down, reuse ends the device's session.
+
+Functions:
+    device_fingerprint(request): Digest of the client's device fingerprint.
+    new_jti(): New random token id.
+    revoked_key(jti): Redis key of a revoked token.
+    rotated_key(jti): Redis key of the successor of a rotated token.
+    revoke_tokens(jti_list, ttl): Mark tokens as revoked in Redis.
+    is_revoked(jti): Check whether the token is revoked.
+    remember_rotation(jti, next_jti): Keep the successor for the grace window.
+    rotated_to(jti): Successor of a token rotated within the grace window.
+    token_ttl(payload): Seconds the token stays valid.
+    revoke_device(user_id, fingerprint, crud, session): End the device's session.
+
+"""  # noqa E501
+
+import datetime
+import hashlib
+import logging
+import time
+from typing import TYPE_CHECKING, Sequence
+from uuid import uuid4
+
+from fastapi import Request
+from redis import asyncio as aioredis
+from redis.asyncio.client import Redis
+
+from src.core.controllers.depends.utils.redis_chash import setup_redis
+from src.core.settings.const import JWT, Headers, JWTconf, TypeEncoding
+from src.core.settings.settings import settings
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.core.models_orm.crud import Crud
+
+logger = logging.getLogger(__name__)
+
+REFRESH_TTL = int(
+    datetime.timedelta(
+        days=settings.jwt.refresh_token_expire_days
+    ).total_seconds()
+)
+
+
+def device_fingerprint(request: Request) -> str:
+    """Return digest of the client's device fingerprint.
+
+    The `X-Device-Fingerprint` header if the client sends it, otherwise
+    the User-Agent.
+    """
+    fingerprint = request.headers.get(
+        Headers.X_DEVICE_FINGERPRINT
+    ) or request.headers.get(Headers.USER_AGENT, "")
+    return hashlib.blake2b(
+        fingerprint.encode(TypeEncoding.UTF8),
+        digest_size=JWTconf.FINGERPRINT_DIGEST_SIZE,
+    ).hexdigest()
+
+
+def new_jti() -> str:
+    """Return new random token id."""
+    return uuid4().hex
+
+
+def revoked_key(jti: str) -> str:
+    """Return Redis key of a revoked token."""
+    return f"{JWTconf.REVOKED_PREFIX}:{jti}"
+
+
+def rotated_key(jti: str) -> str:
+    """Return Redis key of the successor of a rotated token."""
+    return f"{JWTconf.ROTATED_PREFIX}:{jti}"
+
+
+def token_ttl(payload: dict) -> int:
+    """Return seconds the token stays valid, at least 1."""
+    expire = payload.get(JWT.PAYLOAD_EXPIRE_KEY)
+    if not isinstance(expire, (int, float)):
+        return REFRESH_TTL
+    return max(int(expire - time.time()) + 1, 1)
+
+
+async def revoke_tokens(
+    jti_list: Sequence[str],
+    ttl: int = REFRESH_TTL,
+) -> None:
+    """Mark tokens as revoked until they expire.
+
+    Failures are only logged, the tokens are rejected by Postgres then.
+    """
+    if not jti_list:
+        return
+    redis_client: Redis = await setup_redis()
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for jti in jti_list:
+                pipe.set(revoked_key(jti), 1, ex=ttl)
+            await pipe.execute()
+    except aioredis.RedisError as e:
+        logger.error(
+            "revoke of refresh tokens failed, checked by Postgres: %s", e
+        )
+
+
+async def is_revoked(jti: str) -> bool:
+    """Return whether the token is revoked, False if Redis is down."""
+    redis_client: Redis = await setup_redis()
+    try:
+        return bool(await redis_client.exists(revoked_key(jti)))
+    except aioredis.RedisError as e:
+        logger.error(
+            "revoked check failed, falls back to the rotation in Postgres: %s",
+            e,
+        )
+        return False
+
+
+async def remember_rotation(jti: str, next_jti: str) -> None:
+    """Keep the successor of the rotated token for the grace window.
+
+    Failures are only logged, concurrent refreshes count as reuse then.
+    """
+    redis_client: Redis = await setup_redis()
+    try:
+        await redis_client.set(
+            rotated_key(jti), next_jti, ex=JWTconf.ROTATED_GRACE_SECONDS
+        )
+    except aioredis.RedisError as e:
+        logger.error("save of rotated refresh token failed: %s", e)
+
+
+async def rotated_to(jti: str) -> str | None:
+    """Return successor of the token if it was rotated moments ago.
+
+    None if the grace window is over, the successor was revoked by
+    logout or Redis is down.
+    """
+    redis_client: Redis = await setup_redis()
+    try:
+        next_jti = await redis_client.get(rotated_key(jti))
+        if next_jti is None or await redis_client.exists(
+            revoked_key(next_jti)
+        ):
+            return None
+        return next_jti
+    except aioredis.RedisError as e:
+        logger.error("rotated check failed, counted as reuse: %s", e)
+        return None
+
+
+async def revoke_device(
+    user_id: str,
+    fingerprint: str,
+    crud: "Crud",
+    session: "AsyncSession",
+) -> bool:
+    """End the device's session: forget and revoke its refresh token.
+
+    Returns:
+        bool: False if the DB failed.
+    """
+    jti_list = await crud.auth_users.logout_user(
+        user_id=user_id, fingerprint=fingerprint, session=session
+    )
+    if jti_list is None:
+        return False
+    await revoke_tokens(jti_list)
+    return True
@@ -36,11 +36,11 @@ def http_exception(
     )
 
 
-def raise_http_500_if_none(is_none_result: Optional[bool]) -> None:
+def raise_http_500_if_none(is_none_result: Optional[object]) -> None:
     """Checker None.
 
     Args:
-        - is_none_result (Optional[bool]): result db.
+        - is_none_result (Optional[object]): result db.
     Raise:
         - HTTPException
     Nones:
@@ -0,0 +1,67 @@
+"""In-process cache of verified JWT payloads.
+
+Every worker keeps a small LRU of tokens whose signature was already
+verified, so repeat requests with the same bearer skip the RSA math.
+Tokens are keyed by their digest and dropped at their `exp`.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+
+from src.core.settings.const import JWT, JWTconf, TypeEncoding
+
+
+def token_digest(token: str | bytes) -> bytes:
+    """Return digest of the token, raw tokens aren't kept in memory."""
+    if isinstance(token, str):
+        token = token.encode(TypeEncoding.UTF8)
+    return hashlib.blake2b(
+        token, digest_size=JWTconf.VERIFIED_CACHE_DIGEST_SIZE
+    ).digest()
+
+
+class VerifiedTokenCache:
+    """LRU of verified token payloads of one worker process.
+
+    Notes:
+        Not thread-safe, it's meant for one event loop. Payloads are
+        copied on `get`, callers may change them.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """Init empty cache."""
+        self.max_entries = max_entries
+        self._entries: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return number of entries."""
+        return len(self._entries)
+
+    def get(self, token: str | bytes) -> dict | None:
+        """Return payload of the verified token, None if it has expired."""
+        key = token_digest(token)
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, payload = item
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return payload.copy()
+
+    def set(self, token: str | bytes, payload: dict) -> None:
+        """Store payload of the verified token until its `exp`."""
+        expires_at = payload.get(JWT.PAYLOAD_EXPIRE_KEY)
+        if not self.max_entries or not isinstance(expires_at, (int, float)):
+            return
+        key = token_digest(token)
+        self._entries[key] = (expires_at, payload.copy())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
@@ -0,0 +1,85 @@
+"""Metrics and admin routes.
+
+Routes:
+    - GET /api/metrics
+    - GET /api/admin/cache
+"""
+
+from typing import Annotated, Sequence
+
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import PlainTextResponse
+
+from src.core.controllers.depends.auth.check_metrics_token import (
+    check_metrics_token,
+)
+from src.core.controllers.depends.metrics.cache_stats import (
+    get_cache_keyspace,
+    get_cache_metrics,
+)
+from src.core.settings.const import MimeTypes, ResponseError
+from src.core.settings.routes_path import MetricsRoutes
+from src.core.validators import CacheKeyspace
+
+
+def create_metrics_route() -> APIRouter:
+    """Create metrics' routes.
+
+    Return:
+        APIRouter: tags ["Metrics"], prefix: "/api"
+    """
+    return APIRouter(
+        tags=[MetricsRoutes.TAG],
+    )
+
+
+metrics: APIRouter = create_metrics_route()
+metrics_depend: Sequence[Depends] = [Depends(check_metrics_token)]
+
+
+@metrics.get(
+    path=MetricsRoutes.METRICS,
+    status_code=status.HTTP_200_OK,
+    dependencies=metrics_depend,
+    response_class=PlainTextResponse,
+    responses=ResponseError.responses,
+)
+async def get_metrics(
+    data: Annotated[str, Depends(get_cache_metrics)]
+) -> PlainTextResponse:
+    """
+    Return cache metrics in the Prometheus text format.
+
+    **Headers**:
+    - X-Metrics-Token (str): Value of `METRICS_TOKEN`.
+
+    **Notes**:
+    - Every worker keeps its own metrics, the `pid` label tells them apart.
+    - Routes are disabled (404) if `METRICS_TOKEN` isn't set.
+    """
+    return PlainTextResponse(
+        content=data, media_type=MimeTypes.PROMETHEUS_TEXT
+    )
+
+
+@metrics.get(
+    path=MetricsRoutes.ADMIN_CACHE,
+    status_code=status.HTTP_200_OK,
+    dependencies=metrics_depend,
+    responses=ResponseError.responses,
+)
+async def get_admin_cache(
+    keyspace: Annotated[CacheKeyspace, Depends(get_cache_keyspace)]
+) -> CacheKeyspace:
+    """
+    Return Redis memory by key prefix, to size Redis memory.
+
+    **Headers**:
+    - X-Metrics-Token (str): Value of `METRICS_TOKEN`.
+
+    **Notes**:
+    - Keys are counted with SCAN and sampled with MEMORY USAGE, so
+      `estimated_bytes` is an estimate. `complete` is false if the
+      keyspace is larger than the scan limit.
+    """
+    return keyspace
@@ -0,0 +1,36 @@
+"""GET /tweets/export."""
+
+from typing import Annotated, AsyncIterator
+
+from fastapi import Depends
+from fastapi.responses import StreamingResponse
+
+from src.core.controllers.depends.tweets.get_tweets import get_tweets_stream
+from src.core.settings.const import MimeTypes
+
+
+async def export_tweets(
+    tweets: Annotated[AsyncIterator[bytes], Depends(get_tweets_stream)]
+) -> StreamingResponse:
+    """
+        Stream all tweets, newest first, for admin and export clients.
+
+        **Headers**:
+        - Authorization: Bearer `access_token` (str): User key authentication.
+
+        **Query Parameters**:
+        - `limit (int)`: Max number of tweets, 10000 at most and by default.
+        - `cursor (str)`: Opaque `next_cursor` value, start after that tweet.
+
+        **Response**:
+        - Same JSON object as `GET /api/tweets`, `next_cursor` is null
+          when there are no more tweets.
+
+    **Notes**:
+    - The body is streamed while tweets are read from the database, the
+      response is never cached.
+    - A body cut off before the closing bracket means the export failed.
+    """  # noqa E501
+    return StreamingResponse(
+        content=tweets, media_type=MimeTypes.APPLICATION_JSON
+    )
@@ -0,0 +1,34 @@
+"""GET /tweets/feed."""
+
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.core.controllers.depends.tweets.get_tweets import (
+    get_home_tweets_data,
+)
+from src.core.validators import GetAllTweets
+
+
+async def get_home_tweets(
+    tweets: Annotated["GetAllTweets", Depends(get_home_tweets_data)]
+) -> GetAllTweets:
+    """
+        Get home timeline: tweets of followed users ranked by popularity.
+
+        **Headers**:
+        - Authorization: Bearer `access_token` (str): User key authentication.
+
+        **Query Parameters**:
+        - `limit (int)`: Max number of tweets on the page (default 20, max 100).
+        - `cursor (str)`: Opaque `next_cursor` value from the previous page.
+
+        **Response**:
+        - Same JSON object as `GET /api/tweets`.
+
+    **Notes**:
+    - Tweets are ordered by popularity (likes decayed by age), then newest
+      first. Scores are refreshed by a background job every few minutes.
+    - Only tweets of users the current user follows are returned.
+    """  # noqa E501
+    return tweets
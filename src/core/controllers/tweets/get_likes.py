@@ -0,0 +1,38 @@
+"""GET /tweets/{id}/likes."""
+
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.core.controllers.depends.tweets.like import get_likes
+from src.core.validators import GetLikes
+
+
+async def get_likes_by_id(
+    likes: Annotated["GetLikes", Depends(get_likes)]
+) -> GetLikes:
+    """
+        Get users who liked a tweet, newest first.
+
+        **Headers**:
+        - Authorization: Bearer `access_token` (str): User key authentication.
+
+        **Path Parameters**:
+        - `tweet_id (str)`: The ID of the tweet.
+
+        **Query Parameters**:
+        - `limit (int)`: Max number of likes on the page (default 20, max 100).
+        - `cursor (str)`: Opaque `next_cursor` value from the previous page.
+
+        **Response Fields**:
+        - `result (bool)`: Indicates if the request was successful.
+        - `likes (List[dict])`: Users who liked the tweet, each containing:
+            - `user_id (str)`: Unique identifier of the user.
+            - `name (str)`: Name of the user.
+        - `next_cursor (str | null)`: Cursor of the next page, null on last page.
+
+    **Notes**:
+    - Feeds carry `like_count` and only the most recent likes of a tweet,
+      this route returns the full list page by page.
+    """  # noqa E501
+    return likes
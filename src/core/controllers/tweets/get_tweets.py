@@ -19,7 +19,8 @@ async def get_tweets(
         - If-None-Match: (str) ETag value for cache validation.
 
         **Query Parameters**:
-        - No query parameters are required for this endpoint.
+        - `limit (int)`: Max number of tweets on the page (default 20, max 100).
+        - `cursor (str)`: Opaque `next_cursor` value from the previous page.
 
         **Response**:
         - A JSON object containing the list of tweets and their details.
@@ -33,13 +34,16 @@ async def get_tweets(
             - `author (dict)`: Tweet author's information:
                 - `id (str)`: Unique identifier of the author.
                 - `name (str)`: Name of the author.
-            - `likes (List[dict])`: Users who liked the tweet, each containing:
+            - `like_count (int)`: Number of likes of the tweet.
+            - `likes (List[dict])`: Up to 3 most recent likes, each containing:
                 - `user_id (str)`: Unique identifier of the user.
                 - `name (str)`: Name of the user.
+        - `next_cursor (str | null)`: Cursor of the next page, null on last page.
 
     **Notes**:
-    - The `likes` field contains user data for those who liked the tweet.
+    - The `likes` field is capped, see `GET /api/tweets/{id}/likes`.
     - Attachments are optional and may include media files uploaded by the user.
+    - Tweets are ordered newest first; pass `next_cursor` back as `cursor`.
     """  # noqa E501
 
     # TODO: Add log INFO: GET BEFORE CHASH DATA
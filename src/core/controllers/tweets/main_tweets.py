@@ -3,6 +3,9 @@
 Routes:
     - del_like_tweet_by_id()
     - del_tweet_by_id()
+    - export_tweets()
+    - get_likes_by_id()
+    - get_home_tweets()
     - get_tweets()
     - post_like_by_id()
     - post_new_tweet()
@@ -12,17 +15,26 @@ import http
 from typing import Sequence
 
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer
 
 from src.core.controllers.depends.auth.check_token import token_is_alive
 from src.core.controllers.tweets.del_like import del_like
 from src.core.controllers.tweets.del_tweet import del_tweet_by_id
+from src.core.controllers.tweets.export_tweets import export_tweets
+from src.core.controllers.tweets.get_home_tweets import get_home_tweets
+from src.core.controllers.tweets.get_likes import get_likes_by_id
 from src.core.controllers.tweets.get_tweets import get_tweets
 from src.core.controllers.tweets.post_like import post_like_by_id
 from src.core.controllers.tweets.post_new_tweet import post_new_tweet
 from src.core.settings.const import ResponseError, ResponsesGetTweets
 from src.core.settings.routes_path import TweetsRoutes
-from src.core.validators import GetAllTweets, ReturnNewTweet, StatusResponse
+from src.core.validators import (
+    GetAllTweets,
+    GetLikes,
+    ReturnNewTweet,
+    StatusResponse,
+)
 
 
 def create_tweets_route() -> APIRouter:
@@ -87,6 +99,36 @@ tweets.add_api_route(
     responses=ResponsesGetTweets.responses,
 )
 
+tweets.add_api_route(
+    endpoint=get_home_tweets,
+    methods=[http.HTTPMethod.GET],
+    status_code=status.HTTP_200_OK,
+    path=TweetsRoutes.TWEETS_FEED,
+    response_model=GetAllTweets,
+    dependencies=common_depends,
+    responses=ResponseError.responses,
+)
+
+tweets.add_api_route(
+    endpoint=export_tweets,
+    methods=[http.HTTPMethod.GET],
+    status_code=status.HTTP_200_OK,
+    path=TweetsRoutes.TWEETS_EXPORT,
+    response_class=StreamingResponse,
+    dependencies=common_depends,
+    responses=ResponseError.responses,
+)
+
+tweets.add_api_route(
+    endpoint=get_likes_by_id,
+    methods=[http.HTTPMethod.GET],
+    status_code=status.HTTP_200_OK,
+    path=TweetsRoutes.TWEETS_ID_LIKES,
+    response_model=GetLikes,
+    dependencies=common_depends,
+    responses=ResponseError.responses,
+)
+
 tweets.add_api_route(
     endpoint=del_like,
     methods=[http.HTTPMethod.DELETE],
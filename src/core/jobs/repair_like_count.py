@@ -0,0 +1,65 @@
+"""Repair job for tweets.like_count.
+
+Recompute the denormalized `like_count` from `likes` in batches of tweets,
+one short transaction per batch.
+
+Run:
+    python -m src.core.jobs.repair_like_count
+"""
+
+import asyncio
+import logging
+
+from src.core.controllers.depends.utils.connect_db import disconnect_db
+from src.core.controllers.depends.utils.redis_chash import bump_generations
+from src.core.models_orm.crud import create_crud_helper
+from src.core.models_orm.engine_conf import get_engine
+from src.core.settings.const import CacheConf, JobsConf
+from src.core.settings.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def repair_like_counts(batch_size: int = JobsConf.BATCH_SIZE) -> int:
+    """Recompute like_count of all tweets.
+
+    Args:
+        batch_size (int): Number of tweets per transaction.
+
+    Returns:
+        int: Number of tweets whose like_count was fixed.
+    """
+    crud = create_crud_helper()
+    engine = await get_engine(
+        url=settings.db.get_url_database, echo=settings.db.ECHO
+    )
+    after_id, fixed_total = None, 0
+
+    async with engine.get_scoped_session() as session:
+        while True:
+            result = await crud.tweets.repair_like_counts(
+                session=session, after_id=after_id, batch_size=batch_size
+            )
+            if result is None:
+                logger.error("like_count batch after %s failed", after_id)
+                break
+            after_id, fixed = result
+            fixed_total += fixed
+            if after_id is None:
+                break
+
+    if fixed_total:
+        await bump_generations(CacheConf.NAMESPACE_FEED)
+    return fixed_total
+
+
+async def main() -> None:
+    """Run repair job and close db connections."""
+    fixed = await repair_like_counts()
+    logger.info("like_count fixed for %d tweets", fixed)
+    await disconnect_db()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,74 @@
+"""Scoring job for tweets.score.
+
+Periodically recompute the time-decayed popularity score of recent tweets
+in batches, one short transaction per batch, and reset scores of tweets
+that left the scoring window. The home timeline is ordered by this score.
+
+Scores move only when the job runs, so a home timeline cursor stays exact
+for `ScoreConf.INTERVAL_SECONDS`. A scroll across a run may skip or repeat
+tweets whose score crossed the cursor, see `Tweets.get_home_tweets`.
+
+Run:
+    python -m src.core.jobs.update_scores
+"""
+
+import asyncio
+import logging
+
+from src.core.controllers.depends.utils.connect_db import disconnect_db
+from src.core.models_orm.crud import create_crud_helper
+from src.core.models_orm.engine_conf import get_engine
+from src.core.settings.const import JobsConf, ScoreConf
+from src.core.settings.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def update_scores(batch_size: int = JobsConf.BATCH_SIZE) -> int:
+    """Recompute score of all recent tweets once.
+
+    Args:
+        batch_size (int): Number of tweets per transaction.
+
+    Returns:
+        int: Number of scored tweets.
+    """
+    crud = create_crud_helper()
+    engine = await get_engine(
+        url=settings.db.get_url_database, echo=settings.db.ECHO
+    )
+    after, updated_total = None, 0
+
+    async with engine.get_scoped_session() as session:
+        expired = await crud.tweets.expire_scores(session=session)
+        if expired is None:
+            logger.error("expire of scores failed")
+        while True:
+            result = await crud.tweets.update_scores(
+                session=session, after=after, batch_size=batch_size
+            )
+            if result is None:
+                logger.error("score batch after %s failed", after)
+                break
+            after, updated = result
+            updated_total += updated
+            if after is None:
+                break
+
+    return updated_total
+
+
+async def main(interval: int = ScoreConf.INTERVAL_SECONDS) -> None:
+    """Run scoring job every `interval` seconds."""
+    try:
+        while True:
+            updated = await update_scores()
+            logger.info("score updated for %d tweets", updated)
+            await asyncio.sleep(interval)
+    finally:
+        await disconnect_db()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -3,7 +3,8 @@
 import abc
 import uuid
 
-from sqlalchemy import bindparam, insert, select
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.models_orm.crud_models.utils.catcher_errors import (
@@ -11,6 +12,7 @@ from src.core.models_orm.crud_models.utils.catcher_errors import (
 )
 from src.core.models_orm.models.auth import UsersAuthORM
 from src.core.models_orm.models.user_orm import UserORM
+from src.core.models_orm.models.users_auth_ip import UsersAuthIPORM
 
 
 class _AuthInterface(abc.ABC):
@@ -23,18 +25,58 @@ class _AuthInterface(abc.ABC):
         email: str,
         session: AsyncSession,
         auth_user: UsersAuthORM,
+        user_table: UserORM,
     ) -> tuple:
         """Login exist user.
 
         Returns:
-          str: user pwd if user exists, None otherwise.
+          tuple: hashed password, user id and name if user exists,
+            Nones otherwise.
         """
         pass
 
     @staticmethod
     @abc.abstractmethod
-    async def logout_user(session: AsyncSession, user_id: dict) -> bool:
-        """Logout."""
+    async def logout_user(
+        user_id: str,
+        fingerprint: str,
+        session: AsyncSession,
+        table: UsersAuthIPORM,
+    ) -> list[str] | None:
+        """Forget the device's refresh token.
+
+        Returns:
+            list[str]: jti of the deleted refresh tokens.
+        """
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    async def save_refresh_token(
+        user_id: str,
+        fingerprint: str,
+        jti: str,
+        session: AsyncSession,
+        table: UsersAuthIPORM,
+    ) -> bool | None:
+        """Store the device's new refresh token."""
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    async def rotate_refresh_token(
+        user_id: str,
+        fingerprint: str,
+        old_jti: str,
+        new_jti: str,
+        session: AsyncSession,
+        table: UsersAuthIPORM,
+    ) -> bool | None:
+        """Replace the device's current refresh token.
+
+        Returns:
+            bool: False if `old_jti` isn't the current token.
+        """
         pass
 
     @staticmethod
@@ -122,29 +164,109 @@ class AuthUsers(_AuthInterface):
         email: str,
         session: AsyncSession,
         auth_user=UsersAuthORM,
+        user_table=UserORM,
     ) -> tuple:
         """Login exist user.
 
+        One select by the unique (indexed) email, joined with the user's
+        name, so login takes a single DB round trip.
+
         Returns:
-          str: user pwd if user exists, None otherwise.
+          tuple: hashed password, user id and name if user exists,
+            Nones otherwise.
         """
-        if _ := await cls.if_exist_email(email=email, session=session):
-            user: UsersAuthORM = await session.scalar(
-                statement=(
-                    select(auth_user).where(
-                        auth_user.email == bindparam("email")
-                    )
-                ),
-                params=[{"email": email}],
-            )
-            return user.hashed_password, user.user_id
-
-        return None, None
+        result = await session.execute(
+            statement=(
+                select(
+                    auth_user.hashed_password,
+                    auth_user.user_id,
+                    user_table.name,
+                )
+                .join(user_table, user_table.id == auth_user.user_id)
+                .where(auth_user.email == bindparam("email"))
+            ),
+            params={"email": email},
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None, None, None
+        return tuple(row)
 
     @staticmethod
+    @catch_orm_critical_err
     async def logout_user(
+        user_id: str,
+        fingerprint: str,
         session: AsyncSession,
-        user_id: dict,
-    ) -> bool:
-        """Logout."""
-        return True  # TODO: Implement logic
+        table=UsersAuthIPORM,
+    ) -> list[str] | None:
+        """Forget the device's refresh token.
+
+        Returns:
+            list[str]: jti of the deleted refresh tokens, to be revoked.
+        """
+        deleted = await session.scalars(
+            delete(table)
+            .where(table.user_id == user_id)
+            .where(table.fingerprint == fingerprint)
+            .returning(table.refresh_token)
+        )
+        jti_list = list(deleted)
+        await session.commit()
+        return jti_list
+
+    @staticmethod
+    @catch_orm_critical_err
+    async def save_refresh_token(
+        user_id: str,
+        fingerprint: str,
+        jti: str,
+        session: AsyncSession,
+        table=UsersAuthIPORM,
+    ) -> bool | None:
+        """Store the device's new refresh token, replacing the old one.
+
+        Returns:
+            bool
+        """
+        stmt = pg_insert(table).values(
+            user_id=user_id, fingerprint=fingerprint, refresh_token=jti
+        )
+        await session.execute(
+            stmt.on_conflict_do_update(
+                constraint="uq_users_auth_ip_user_id_fingerprint",
+                set_={table.refresh_token: stmt.excluded.refresh_token},
+            )
+        )
+        await session.commit()
+        return True
+
+    @staticmethod
+    @catch_orm_critical_err
+    async def rotate_refresh_token(
+        user_id: str,
+        fingerprint: str,
+        old_jti: str,
+        new_jti: str,
+        session: AsyncSession,
+        table=UsersAuthIPORM,
+    ) -> bool | None:
+        """Replace the device's current refresh token.
+
+        Compare-and-set in one statement, so of concurrent requests with
+        the same token only one rotates it.
+
+        Returns:
+            bool: False if `old_jti` isn't the device's current token,
+                i.e. it was already used or the device logged out.
+        """
+        rotated = await session.scalar(
+            update(table)
+            .where(table.user_id == user_id)
+            .where(table.fingerprint == fingerprint)
+            .where(table.refresh_token == old_jti)
+            .values(refresh_token=new_jti)
+            .returning(table.id)
+        )
+        await session.commit()
+        return rotated is not None
@@ -2,17 +2,119 @@
 
 import abc
 import uuid
-from typing import Any, Sequence
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Sequence
 
-from sqlalchemy import Row, RowMapping, Select, delete, select
+from sqlalchemy import (
+    ARRAY,
+    UUID,
+    ColumnElement,
+    Row,
+    RowMapping,
+    Select,
+    Text,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    true,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from src.core.models_orm.crud_models.utils.catcher_errors import (
     catch_orm_critical_err,
 )
+from src.core.models_orm.models.followers_orm import FollowersORM
 from src.core.models_orm.models.likes_models import LikesORM
+from src.core.models_orm.models.media_orm import MediaORM
 from src.core.models_orm.models.tweet_orm import TweetsORM
+from src.core.models_orm.models.user_orm import UserORM
+from src.core.settings.const import LikesConf, PaginationConf, ScoreConf
+
+EMPTY_JSON_ARRAY = literal_column("'[]'::json")
+
+
+def _json_object(**fields: Any) -> ColumnElement[Any]:
+    """Return json_build_object() with literal keys."""
+    args: list[Any] = []
+    for key, value in fields.items():
+        args.extend((literal_column(f"'{key}'"), value))
+    return func.json_build_object(*args)
+
+
+def _keyset_before(columns: Sequence[Any], cursor: Sequence[Any]) -> Any:
+    """Return `(columns) < (cursor)` with cursor bound as `columns` types.
+
+    Untyped, a tweet id is bound as VARCHAR and PostgreSQL has no
+    `uuid < varchar` operator.
+    """
+    return tuple_(*columns) < tuple_(
+        *cursor, types=[column.type for column in columns]
+    )
+
+
+def _keyset_after(columns: Sequence[Any], cursor: Sequence[Any]) -> Any:
+    """Return `(columns) > (cursor)`, see `_keyset_before`."""
+    return tuple_(*columns) > tuple_(
+        *cursor, types=[column.type for column in columns]
+    )
+
+
+def _recent_like_ids(
+    tweet_id: Any, model_like: LikesORM = LikesORM
+) -> Select[Any]:
+    """Return ids of the newest `LikesConf.FEED_LIKES` likes of a tweet."""
+    recent_like = aliased(model_like, name="recent_like")
+    return (
+        select(recent_like.like_id)
+        .where(recent_like.tweet_id == tweet_id)
+        .order_by(recent_like.like_id.desc())
+        .limit(LikesConf.FEED_LIKES)
+        .correlate_except(recent_like)
+    )
+
+
+async def _load_recent_likes(
+    session: AsyncSession,
+    tweets: Sequence[TweetsORM],
+    model_tweets: TweetsORM = TweetsORM,
+    model_like: LikesORM = LikesORM,
+) -> None:
+    """
+    Set `tweet.likes` to the newest likes only.
+
+    `selectinload(TweetsORM.likes)` loads every like of every tweet, so a
+    viral tweet makes the whole page heavy. Here each tweet gets at most
+    `LikesConf.FEED_LIKES` likes: one LATERAL query, an index range scan
+    over (tweet_id, like_id) per tweet.
+    """
+    if not tweets:
+        return
+    recent = _recent_like_ids(model_tweets.id, model_like).lateral("recent")
+    likes = await session.scalars(
+        select(model_like)
+        .select_from(model_tweets)
+        .join(recent, true())
+        .join(model_like, model_like.like_id == recent.c.like_id)
+        .options(selectinload(model_like.user))
+        .where(model_tweets.id.in_([tweet.id for tweet in tweets]))
+        .order_by(model_like.like_id.desc())
+    )
+    by_tweet: defaultdict[Any, list[LikesORM]] = defaultdict(list)
+    for like in likes:
+        by_tweet[like.tweet_id].append(like)
+    for tweet in tweets:
+        set_committed_value(tweet, "likes", by_tweet[tweet.id])
 
 
 class _TweetInterface(abc.ABC):
@@ -41,6 +143,37 @@ class _TweetInterface(abc.ABC):
         """Delete like for tweet by id tweet."""
         pass
 
+    @staticmethod
+    @abc.abstractmethod
+    async def repair_like_counts(
+        session: AsyncSession,
+        after_id: str | None,
+        batch_size: int,
+        model_tweets: "TweetsORM",
+    ) -> tuple[str | None, int] | None:
+        """Recompute like_count for one batch of tweets."""
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    async def update_scores(
+        session: AsyncSession,
+        after: tuple[datetime, str] | None,
+        batch_size: int,
+        model_tweets: "TweetsORM",
+    ) -> tuple[tuple[datetime, str] | None, int] | None:
+        """Recompute popularity score for a batch of recent tweets."""
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    async def expire_scores(
+        session: AsyncSession,
+        model_tweets: "TweetsORM",
+    ) -> int | None:
+        """Reset popularity score of tweets out of the scoring window."""
+        pass
+
     @staticmethod
     @abc.abstractmethod
     async def post_tweet(
@@ -49,7 +182,7 @@ class _TweetInterface(abc.ABC):
         content_test: str,
         content_media_ids: list[int],
         table=TweetsORM,
-    ) -> str | None:
+    ) -> tuple[str, datetime] | None:
         """Create new tweet."""
         pass
 
@@ -66,8 +199,105 @@ class _TweetInterface(abc.ABC):
 
     @staticmethod
     @abc.abstractmethod
-    async def get_tweets(session: AsyncSession, model: "TweetsORM") -> None:
-        """Create like for tweet by id tweet."""
+    async def get_tweets(
+        session: AsyncSession,
+        limit: int,
+        cursor: tuple[datetime, str] | None,
+        model: "TweetsORM",
+    ) -> None:
+        """Return page of tweets after cursor."""
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    def stream_tweets(
+        session: AsyncSession,
+        cursor: tuple[datetime, str] | None = None,
+        limit: int | None = None,
+        batch_size: int = PaginationConf.STREAM_BATCH_SIZE,
+        model_tweets: TweetsORM = TweetsORM,
+        model_like: LikesORM = LikesORM,
+    ) -> AsyncIterator[Sequence[TweetsORM]]:
+        """Return tweets newest first in batches from server-side cursor."""
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    async def get_tweets_json(
+        session: AsyncSession,
+        limit: int,
+        cursor: tuple[datetime, str] | None,
+        model_tweets: "TweetsORM",
+    ) -> tuple[str, int, datetime | None, str | None] | None:
+        """Return page of tweets as JSON built by the database."""
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    async def get_home_tweets(
+        session: AsyncSession,
+        id_user: str,
+        limit: int,
+        cursor: tuple[float, datetime, str] | None,
+        model_tweets: "TweetsORM",
+    ) -> None:
+        """Return page of followed users' tweets ranked by popularity."""
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    async def get_tweets_by_ids(
+        session: AsyncSession,
+        ids: Sequence[str],
+        model_tweets: "TweetsORM",
+    ) -> None:
+        """Return tweets by ids."""
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    async def get_authors_tweets(
+        session: AsyncSession,
+        authors_ids: Sequence[str],
+        limit: int,
+        cursor: tuple[datetime, str] | None,
+        model_tweets: "TweetsORM",
+    ) -> None:
+        """Return page of the authors' tweets after cursor."""
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    async def get_authors_tweet_keys(
+        session: AsyncSession,
+        authors_ids: Sequence[str],
+        limit: int,
+        model_tweets: "TweetsORM",
+    ) -> None:
+        """Return ids and creation time of the authors' newest tweets."""
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    async def get_liked_tweet_ids(
+        session: AsyncSession,
+        id_user: str,
+        ids: Sequence[str],
+        model_like: "LikesORM",
+    ) -> set[str] | None:
+        """Return ids of the given tweets liked by the user."""
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    async def get_tweet_likes(
+        session: AsyncSession,
+        id_tweet: str,
+        limit: int,
+        cursor: int | None,
+        model_like: "LikesORM",
+    ) -> None:
+        """Return page of the tweet's likes after cursor."""
         pass
 
 
@@ -81,6 +311,7 @@ class Tweets(_TweetInterface):
         id_tweet: str,
         id_user: str,
         like_table=LikesORM,
+        table_tweet=TweetsORM,
     ) -> bool | None:
         """
         Create like for a tweet.
@@ -90,28 +321,41 @@ class Tweets(_TweetInterface):
             id_tweet (str): Tweet ID.
             id_user (str): User ID.
             like_table (LikesORM()): Like model.
+            table_tweet (TweetsORM): Tweet model.
 
         Returns:
-            bool | None: Success status.
+            bool | None: Success status, False if the tweet doesn't exist.
+
+        Notes:
+            `like_count` is incremented first: the UPDATE locks the tweet
+            row, so concurrent likes of the same tweet are serialized and
+            the duplicate check below sees committed likes.
         """
         like_exist = (
-            select(like_table)
+            select(like_table.like_id)
             .where(like_table.user_id == id_user)
             .where(like_table.tweet_id == id_tweet)
         )
+        increment_count = (
+            update(table_tweet)
+            .where(table_tweet.id == id_tweet)
+            .values(like_count=table_tweet.like_count + 1)
+        )
         conn = await session.begin()
 
-        if _ := await conn.session.scalar(like_exist) is not None:
-
-            like_post = like_table(tweet_id=id_tweet, user_id=id_user)
-
-            session.add(like_post)
-
-            await conn.commit()
+        updated = await conn.session.execute(statement=increment_count)
+        if updated.rowcount == 0:
+            await conn.rollback()
+            return False
 
+        if await conn.session.scalar(like_exist) is not None:
+            await conn.rollback()
             return True
 
-        return False
+        conn.session.add(like_table(tweet_id=id_tweet, user_id=id_user))
+        await conn.commit()
+
+        return True
 
     @staticmethod
     @catch_orm_critical_err
@@ -120,6 +364,7 @@ class Tweets(_TweetInterface):
         id_tweet: str,
         id_user: str,
         like_table=LikesORM,
+        table_tweet=TweetsORM,
     ) -> bool | None:
         """
         Delete like for a tweet.
@@ -129,6 +374,7 @@ class Tweets(_TweetInterface):
             id_tweet (str): Tweet ID.
             id_user (str): User ID.
             like_table (LikesORM): Like model.
+            table_tweet (TweetsORM): Tweet model.
 
         Returns:
             bool | None: Success status.
@@ -137,9 +383,16 @@ class Tweets(_TweetInterface):
             delete(like_table)
             .where(like_table.tweet_id == id_tweet)
             .where(like_table.user_id == id_user)
+            .returning(like_table.like_id)
         )
         conn = await session.begin()
-        await conn.session.execute(statement=stmt)
+        deleted = (await conn.session.execute(statement=stmt)).all()
+        if deleted:
+            await conn.session.execute(
+                statement=update(table_tweet)
+                .where(table_tweet.id == id_tweet)
+                .values(like_count=table_tweet.like_count - len(deleted))
+            )
         await conn.commit()
 
         return True
@@ -152,7 +405,7 @@ class Tweets(_TweetInterface):
         content_test: str,
         content_media_ids: list[int],
         table=TweetsORM,
-    ) -> str | None:
+    ) -> tuple[str, datetime] | None:
         """
         Create new tweet.
 
@@ -164,16 +417,19 @@ class Tweets(_TweetInterface):
             table (TweetsORM()): Tweet model.
 
         Returns:
-            str | None: New tweet ID.
+            tuple[str, datetime] | None: New tweet ID and its `created_at`
+            set by DB.
         """
-        new_tweet = table(
-            id=uuid.uuid4().hex, content=content_test, author=user_id
-        )
+        id_tweet = uuid.uuid4().hex
         con = await session.begin()
-        session.add(new_tweet)
+        created_at = await session.scalar(
+            insert(table)
+            .values(id=id_tweet, content=content_test, author=user_id)
+            .returning(table.created_at)
+        )
         await con.commit()
 
-        return new_tweet.id
+        return id_tweet, created_at
 
     @staticmethod
     @catch_orm_critical_err
@@ -209,24 +465,643 @@ class Tweets(_TweetInterface):
     @catch_orm_critical_err
     async def get_tweets(
         session: AsyncSession,
+        limit: int,
+        cursor: tuple[datetime, str] | None = None,
         model_tweets: TweetsORM = TweetsORM,
         model_like: LikesORM = LikesORM,
     ) -> Sequence[Row[Any] | RowMapping | Any] | None:
         """
-        Get all tweets.
+        Get page of tweets, newest first.
 
         Args:
             session (AsyncSession): Database session.
+            limit (int): Max number of tweets.
+            cursor (tuple[datetime, str] | None): `created_at` and `id` of
+                the last tweet of the previous page.
             model_tweets (TweetsORM): Tweet model.
             model_like (LikesORM): Like model.
 
         Returns:
             Sequence[Row | RowMapping | Any] | None: List of tweets.
+
+        Notes:
+            Keyset pagination over index (created_at, id): each page is an
+            index range scan, its cost doesn't depend on the page number.
+        """
+        query: Select[Any] = (
+            select(model_tweets)
+            .options(
+                selectinload(model_tweets.attachments),
+                selectinload(model_tweets.owner),
+            )
+            .order_by(model_tweets.created_at.desc(), model_tweets.id.desc())
+            .limit(limit)
+        )
+        if cursor is not None:
+            query = query.where(
+                _keyset_before(
+                    (model_tweets.created_at, model_tweets.id), cursor
+                )
+            )
+        tweets = (await session.scalars(query)).all()
+        await _load_recent_likes(session, tweets, model_tweets, model_like)
+        return tweets
+
+    @staticmethod
+    async def stream_tweets(
+        session: AsyncSession,
+        cursor: tuple[datetime, str] | None = None,
+        limit: int | None = None,
+        batch_size: int = PaginationConf.STREAM_BATCH_SIZE,
+        model_tweets: TweetsORM = TweetsORM,
+        model_like: LikesORM = LikesORM,
+    ) -> AsyncIterator[Sequence[TweetsORM]]:
+        """
+        Yield tweets, newest first, in batches from a server-side cursor.
+
+        Args:
+            session (AsyncSession): Database session.
+            cursor (tuple[datetime, str] | None): `created_at` and `id` of
+                the last already received tweet.
+            limit (int | None): Max number of tweets, all if None.
+            batch_size (int): Number of rows fetched per round trip.
+            model_tweets (TweetsORM): Tweet model.
+            model_like (LikesORM): Like model.
+
+        Yields:
+            Sequence[TweetsORM]: Batch of tweets with loaded relations.
+
+        Notes:
+            Rows are fetched `batch_size` at a time, relations are loaded
+            per batch. Yielded tweets stay in the session identity map, the
+            caller should expunge them to keep memory flat. SQLAlchemy
+            errors are raised to the caller.
+        """
+        query: Select[Any] = (
+            select(model_tweets)
+            .options(
+                selectinload(model_tweets.attachments),
+                selectinload(model_tweets.owner),
+            )
+            .order_by(model_tweets.created_at.desc(), model_tweets.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        if cursor is not None:
+            query = query.where(
+                _keyset_before(
+                    (model_tweets.created_at, model_tweets.id), cursor
+                )
+            )
+        if limit is not None:
+            query = query.limit(limit)
+
+        result = await session.stream_scalars(query)
+        async for tweets in result.partitions():
+            await _load_recent_likes(session, tweets, model_tweets, model_like)
+            yield tweets
+
+    @staticmethod
+    @catch_orm_critical_err
+    async def get_home_tweets(
+        session: AsyncSession,
+        id_user: str,
+        limit: int,
+        cursor: tuple[float, datetime, str] | None = None,
+        model_tweets: TweetsORM = TweetsORM,
+        model_like: LikesORM = LikesORM,
+        model_follow: FollowersORM = FollowersORM,
+    ) -> Sequence[Row[Any]] | None:
+        """
+        Get page of home timeline, most popular first.
+
+        Args:
+            session (AsyncSession): Database session.
+            id_user (str): ID of the timeline owner.
+            limit (int): Max number of tweets.
+            cursor (tuple[float, datetime, str] | None): score,
+                `created_at` and `id` of the last tweet of the previous page.
+            model_tweets (TweetsORM): Tweet model.
+            model_like (LikesORM): Like model.
+            model_follow (FollowersORM): Followers model.
+
+        Returns:
+            Sequence[Row] | None: Rows of (tweet, score).
+
+        Notes:
+            Only tweets of users followed by `id_user` are selected:
+            followers (followed_id, follower_id) -> tweets (author,
+            score, created_at, id). Tweets are sorted on the `score`
+            precomputed by the scoring job, see `update_scores`.
+            A page holds at most `limit` tweets of each author, so the
+            top `limit` tweets of every followed author are read from
+            the index in order and only they are sorted, instead of all
+            their tweets.
+            The job rewrites scores, so the keyset isn't stable across its
+            runs: a tweet whose score rose above the cursor is skipped and
+            one whose score fell below it is repeated. Scores don't change
+            between runs, pages read within one run interval are exact.
+        """
+        score = model_tweets.score
+        rank_order = (
+            score.desc(),
+            model_tweets.created_at.desc(),
+            model_tweets.id.desc(),
+        )
+        authors_top = (
+            select(model_tweets)
+            .where(model_tweets.author == model_follow.follower_id)
+            .order_by(*rank_order)
+            .limit(limit)
+        )
+        if cursor is not None:
+            authors_top = authors_top.where(
+                _keyset_before(
+                    (score, model_tweets.created_at, model_tweets.id), cursor
+                )
+            )
+        top = authors_top.lateral("top")
+        tweet = aliased(model_tweets, top)
+        query: Select[Any] = (
+            select(tweet, tweet.score)
+            .select_from(model_follow)
+            .join(top, true())
+            .where(model_follow.followed_id == id_user)
+            .options(
+                selectinload(tweet.attachments),
+                selectinload(tweet.owner),
+            )
+            .order_by(
+                tweet.score.desc(),
+                tweet.created_at.desc(),
+                tweet.id.desc(),
+            )
+            .limit(limit)
+        )
+        rows = (await session.execute(query)).all()
+        await _load_recent_likes(
+            session, [row[0] for row in rows], model_tweets, model_like
+        )
+        return rows
+
+    @staticmethod
+    @catch_orm_critical_err
+    async def get_tweets_by_ids(
+        session: AsyncSession,
+        ids: Sequence[str],
+        model_tweets: TweetsORM = TweetsORM,
+        model_like: LikesORM = LikesORM,
+    ) -> Sequence[TweetsORM] | None:
+        """
+        Get tweets by ids in one batch.
+
+        Args:
+            session (AsyncSession): Database session.
+            ids (Sequence[str]): Tweet IDs.
+            model_tweets (TweetsORM): Tweet model.
+            model_like (LikesORM): Like model.
+
+        Returns:
+            Sequence[TweetsORM] | None: Existing tweets, in no order.
+        """
+        if not ids:
+            return []
+        query: Select[Any] = (
+            select(model_tweets)
+            .options(
+                selectinload(model_tweets.attachments),
+                selectinload(model_tweets.owner),
+            )
+            .where(model_tweets.id.in_(ids))
+        )
+        tweets = (await session.scalars(query)).all()
+        await _load_recent_likes(session, tweets, model_tweets, model_like)
+        return tweets
+
+    @staticmethod
+    @catch_orm_critical_err
+    async def get_authors_tweets(
+        session: AsyncSession,
+        authors_ids: Sequence[str],
+        limit: int,
+        cursor: tuple[datetime, str] | None = None,
+        model_tweets: TweetsORM = TweetsORM,
+        model_like: LikesORM = LikesORM,
+    ) -> Sequence[TweetsORM] | None:
+        """
+        Get page of the authors' tweets, newest first.
+
+        Args:
+            session (AsyncSession): Database session.
+            authors_ids (Sequence[str]): Author IDs.
+            limit (int): Max number of tweets.
+            cursor (tuple[datetime, str] | None): `created_at` and `id` of
+                the last tweet of the previous page.
+            model_tweets (TweetsORM): Tweet model.
+            model_like (LikesORM): Like model.
+
+        Returns:
+            Sequence[TweetsORM] | None: List of tweets.
+        """
+        if not authors_ids:
+            return []
+        query: Select[Any] = (
+            select(model_tweets)
+            .options(
+                selectinload(model_tweets.attachments),
+                selectinload(model_tweets.owner),
+            )
+            .where(model_tweets.author.in_(authors_ids))
+            .order_by(model_tweets.created_at.desc(), model_tweets.id.desc())
+            .limit(limit)
+        )
+        if cursor is not None:
+            query = query.where(
+                _keyset_before(
+                    (model_tweets.created_at, model_tweets.id), cursor
+                )
+            )
+        tweets = (await session.scalars(query)).all()
+        await _load_recent_likes(session, tweets, model_tweets, model_like)
+        return tweets
+
+    @staticmethod
+    @catch_orm_critical_err
+    async def get_authors_tweet_keys(
+        session: AsyncSession,
+        authors_ids: Sequence[str],
+        limit: int,
+        model_tweets: TweetsORM = TweetsORM,
+    ) -> list[tuple[str, datetime]] | None:
+        """
+        Get ids and creation time of the authors' newest tweets.
+
+        Args:
+            session (AsyncSession): Database session.
+            authors_ids (Sequence[str]): Author IDs.
+            limit (int): Max number of tweets.
+            model_tweets (TweetsORM): Tweet model.
+
+        Returns:
+            list[tuple[str, datetime]] | None: Tweet IDs with `created_at`,
+            newest first.
+        """
+        if not authors_ids:
+            return []
+        query: Select[Any] = (
+            select(model_tweets.id, model_tweets.created_at)
+            .where(model_tweets.author.in_(authors_ids))
+            .order_by(model_tweets.created_at.desc(), model_tweets.id.desc())
+            .limit(limit)
+        )
+        rows = await session.execute(query)
+        return [(str(id_), created_at) for id_, created_at in rows]
+
+    @staticmethod
+    @catch_orm_critical_err
+    async def repair_like_counts(
+        session: AsyncSession,
+        after_id: str | None,
+        batch_size: int,
+        model_tweets: TweetsORM = TweetsORM,
+        model_like: LikesORM = LikesORM,
+    ) -> tuple[str | None, int] | None:
+        """
+        Recompute like_count from likes for one batch of tweets.
+
+        Args:
+            session (AsyncSession): Database session.
+            after_id (str | None): Last tweet ID of the previous batch.
+            batch_size (int): Max number of tweets in the batch.
+            model_tweets (TweetsORM): Tweet model.
+            model_like (LikesORM): Like model.
+
+        Returns:
+            tuple[str | None, int] | None: Last tweet ID of the batch (None
+            when there are no more tweets) and number of fixed tweets.
+        """
+        batch_ids = select(model_tweets.id).order_by(model_tweets.id)
+        if after_id is not None:
+            batch_ids = batch_ids.where(model_tweets.id > after_id)
+
+        conn = await session.begin()
+        ids = (await conn.session.scalars(batch_ids.limit(batch_size))).all()
+        if not ids:
+            await conn.commit()
+            return None, 0
+
+        actual_count = (
+            select(func.count(model_like.like_id))
+            .where(model_like.tweet_id == model_tweets.id)
+            .scalar_subquery()
+        )
+        fixed = await conn.session.execute(
+            statement=update(model_tweets)
+            .where(model_tweets.id.in_(ids))
+            .where(model_tweets.like_count != actual_count)
+            .values(like_count=actual_count)
+        )
+        await conn.commit()
+
+        return str(ids[-1]), fixed.rowcount
+
+    @staticmethod
+    @catch_orm_critical_err
+    async def update_scores(
+        session: AsyncSession,
+        after: tuple[datetime, str] | None,
+        batch_size: int,
+        model_tweets: TweetsORM = TweetsORM,
+    ) -> tuple[tuple[datetime, str] | None, int] | None:
+        """
+        Recompute popularity score for one batch of recent tweets.
+
+        Args:
+            session (AsyncSession): Database session.
+            after (tuple[datetime, str] | None): `created_at` and `id` of
+                the last tweet of the previous batch.
+            batch_size (int): Max number of tweets in the batch.
+            model_tweets (TweetsORM): Tweet model.
+
+        Returns:
+            tuple[tuple[datetime, str] | None, int] | None: Sort key of the
+            last tweet of the batch (None when there are no more tweets)
+            and number of updated tweets.
+
+        Notes:
+            score = like_count / (age_hours + AGE_OFFSET_HOURS) ** GRAVITY,
+            computed by one set-based UPDATE per batch. Only tweets younger
+            than `ScoreConf.RECENT_HOURS` are scored, the batch is a range
+            scan of index (created_at, id).
+        """
+        now = func.localtimestamp()
+        batch_keys = (
+            select(model_tweets.created_at, model_tweets.id)
+            .where(
+                model_tweets.created_at
+                >= now - timedelta(hours=ScoreConf.RECENT_HOURS)
+            )
+            .order_by(model_tweets.created_at, model_tweets.id)
+            .limit(batch_size)
+        )
+        if after is not None:
+            batch_keys = batch_keys.where(
+                _keyset_after(
+                    (model_tweets.created_at, model_tweets.id), after
+                )
+            )
+
+        conn = await session.begin()
+        keys = (await conn.session.execute(batch_keys)).all()
+        if not keys:
+            await conn.commit()
+            return None, 0
+
+        age_hours = func.greatest(
+            func.extract("epoch", now - model_tweets.created_at) / 3600, 0
+        )
+        score = model_tweets.like_count / func.power(
+            age_hours + ScoreConf.AGE_OFFSET_HOURS, ScoreConf.GRAVITY
+        )
+        updated = await conn.session.execute(
+            statement=update(model_tweets)
+            .where(model_tweets.id.in_([key.id for key in keys]))
+            .values(score=score)
+        )
+        await conn.commit()
+
+        last_created_at, last_id = keys[-1]
+        return (last_created_at, str(last_id)), updated.rowcount
+
+    @staticmethod
+    @catch_orm_critical_err
+    async def expire_scores(
+        session: AsyncSession,
+        model_tweets: TweetsORM = TweetsORM,
+    ) -> int | None:
+        """
+        Reset score of tweets that left the scoring window.
+
+        Args:
+            session (AsyncSession): Database session.
+            model_tweets (TweetsORM): Tweet model.
+
+        Returns:
+            int | None: Number of reset tweets.
+
+        Notes:
+            Scores are recomputed for recent tweets only, so without a
+            reset an old tweet would keep its last, no longer decayed, score.
+        """
+        window_start = func.localtimestamp() - timedelta(
+            hours=ScoreConf.RECENT_HOURS
+        )
+        conn = await session.begin()
+        expired = await conn.session.execute(
+            statement=update(model_tweets)
+            .where(model_tweets.score > 0)
+            .where(model_tweets.created_at < window_start)
+            .values(score=0)
+        )
+        await conn.commit()
+        return expired.rowcount
+
+    @staticmethod
+    @catch_orm_critical_err
+    async def get_tweets_json(
+        session: AsyncSession,
+        limit: int,
+        cursor: tuple[datetime, str] | None = None,
+        model_tweets: TweetsORM = TweetsORM,
+        model_like: LikesORM = LikesORM,
+        model_media: MediaORM = MediaORM,
+        model_user: UserORM = UserORM,
+    ) -> tuple[str, int, datetime | None, str | None] | None:
+        """
+        Get page of tweets, newest first, as a JSON array built by Postgres.
+
+        Args:
+            session (AsyncSession): Database session.
+            limit (int): Max number of tweets.
+            cursor (tuple[datetime, str] | None): `created_at` and `id` of
+                the last tweet of the previous page.
+            model_tweets (TweetsORM): Tweet model.
+            model_like (LikesORM): Like model.
+            model_media (MediaORM): Media model.
+            model_user (UserORM): User model.
+
+        Returns:
+            tuple[str, int, datetime | None, str | None] | None: JSON array
+            of tweets in the `GetAllTweets.tweets` format, number of
+            selected rows (up to `limit` + 1) and the sort key of the
+            `limit`-th tweet.
+
+        Notes:
+            One round trip: `limit` + 1 rows are selected by the keyset
+            index, authors, attachments and the newest likes are aggregated
+            with json_build_object/json_agg. The extra row only tells whether a
+            next page exists, it isn't included in the JSON.
+        """
+        order = (model_tweets.created_at.desc(), model_tweets.id.desc())
+        page_query: Select[Any] = (
+            select(
+                model_tweets.id,
+                model_tweets.content,
+                model_tweets.author,
+                model_tweets.created_at,
+                model_tweets.like_count,
+                func.row_number().over(order_by=order).label("row_number"),
+            )
+            .order_by(*order)
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            page_query = page_query.where(
+                _keyset_before(
+                    (model_tweets.created_at, model_tweets.id), cursor
+                )
+            )
+        page = page_query.subquery("page")
+        author = aliased(model_user, name="author")
+
+        attachments = (
+            select(
+                func.coalesce(
+                    func.json_agg(model_media.source), EMPTY_JSON_ARRAY
+                )
+            )
+            .where(model_media.tweet_id == page.c.id)
+            .scalar_subquery()
+        )
+        likes = (
+            select(
+                func.coalesce(
+                    func.json_agg(
+                        aggregate_order_by(
+                            _json_object(
+                                user_id=model_user.id, name=model_user.name
+                            ),
+                            model_like.like_id.desc(),
+                        )
+                    ),
+                    EMPTY_JSON_ARRAY,
+                )
+            )
+            .select_from(model_like)
+            .join(model_user, model_user.id == model_like.user_id)
+            .where(
+                model_like.like_id.in_(_recent_like_ids(page.c.id, model_like))
+            )
+            .scalar_subquery()
+        )
+        tweet = _json_object(
+            id=page.c.id,
+            content=page.c.content,
+            attachments=attachments,
+            author=_json_object(id=author.id, name=author.name),
+            like_count=page.c.like_count,
+            likes=likes,
+        )
+        is_last_shown = page.c.row_number == limit
+        query: Select[Any] = (
+            select(
+                cast(
+                    func.coalesce(
+                        func.json_agg(
+                            aggregate_order_by(tweet, page.c.row_number)
+                        ).filter(page.c.row_number <= limit),
+                        EMPTY_JSON_ARRAY,
+                    ),
+                    Text,
+                ),
+                func.count(),
+                func.max(page.c.created_at).filter(is_last_shown),
+                func.max(cast(page.c.id, Text)).filter(is_last_shown),
+            )
+            .select_from(page)
+            .join(author, author.id == page.c.author)
+        )
+        result = await session.execute(query)
+        tweets_json, selected, last_created_at, last_id = result.one()
+        return tweets_json, selected, last_created_at, last_id
+
+    @staticmethod
+    @catch_orm_critical_err
+    async def get_tweet_likes(
+        session: AsyncSession,
+        id_tweet: str,
+        limit: int,
+        cursor: int | None = None,
+        model_like: LikesORM = LikesORM,
+        model_user: UserORM = UserORM,
+        model_tweets: TweetsORM = TweetsORM,
+    ) -> Sequence[Row[Any]] | bool | None:
+        """
+        Get page of the tweet's likes, newest first.
+
+        Args:
+            session (AsyncSession): Database session.
+            id_tweet (str): Tweet ID.
+            limit (int): Max number of likes.
+            cursor (int | None): `like_id` of the last like of the previous
+                page.
+            model_like (LikesORM): Like model.
+            model_user (UserORM): User model.
+            model_tweets (TweetsORM): Tweet model.
+
+        Returns:
+            Sequence[Row] | bool | None: Rows of (like_id, user_id, name),
+            False if the tweet doesn't exist.
+
+        Notes:
+            Keyset pagination over index (tweet_id, like_id).
+        """
+        query: Select[Any] = (
+            select(model_like.like_id, model_user.id, model_user.name)
+            .join(model_user, model_user.id == model_like.user_id)
+            .where(model_like.tweet_id == id_tweet)
+            .order_by(model_like.like_id.desc())
+            .limit(limit)
+        )
+        if cursor is not None:
+            query = query.where(model_like.like_id < cursor)
+        likes = (await session.execute(query)).all()
+        if likes or cursor is not None:
+            return likes
+
+        tweet = await session.get(model_tweets, id_tweet)
+        return [] if tweet else False
+
+    @staticmethod
+    @catch_orm_critical_err
+    async def get_liked_tweet_ids(
+        session: AsyncSession,
+        id_user: str,
+        ids: Sequence[str],
+        model_like: LikesORM = LikesORM,
+    ) -> set[str] | None:
+        """
+        Get ids of the given tweets liked by the user.
+
+        Args:
+            session (AsyncSession): Database session.
+            id_user (str): ID of the viewer.
+            ids (Sequence[str]): Tweet IDs of the page.
+            model_like (LikesORM): Like model.
+
+        Returns:
+            set[str] | None: Liked tweet IDs.
+
+        Notes:
+            One lookup `user_id = :me AND tweet_id = ANY(:ids)` over index
+            (tweet_id, user_id). The ids are one array parameter, so the
+            statement is the same for any page size.
         """
-        query: Select[Any] = select(model_tweets).options(
-            selectinload(model_tweets.likes).selectinload(model_like.user),
-            selectinload(model_tweets.attachments),
-            selectinload(model_tweets.owner),
+        if not ids:
+            return set()
+        page_ids = bindparam("ids", list(ids), type_=ARRAY(UUID))
+        liked = await session.scalars(
+            select(model_like.tweet_id)
+            .where(model_like.user_id == id_user)
+            .where(model_like.tweet_id == any_(page_ids))
         )
-        tweets = await session.scalars(query)
-        return tweets.all()
+        return {str(id_tweet) for id_tweet in liked}
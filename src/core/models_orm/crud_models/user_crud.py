@@ -56,6 +56,22 @@ class _UserInterface(ABC):
         """Get user by id."""
         pass
 
+    @staticmethod
+    @abstractmethod
+    async def get_follower_ids(
+        id_user: str, session: AsyncSession, follow_table=FollowersORM
+    ) -> list[str] | None:
+        """Get ids of users who follow the user."""
+        pass
+
+    @staticmethod
+    @abstractmethod
+    async def get_followed_ids(
+        id_user: str, session: AsyncSession, follow_table=FollowersORM
+    ) -> list[str] | None:
+        """Get ids of users followed by the user."""
+        pass
+
 
 class Users(_UserInterface):
     """CRUD interface for user-related operations.
@@ -204,3 +220,49 @@ class Users(_UserInterface):
             .where(user_table.id == id_user)
         )
         return await session.scalar(query)
+
+    @staticmethod
+    @catch_orm_critical_err
+    async def get_follower_ids(
+        id_user: str, session: AsyncSession, follow_table=FollowersORM
+    ) -> list[str] | None:
+        """Retrieve IDs of the users who follow the user.
+
+        Args:
+            id_user (str): The ID of the followed user.
+            session (AsyncSession): The database session.
+            follow_table (FollowersORM): The followers ORM table
+                (defaults to `FollowersORM`).
+
+        Returns:
+            list[str] | None: IDs of the subscribers, or `None` in case of
+            failure.
+        """
+        query = select(follow_table.followed_id).where(
+            follow_table.follower_id == id_user
+        )
+        follower_ids = await session.scalars(query)
+        return [str(id_) for id_ in follower_ids]
+
+    @staticmethod
+    @catch_orm_critical_err
+    async def get_followed_ids(
+        id_user: str, session: AsyncSession, follow_table=FollowersORM
+    ) -> list[str] | None:
+        """Retrieve IDs of the users followed by the user.
+
+        Args:
+            id_user (str): The ID of the subscriber.
+            session (AsyncSession): The database session.
+            follow_table (FollowersORM): The followers ORM table
+                (defaults to `FollowersORM`).
+
+        Returns:
+            list[str] | None: IDs of the followed users, or `None` in case
+            of failure.
+        """
+        query = select(follow_table.follower_id).where(
+            follow_table.followed_id == id_user
+        )
+        followed_ids = await session.scalars(query)
+        return [str(id_) for id_ in followed_ids]
@@ -2,7 +2,7 @@
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import UUID, ForeignKey
+from sqlalchemy import UUID, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.models_orm.models.base_model import BaseModel
@@ -22,12 +22,26 @@ class FollowersORM(BaseModel):
         followed_id UUID NOT NULL,
         PRIMARY KEY (id),
         FOREIGN KEY(follower_id) REFERENCES users (id),
-        FOREIGN KEY(followed_id) REFERENCES users (id)
+        FOREIGN KEY(followed_id) REFERENCES users (id),
+        CONSTRAINT uq_followers_followed_id_follower_id
+            UNIQUE (followed_id, follower_id)
     )
 
+        CREATE INDEX ix_followers_follower_id ON followers (follower_id)
+
+    Rows written by `Users.post_user_follow` store the subscriber in
+    `followed_id` and the followed author in `follower_id`.
     """
 
     __tablename__ = "followers"
+    __table_args__ = (
+        UniqueConstraint(
+            "followed_id",
+            "follower_id",
+            name="uq_followers_followed_id_follower_id",
+        ),
+        Index("ix_followers_follower_id", "follower_id"),
+    )
     __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
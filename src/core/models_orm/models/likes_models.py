@@ -2,7 +2,7 @@
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import UUID, ForeignKey
+from sqlalchemy import UUID, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.models_orm.models.base_model import BaseModel
@@ -25,9 +25,16 @@ class LikesORM(BaseModel):
         FOREIGN KEY(tweet_id) REFERENCES tweets (id),
         FOREIGN KEY(user_id) REFERENCES users (id)
     )
+
+        CREATE INDEX ix_likes_tweet_id_user_id ON likes (tweet_id, user_id)
+        CREATE INDEX ix_likes_tweet_id_like_id ON likes (tweet_id, like_id)
     """
 
     __tablename__ = "likes"
+    __table_args__ = (
+        Index("ix_likes_tweet_id_user_id", "tweet_id", "user_id"),
+        Index("ix_likes_tweet_id_like_id", "tweet_id", "like_id"),
+    )
     __mapper_args__ = {"eager_defaults": True}
     like_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     tweet_id: Mapped[UUID] = mapped_column(ForeignKey("tweets.id"))
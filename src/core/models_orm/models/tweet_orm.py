@@ -1,8 +1,9 @@
 """SQLAlchemy TweetORM model."""
 
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import UUID, ForeignKey, Text
+from sqlalchemy import UUID, ForeignKey, Index, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.models_orm.models.base_model import BaseModel
@@ -20,15 +21,44 @@ class TweetsORM(BaseModel):
         id UUID NOT NULL,
         content TEXT NOT NULL,
         author UUID NOT NULL,
+        created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now() NOT NULL,
+        like_count INTEGER DEFAULT 0 NOT NULL,
+        score FLOAT DEFAULT 0 NOT NULL,
         PRIMARY KEY (id),
         FOREIGN KEY(author) REFERENCES users (id)
     )
+
+        CREATE INDEX ix_tweets_created_at_id ON tweets (created_at, id)
+        CREATE INDEX ix_tweets_author_created_at ON tweets (author, created_at)
+        CREATE INDEX ix_tweets_author_score_created_at_id ON tweets
+        (author, score, created_at, id)
+        CREATE INDEX ix_tweets_scored_created_at ON tweets (created_at)
+        WHERE score > 0
     """
 
     __tablename__ = "tweets"
+    __table_args__ = (
+        Index("ix_tweets_created_at_id", "created_at", "id"),
+        Index("ix_tweets_author_created_at", "author", "created_at"),
+        Index(
+            "ix_tweets_author_score_created_at_id",
+            "author",
+            "score",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "ix_tweets_scored_created_at",
+            "created_at",
+            postgresql_where=text("score > 0"),
+        ),
+    )
     id: Mapped[str] = mapped_column(UUID, primary_key=True)
     content: Mapped[str] = mapped_column(Text)
     author: Mapped[str] = mapped_column(ForeignKey("users.id"))
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now())
+    like_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    score: Mapped[float] = mapped_column(default=0, server_default="0")
     likes: Mapped[list["LikesORM"]] = relationship(
         "LikesORM",
         back_populates="tweet",
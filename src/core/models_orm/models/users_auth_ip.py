@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import UUID, ForeignKey
+from sqlalchemy import UUID, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.models_orm.models.base_model import BaseModel
@@ -15,16 +15,29 @@ if TYPE_CHECKING:
 class UsersAuthIPORM(BaseModel):
     """UsersAuthIPORM model.
 
+    One row per device of a user: `refresh_token` is the `jti` of the
+    device's current refresh token, `fingerprint` is the digest of the
+    device fingerprint.
+
         CREATE TABLE users_auth_ip (
+        id SERIAL NOT NULL,
         user_id UUID NOT NULL,
-        api_key VARCHAR NOT NULL,
-        created_key TIMESTAMP WITHOUT TIME ZONE NOT NULL,
-        PRIMARY KEY (user_id),
-        UNIQUE (user_id)
+        refresh_token VARCHAR NOT NULL,
+        fingerprint VARCHAR NOT NULL,
+        PRIMARY KEY (id),
+        FOREIGN KEY(user_id) REFERENCES users_auth (user_id),
+        UNIQUE (user_id, fingerprint)
     )
     """
 
     __tablename__ = "users_auth_ip"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id",
+            "fingerprint",
+            name="uq_users_auth_ip_user_id_fingerprint",
+        ),
+    )
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[str] = mapped_column(
         UUID,
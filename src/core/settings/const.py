@@ -22,6 +22,8 @@ class JWT:
     TOKEN_TYPE_FIELD = "type"
     TOKEN_TYPE_ACCESS = "access_token"
     TOKEN_TYPE_REFRESH = "refresh_token"
+    PAYLOAD_JTI_KEY = "jti"
+    PAYLOAD_FINGERPRINT_KEY = "fp"
 
 
 class CommonConfSettings:
@@ -55,6 +57,10 @@ class MessageError:
         "~/.env or ~/.env.test incorrect or not exist"
     )
     MESSAGE_USER_NOT_FOUND = "User not found"
+    INVALID_CURSOR_ERR = "Invalid cursor."
+    INVALID_CURSOR_ERR_MESSAGE = "Cursor is malformed."
+    TYPE_ERROR_SERVICE_UNAVAILABLE = "Service unavailable."
+    MESSAGE_AUTH_BUSY = "Too many auth requests, please retry later."
 
 
 class TypeEncoding:
@@ -70,6 +76,32 @@ class JWTconf:
     ENV_PREFIX = "JWT_"
     ACCESS_EXPIRE_MINUTES = 15
     REFRESH_EXPIRE_DAYS = 30
+    VERIFIED_CACHE_SIZE = 10_000
+    VERIFIED_CACHE_DIGEST_SIZE = 16
+    REVOKED_PREFIX = "jwt-revoked"
+    ROTATED_PREFIX = "jwt-rotated"
+    ROTATED_GRACE_SECONDS = 10
+    FINGERPRINT_DIGEST_SIZE = 16
+
+
+class DenylistConf:
+    """Access tokens denylist conf data."""
+
+    PREFIX = "jwt-denied"
+    CHANNEL = "jwt-denied"
+    CAPACITY = 100_000
+    ERROR_RATE = 0.001
+    SCAN_COUNT = 1000
+    LISTEN_TIMEOUT = 1.0
+    RECONNECT_DELAY = 1
+
+
+class PasswordHashConf:
+    """bcrypt thread pool conf data."""
+
+    WORKERS = 4
+    QUEUE_TIMEOUT = 2.0
+    THREAD_NAME_PREFIX = "bcrypt"
 
 
 class Headers:
@@ -81,13 +113,26 @@ class Headers:
     WWW_AUTH_BEARER_EXPIRED = {
         "WWW-Authenticate": 'Bearer realm="Refresh token expired"'
     }
+    RETRY_AFTER_AUTH_BUSY = {"Retry-After": "1"}
     CACHE_CONTROL = "Cache-Control"
-    CACHE_MAX_AGE = "max-age="
+    CACHE_NO_CACHE = "no-cache"
+    CACHE_PRIVATE = "private"
     ETAG = "ETag"
+    ETAG_WEAK_PREFIX = "W/"
+    ETAG_ANY = "*"
     X_CACHE = "X-Cache"
     X_CACHE_MISS = "MISS"
     X_CACHE_HIT = "HIT"
+    X_CACHE_HIT_LOCAL = "HIT-LOCAL"
+    X_CACHE_STALE = "STALE"
+    X_CACHE_BYPASS = "BYPASS"
+    X_METRICS_TOKEN = "X-Metrics-Token"
+    X_DEVICE_FINGERPRINT = "X-Device-Fingerprint"
+    USER_AGENT = "User-Agent"
     IF_NONE_MATCH = "if-none-match"
+    ACCEPT_ENCODING = "accept-encoding"
+    CONTENT_ENCODING = "Content-Encoding"
+    VARY = "Vary"
 
 
 class PydanticTweets:
@@ -103,6 +148,15 @@ class PydanticTweets:
     TITLE_TWEETS_RESPONSE = "Tweet Response"
     TITLE_TWEET_REQUEST = "Tweet Request"
     TWEET_MEDIA_IDS_DESCRIPTION = "Array tweet IDs"
+    NEXT_CURSOR_DESCRIPTION = "Cursor of the next page, null on last page."
+    LIKE_COUNT_DESCRIPTION = "Number of likes of the tweet."
+    LIKES_DESCRIPTION = (
+        "Most recent likes, the full list is at GET /api/tweets/{id}/likes."
+    )
+    TITLE_GET_LIKES_RESPONSE = "Get Likes Response"
+    LIKED_BY_ME_DESCRIPTION = (
+        "Whether the current user liked the tweet, null outside of the feed."
+    )
     JSON_SCHEMA_TWEET = {
         "example": {
             "result": True,
@@ -118,14 +172,29 @@ class PydanticTweets:
                         "id": "3fa85f64-4578-4562-b3fc-2c963f66afa6",
                         "name": "Author Name",
                     },
+                    "like_count": 1,
                     "likes": [
                         {
                             "user_id": "3fa85f64-5555-4562-b3fc-2c963f66afa6",
                             "name": "User1",
                         },
                     ],
+                    "liked_by_me": False,
+                },
+            ],
+            "next_cursor": "MjAyNi0xMC0xOFQwMDowMDowMHwzZmE4NWY2NA==",
+        }
+    }
+    JSON_SCHEMA_LIKES = {
+        "example": {
+            "result": True,
+            "likes": [
+                {
+                    "user_id": "3fa85f64-5555-4562-b3fc-2c963f66afa6",
+                    "name": "User1",
                 },
             ],
+            "next_cursor": "MTIzNA==",
         }
     }
 
@@ -243,16 +312,84 @@ class MimeTypes:
 
     APPLICATION_JSON = "application/json"
     MULTIPART_FORM_DATA = "multipart/form-data"
+    PROMETHEUS_TEXT = "text/plain; version=0.0.4"
+
+
+class ContentEncoding:
+    """HTTP content codings of cached bodies."""
+
+    IDENTITY = "identity"
+    GZIP = "gzip"
+    BR = "br"
+    ZSTD = "zstd"
+    ANY = "*"
+    QUALITY = "q"
+    GZIP_LEVEL = 6
+    BR_QUALITY = 5
+    ZSTD_LEVEL = 3
+    ZSTD_MIN_SIZE = 1024
+
+
+class LocalCacheConf:
+    """In-process L1 cache conf data."""
+
+    ENABLED = False
+    MAX_ENTRIES = 1024
+    MAX_BYTES = 64 * 1024 * 1024
+    TTL = 5
+    RECONNECT_DELAY = 1
+    LISTEN_TIMEOUT = 1.0
+    CHANNEL = "cache-invalidate"
+    SEPARATOR = ","
 
 
 class CacheConf:
     """REDIS cache expiration times."""
 
-    CACHE_EXPIRATION_TIME_GET_TWEETS = 60
-    CACHE_EXPIRATION_TIME_GET_USER = 20
+    CACHE_EXPIRATION_TIME_GET_TWEETS = 3600
+    CACHE_EXPIRATION_TIME_GET_USER = 3600
+    STALE_TTL_GET_TWEETS = 300
     PREFIX_GET_TWEETS = f"GET {TweetsRoutes.PREFIX}{TweetsRoutes.TWEETS}"
     PREFIX_USER_BY_ID = "GET api/user/id"
     PREFIX_USER_ME = "GET api/user/me"
+    FIELD_ETAG = "etag"
+    FIELD_GENERATION = "gen"
+    FIELD_FRESH_UNTIL = "fresh"
+    META_PREFIX = "cache-meta"
+    GENERATION_PREFIX = "cache-gen"
+    GENERATION_SEPARATOR = "."
+    NAMESPACE_FEED = "feed"
+    NAMESPACE_USER = "user"
+    HASH_DIGEST_SIZE = 16
+    LOCK_PREFIX = "cache-lock"
+    LOCK_TTL_MS = 5000
+    LOCK_WAIT = 5
+    LOCK_POLL_INTERVAL = 0.05
+    SERIALIZER_JSON = "json"
+    SERIALIZER_ORJSON = "orjson"
+    SERIALIZER = SERIALIZER_JSON
+    SERIALIZER_PATTERN = f"^({SERIALIZER_JSON}|{SERIALIZER_ORJSON})$"
+
+
+class PaginationConf:
+    """Keyset pagination conf data."""
+
+    DEFAULT_LIMIT = 20
+    MIN_LIMIT = 1
+    MAX_LIMIT = 100
+    CURSOR_SEPARATOR = "|"
+    LIMIT_DESCRIPTION = "Max number of tweets on the page."
+    CURSOR_DESCRIPTION = "Opaque cursor from `next_cursor` of previous page."
+    STREAM_BATCH_SIZE = 500
+    STREAM_MAX_LIMIT = 10_000
+    STREAM_LIMIT_DESCRIPTION = "Max number of tweets in the export."
+
+
+class LikesConf:
+    """Likes lists conf data."""
+
+    FEED_LIKES = 3
+    LIMIT_DESCRIPTION = "Max number of likes on the page."
 
 
 class GunicornConf:
@@ -276,6 +413,84 @@ class RedisConf:
     DEFAULT_PORT = 6379
     REDIS_DB = 0
     REDIS_USER = "default"
+    MAX_CONNECTIONS = 50
+    POOL_TIMEOUT = 1.0
+    SOCKET_TIMEOUT = 0.5
+    CONNECT_TIMEOUT = 0.5
+    HEALTH_CHECK_INTERVAL = 30
+    BREAKER_THRESHOLD = 5
+    BREAKER_COOLDOWN = 10.0
+
+
+class TimelineConf:
+    """Redis home timelines conf data."""
+
+    PREFIX = "timeline"
+    CELEBRITIES_KEY = "timeline:celebrities"
+    FAN_OUT = False
+    MAX_LEN = 800
+    CELEBRITY_FOLLOWERS = 10_000
+
+
+class MetricsConf:
+    """Cache metrics and keyspace stats conf data."""
+
+    NAMESPACE = "microblog_cache"
+    LATENCY_BUCKETS = (
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+    )
+    OP_READ = "read"
+    OP_WRITE = "write"
+    EVENT_NOT_MODIFIED = "NOT-MODIFIED"
+    EVENT_ERROR = "ERROR"
+    GAUGE_BREAKER_OPEN = "breaker_open"
+    GAUGE_LOCAL_ENTRIES = "local_entries"
+    GAUGE_LOCAL_BYTES = "local_bytes"
+    SCAN_COUNT = 1000
+    SCAN_LIMIT = 100_000
+    SAMPLE_SIZE = 50
+    KEYSPACE_PREFIXES = (
+        CacheConf.PREFIX_GET_TWEETS,
+        CacheConf.PREFIX_USER_BY_ID,
+        CacheConf.PREFIX_USER_ME,
+        CacheConf.META_PREFIX,
+        CacheConf.GENERATION_PREFIX,
+        CacheConf.LOCK_PREFIX,
+        TimelineConf.PREFIX,
+        JWTconf.REVOKED_PREFIX,
+        DenylistConf.PREFIX,
+    )
+    KEYSPACE_OTHER = "other"
+    KEYSPACE_SEPARATOR = ":"
+    TITLE_KEYSPACE_RESPONSE = "Cache keyspace"
+
+
+class JobsConf:
+    """Background jobs conf data."""
+
+    BATCH_SIZE = 1000
+
+
+class ScoreConf:
+    """Popularity score conf data.
+
+    score = like_count / (age_hours + AGE_OFFSET_HOURS) ** GRAVITY
+    """
+
+    GRAVITY = 1.8
+    AGE_OFFSET_HOURS = 2
+    RECENT_HOURS = 48
+    INTERVAL_SECONDS = 300
 
 
 class Keys:
@@ -284,3 +499,6 @@ class Keys:
     REQUEST = "request"
     RESPONSE = "response"
     GET = "GET"
+    ID_USER = "id_user"
+    SESSION = "session"
+    ETAG_GUARD = "etag_guard"
@@ -4,6 +4,9 @@ ID = "{id}"
 # path /api/tweets
 TWEETS_PATH = "/tweets"
 LIKE = "like"
+LIKES = "likes"
+FEED = "feed"
+EXPORT = "export"
 
 # path /api/users
 USERS_PATH = "/users"  # POST /api/users/<id>/follow
@@ -12,6 +15,9 @@ FOLLOW = "follow"
 # path api/auth
 AUTH_PATH = "/auth"
 
+# path api/admin
+ADMIN_PATH = "/admin"
+
 
 class PathRoutes:
     """Central storage all paths.
@@ -32,6 +38,9 @@ class TweetsRoutes(PathRoutes):
     TWEETS = f"{TWEETS_PATH}"
     TWEETS_POST_DEL_ID_LIKE = f"{TWEETS_PATH}/{ID}/{LIKE}"
     TWEETS_DEL_BY_ID = f"{TWEETS_PATH}/{ID}"
+    TWEETS_FEED = f"{TWEETS_PATH}/{FEED}"
+    TWEETS_EXPORT = f"{TWEETS_PATH}/{EXPORT}"
+    TWEETS_ID_LIKES = f"{TWEETS_PATH}/{ID}/{LIKES}"
 
 
 class UsersRoutes(PathRoutes):
@@ -61,3 +70,14 @@ class AuthRoutes(PathRoutes):
     POST_CREATE_USER_JSON = f"{AUTH_PATH}/new/json"
     DEL_LOGOUT_USER = f"{AUTH_PATH}/logout"
     PATCH_TOKENS = f"{AUTH_PATH}/patch"
+
+
+class MetricsRoutes(PathRoutes):
+    """MetricsRoutes storage all paths.
+
+    If you need to change a path anywhere, you can do it here.
+    """
+
+    TAG = "Metrics"
+    METRICS = "/metrics"
+    ADMIN_CACHE = f"{ADMIN_PATH}/cache"
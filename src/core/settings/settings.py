@@ -8,11 +8,15 @@ from pydantic import EmailStr, Field, HttpUrl, ValidationError
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from src.core.settings.const import (
+    CacheConf,
     CommonConfSettings,
     GunicornConf,
     JWTconf,
+    LocalCacheConf,
     MessageError,
+    PasswordHashConf,
     RedisConf,
+    TimelineConf,
 )
 
 
@@ -82,6 +86,8 @@ class DataBaseEnvConf(UrlDBSettings, EnvironmentSetting):
         POSTGRES_DB (str): The name of the PostgreSQL database.
         POSTGRES_PASSWORD (str): The password for the PostgreSQL user.
         ECHO (bool): A flag to enable or disable SQLAlchemy query logging.
+        SQL_JSON_FEED (bool): Build GET /tweets payload in PostgreSQL with
+            json_build_object/json_agg instead of ORM + pydantic.
     """
 
     POSTGRES_HOST: str
@@ -94,6 +100,7 @@ class DataBaseEnvConf(UrlDBSettings, EnvironmentSetting):
     POOL_SIZE_SQL_ALCHEMY_CONF: int
     MAX_OVERFLOW: int
     MODE: str = Field(min_length=2)
+    SQL_JSON_FEED: bool = Field(default=False)
 
     @property
     def get_url_database(self) -> str:
@@ -118,6 +125,8 @@ class AuthJWTEnv(EnvironmentSetting):
     Environment Variables:
         - JWT_PRIVATE (str): The private JWT key.
         - JWT_PUBLIC (str): The public JWT key.
+        - JWT_VERIFIED_CACHE_SIZE (int): Max verified tokens kept per
+            worker, 0 disables the cache.
 
     Attributes:
         jwt_private (str): The private JWT key.
@@ -128,6 +137,8 @@ class AuthJWTEnv(EnvironmentSetting):
             access token in minutes, default is 15.
         refresh_token_expire_days (int): The expiration time for the
             refresh token in days, default is 30.
+        verified_cache_size (int): Max number of verified tokens kept by
+            every worker, default is 10000.
 
     Example:
         Usage of the class to load JWT configuration from an `.env` file:
@@ -153,6 +164,7 @@ class AuthJWTEnv(EnvironmentSetting):
         default=JWTconf.ACCESS_EXPIRE_MINUTES
     )
     refresh_token_expire_days: int = Field(default=JWTconf.REFRESH_EXPIRE_DAYS)
+    verified_cache_size: int = Field(default=JWTconf.VERIFIED_CACHE_SIZE, ge=0)
 
 
 class RedisEnv(EnvironmentSetting):
@@ -166,6 +178,21 @@ class RedisEnv(EnvironmentSetting):
      - REDIS_HOST: str
      - REDIS_PORT: int
      - REDIS_DB: int
+     - REDIS_TIMELINE_FAN_OUT: bool
+     - REDIS_TIMELINE_MAX_LEN: int
+     - REDIS_TIMELINE_CELEBRITY_FOLLOWERS: int
+     - REDIS_L1_CACHE: bool
+     - REDIS_L1_MAX_ENTRIES: int
+     - REDIS_L1_MAX_BYTES: int
+     - REDIS_L1_TTL: int
+     - REDIS_MAX_CONNECTIONS: int
+     - REDIS_POOL_TIMEOUT: float
+     - REDIS_SOCKET_TIMEOUT: float
+     - REDIS_CONNECT_TIMEOUT: float
+     - REDIS_HEALTH_CHECK_INTERVAL: int
+     - REDIS_BREAKER_THRESHOLD: int
+     - REDIS_BREAKER_COOLDOWN: float
+     - REDIS_CACHE_SERIALIZER: str, `json` or `orjson`
     """
 
     REDIS_HOST: str
@@ -176,6 +203,33 @@ class RedisEnv(EnvironmentSetting):
     REDIS_PREFIX: str = Field(
         default=RedisConf.PREFIX, min_length=RedisConf.MIN_LENGTH_PREFIX
     )
+    REDIS_TIMELINE_FAN_OUT: bool = Field(default=TimelineConf.FAN_OUT)
+    REDIS_TIMELINE_MAX_LEN: int = Field(default=TimelineConf.MAX_LEN, ge=1)
+    REDIS_TIMELINE_CELEBRITY_FOLLOWERS: int = Field(
+        default=TimelineConf.CELEBRITY_FOLLOWERS, ge=1
+    )
+    REDIS_L1_CACHE: bool = Field(default=LocalCacheConf.ENABLED)
+    REDIS_L1_MAX_ENTRIES: int = Field(default=LocalCacheConf.MAX_ENTRIES, ge=1)
+    REDIS_L1_MAX_BYTES: int = Field(default=LocalCacheConf.MAX_BYTES, ge=1)
+    REDIS_L1_TTL: int = Field(default=LocalCacheConf.TTL, ge=1)
+    REDIS_MAX_CONNECTIONS: int = Field(default=RedisConf.MAX_CONNECTIONS, ge=1)
+    REDIS_POOL_TIMEOUT: float = Field(default=RedisConf.POOL_TIMEOUT, gt=0)
+    REDIS_SOCKET_TIMEOUT: float = Field(default=RedisConf.SOCKET_TIMEOUT, gt=0)
+    REDIS_CONNECT_TIMEOUT: float = Field(
+        default=RedisConf.CONNECT_TIMEOUT, gt=0
+    )
+    REDIS_HEALTH_CHECK_INTERVAL: int = Field(
+        default=RedisConf.HEALTH_CHECK_INTERVAL, ge=0
+    )
+    REDIS_BREAKER_THRESHOLD: int = Field(
+        default=RedisConf.BREAKER_THRESHOLD, ge=1
+    )
+    REDIS_BREAKER_COOLDOWN: float = Field(
+        default=RedisConf.BREAKER_COOLDOWN, gt=0
+    )
+    REDIS_CACHE_SERIALIZER: str = Field(
+        default=CacheConf.SERIALIZER, pattern=CacheConf.SERIALIZER_PATTERN
+    )
 
     @property
     def redis_url(self):
@@ -186,6 +240,30 @@ class RedisEnv(EnvironmentSetting):
         )
 
 
+class MetricsEnv(EnvironmentSetting):
+    """Class give environments params for metrics and admin routes.
+
+    Environments params:
+     - METRICS_TOKEN: str | None, routes are disabled if it's not set.
+    """
+
+    METRICS_TOKEN: str | None = Field(default=None, min_length=16)
+
+
+class PasswordHashEnv(EnvironmentSetting):
+    """Class give environments params for bcrypt thread pool.
+
+    Environments params:
+     - PASSWORD_HASH_WORKERS: int, max hashes at once per worker process.
+     - PASSWORD_HASH_QUEUE_TIMEOUT: float, max wait for a free thread.
+    """
+
+    PASSWORD_HASH_WORKERS: int = Field(default=PasswordHashConf.WORKERS, ge=1)
+    PASSWORD_HASH_QUEUE_TIMEOUT: float = Field(
+        default=PasswordHashConf.QUEUE_TIMEOUT, gt=0
+    )
+
+
 class GunicornENV(EnvironmentSetting):
     """Conf Gunicorn."""
 
@@ -208,6 +286,8 @@ class Settings:
         jwt (AuthJWTEnv): JWT configuration including token paths
             and expiration settings.
         open_api (InfoSettingEnv): OpenApi docs
+        metrics (MetricsEnv): Access to metrics and admin routes.
+        password_hash (PasswordHashEnv): bcrypt thread pool limits.
 
     Raises:
         EnvironmentFileNotFoundError: If neither the `.env` nor the
@@ -231,6 +311,8 @@ class Settings:
         self.jwt = AuthJWTEnv()
         self.open_api = InfoSettingEnv()
         self.redis = RedisEnv()
+        self.metrics = MetricsEnv()
+        self.password_hash = PasswordHashEnv()
         self.gunicorn = GunicornENV()
 
 
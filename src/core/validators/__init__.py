@@ -3,10 +3,15 @@
 from src.core.validators.valid_auth import ValidateLoginUser as LoginUser
 from src.core.validators.valid_auth import ValidateNewUser as NewUser
 from src.core.validators.valid_err_response import ValidErrResponse as ErrResp
+from src.core.validators.valid_get_tweets import ValidateGetTweet as Tweet
 from src.core.validators.valid_get_tweets import (
     ValidGETModelTweet as GetAllTweets,
 )
+from src.core.validators.valid_likes import ValidGETModelLikes as GetLikes
 from src.core.validators.valid_likes import ValidLikeModel as Like
+from src.core.validators.valid_metrics import (
+    ValidCacheKeyspace as CacheKeyspace,
+)
 from src.core.validators.valid_post_tweet import (
     ValidPostModelNewTweetInput as PostNewTweet,
 )
@@ -28,10 +33,13 @@ __all__ = [
     "PostNewTweet",
     "ReturnNewTweet",
     "GetAllTweets",
+    "Tweet",
     "UserToken",
     "NewUser",
     "ErrResp",
     "LoginUser",
     "UserMe",
     "Like",
+    "GetLikes",
+    "CacheKeyspace",
 ]
@@ -18,7 +18,9 @@ class ValidateGetTweet(pydantic.BaseModel):
     - `content` : User's data of tweet
     - `tweets` : list[ValidDataGetTweetOutput]
     - `author` : ValidUserModel
+    - `like_count` : Number of likes
     - `likes` : list[ValidLikeModel]
+    - `liked_by_me` : Whether the viewer liked the tweet
     """
 
     id: str = pydantic.Field(
@@ -29,7 +31,15 @@ class ValidateGetTweet(pydantic.BaseModel):
         default=[], description=PydanticTweets.ATTACHMENTS_DESCRIPTION
     )
     author: ValidUserModel
-    likes: list[ValidLikeModel]
+    like_count: int = pydantic.Field(
+        default=0, ge=0, description=PydanticTweets.LIKE_COUNT_DESCRIPTION
+    )
+    likes: list[ValidLikeModel] = pydantic.Field(
+        description=PydanticTweets.LIKES_DESCRIPTION
+    )
+    liked_by_me: bool | None = pydantic.Field(
+        default=None, description=PydanticTweets.LIKED_BY_ME_DESCRIPTION
+    )
 
     model_config = pydantic.ConfigDict(
         from_attributes=True,
@@ -49,13 +59,20 @@ class ValidGETModelTweet(pydantic.BaseModel):
         - `author`: Author object with the following fields:
             - `id`: str : Unique identifier of the author.
             - `name`: string : Name of the author.
-        - `likes`: List of users who liked the tweet, each containing:
+        - `like_count`: int : Number of likes.
+        - `likes`: Most recent users who liked the tweet, each containing:
             - `user_id`: str : Unique identifier of the user.
             - `name`: string : Name of the user.
+        - `liked_by_me`: bool | None : Whether the viewer liked the tweet.
+    - `next_cursor`: str | None : Cursor of the next page.
     """
 
     result: bool = True
     tweets: list[ValidateGetTweet]
+    next_cursor: str | None = pydantic.Field(
+        default=None,
+        description=PydanticTweets.NEXT_CURSOR_DESCRIPTION,
+    )
 
     model_config = pydantic.ConfigDict(
         from_attributes=True,
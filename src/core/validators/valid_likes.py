@@ -7,6 +7,8 @@ import uuid
 
 import pydantic
 
+from src.core.settings.const import PydanticTweets
+
 
 class ValidLikeModel(pydantic.BaseModel):
     """**Likes of tweet**."""
@@ -14,3 +16,26 @@ class ValidLikeModel(pydantic.BaseModel):
     user_id: uuid.UUID
     name: str = pydantic.Field(..., description="User's name")
     model_config = pydantic.ConfigDict(title="Like Tweet")
+
+
+class ValidGETModelLikes(pydantic.BaseModel):
+    """**Model to validate GET /tweets/{id}/likes**.
+
+    - `result`: bool : Successful or unsuccessful.
+    - `likes`: Users who liked the tweet, newest first:
+        - `user_id`: str : Unique identifier of the user.
+        - `name`: string : Name of the user.
+    - `next_cursor`: str | None : Cursor of the next page.
+    """
+
+    result: bool = True
+    likes: list[ValidLikeModel]
+    next_cursor: str | None = pydantic.Field(
+        default=None,
+        description=PydanticTweets.NEXT_CURSOR_DESCRIPTION,
+    )
+
+    model_config = pydantic.ConfigDict(
+        title=PydanticTweets.TITLE_GET_LIKES_RESPONSE,
+        json_schema_extra=PydanticTweets.JSON_SCHEMA_LIKES,
+    )
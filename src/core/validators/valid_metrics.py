@@ -0,0 +1,48 @@
+"""Validator models for /admin routes.
+
+You can see route to /src/core/controllers/metrics/
+"""
+
+import pydantic
+
+from src.core.settings.const import MetricsConf
+
+
+class ValidKeyspacePrefix(pydantic.BaseModel):
+    """**Redis keys of one prefix**.
+
+    - `prefix`: str : Key prefix, `other` for unknown keys.
+    - `keys`: int : Number of scanned keys.
+    - `sampled`: int : Number of keys measured by MEMORY USAGE.
+    - `avg_bytes`: int : Mean memory of sampled keys.
+    - `estimated_bytes`: int : `keys` * `avg_bytes`.
+    """
+
+    prefix: str
+    keys: int
+    sampled: int
+    avg_bytes: int
+    estimated_bytes: int
+
+
+class ValidCacheKeyspace(pydantic.BaseModel):
+    """**Model to validate GET /admin/cache**.
+
+    - `result`: bool : Successful or unsuccessful.
+    - `used_memory`: int : Memory used by Redis in bytes.
+    - `maxmemory`: int : Redis memory limit in bytes, 0 if unlimited.
+    - `scanned_keys`: int : Number of keys seen by SCAN.
+    - `complete`: bool : Whether SCAN went through the whole keyspace.
+    - `prefixes`: Keys by prefix, largest first.
+    """
+
+    result: bool = True
+    used_memory: int
+    maxmemory: int
+    scanned_keys: int
+    complete: bool
+    prefixes: list[ValidKeyspacePrefix]
+
+    model_config = pydantic.ConfigDict(
+        title=MetricsConf.TITLE_KEYSPACE_RESPONSE,
+    )
@@ -15,18 +15,27 @@ Functional ability:
 
 """
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 import uvicorn
 from fastapi import FastAPI
 
 from src.core.controllers.auth.auth import auth
+from src.core.controllers.depends.utils.access_denylist import (
+    listen_access_denylist,
+)
 from src.core.controllers.depends.utils.connect_db import disconnect_db
+from src.core.controllers.depends.utils.jwt_token import load_signing_keys
 from src.core.controllers.depends.utils.redis_chash import (
     close_redis,
+    get_local_cache,
     init_redis,
+    listen_invalidations,
+    setup_redis_bytes,
 )
 from src.core.controllers.media.media import media
+from src.core.controllers.metrics.metrics import metrics
 from src.core.controllers.tweets.main_tweets import tweets
 from src.core.controllers.users.users import users
 from src.core.settings import swagger_info
@@ -36,11 +45,26 @@ from src.core.settings.routes_path import AuthRoutes
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     """Uu DB."""
+    load_signing_keys()
     redis = await init_redis()
+    redis_bytes = await setup_redis_bytes()
     # TODO: ADD INFO CONNECTION REDIS
+    local_cache = get_local_cache()
+    listener = (
+        asyncio.create_task(listen_invalidations(local_cache))
+        if local_cache is not None
+        else None
+    )
+    denylist_listener = asyncio.create_task(listen_access_denylist())
     yield
+    for task in (listener, denylist_listener):
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
     await disconnect_db()
     await close_redis(client=redis)
+    await close_redis(client=redis_bytes)
 
 
 def create_app() -> FastAPI:
@@ -61,6 +85,7 @@ def create_app() -> FastAPI:
     app_.include_router(router=tweets)
     app_.include_router(router=users)
     app_.include_router(router=auth)
+    app_.include_router(router=metrics)
 
     return app_
 
@@ -0,0 +1,78 @@
+"""Benchmark per-hit CPU of the response cache.
+
+Compares the old hit path (parse JSON, validate the model, dump it and
+serialize it again) with sending the stored bytes as is.
+
+Run:
+    python -m tests.benchmarks.bench_cache_hit
+"""
+
+import json
+import timeit
+import uuid
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+from src.core.controllers.depends.utils.compression import (
+    compress_variants,
+    decompress_gzip,
+)
+from src.core.controllers.depends.utils.local_cache import CachedEntry
+from src.core.controllers.depends.utils.redis_chash import encoded_response
+from src.core.validators import GetAllTweets
+
+TWEETS = 2000
+ROUNDS = 20
+
+
+def make_payload(count: int = TWEETS) -> str:
+    """Return JSON of a feed page with `count` tweets."""
+    tweets = [
+        {
+            "id": str(uuid.uuid4()),
+            "content": "Lorem ipsum dolor sit amet " * 4,
+            "attachments": [f"/static/images/{i}.png"],
+            "author": {"id": str(uuid.uuid4()), "name": f"user{i}"},
+            "like_count": i,
+            "likes": [
+                {"user_id": str(uuid.uuid4()), "name": f"fan{j}"}
+                for j in range(3)
+            ],
+            "liked_by_me": False,
+        }
+        for i in range(count)
+    ]
+    return GetAllTweets(tweets=tweets).model_dump_json()
+
+
+def old_hit(gzip_body: bytes) -> JSONResponse:
+    """Hit path before byte passthrough."""
+    data = GetAllTweets(**json.loads(decompress_gzip(gzip_body)))
+    return JSONResponse(content=data.model_dump(mode="json"))
+
+
+def main() -> None:
+    """Print mean time per hit of both paths."""
+    payload = make_payload()
+    entry = CachedEntry(
+        etag="", variants=compress_variants(payload.encode("utf-8"))
+    )
+    gzip_body = entry.variants["gzip"]
+    cases = {
+        "deserialize + re-serialize": lambda: old_hit(gzip_body),
+        "passthrough gzip": lambda: encoded_response(
+            gzip_body, "gzip", Response()
+        ),
+        "passthrough identity": lambda: encoded_response(
+            decompress_gzip(gzip_body), "identity", Response()
+        ),
+    }
+    print(f"payload: {len(payload)} bytes, {TWEETS} tweets")
+    for name, case in cases.items():
+        seconds = timeit.timeit(case, number=ROUNDS) / ROUNDS
+        print(f"{name:<28} {seconds * 1000:9.3f} ms/hit")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Benchmark serializers and compression of cached responses.
+
+Compares encode and decode time and bytes stored of every installed
+serializer, raw and with every installed compression, for a feed page
+(`GetAllTweets`) and a user profile (`UserProfile`).
+
+Run:
+    python -m tests.benchmarks.bench_cache_serializers
+"""
+
+import gzip
+import timeit
+import uuid
+from typing import Any, Callable
+
+import pydantic
+
+from src.core.controllers.depends.utils.cache_serializers import (
+    available_serializers,
+)
+from src.core.controllers.depends.utils.compression import brotli, zstandard
+from src.core.settings.const import ContentEncoding
+from src.core.validators import GetAllTweets, UserProfile
+from tests.benchmarks.bench_cache_hit import make_payload
+
+ROUNDS = 20
+FOLLOWS = 200
+
+Codec = tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]
+
+
+def make_profile(count: int = FOLLOWS) -> UserProfile:
+    """Return profile of a user with `count` followers and followings."""
+
+    def users(name: str) -> list[dict[str, str]]:
+        return [
+            {"id": str(uuid.uuid4()), "name": f"{name}{i}"}
+            for i in range(count)
+        ]
+
+    return UserProfile(
+        result=True,
+        user={
+            "id": str(uuid.uuid4()),
+            "name": "author",
+            "followers": users("fan"),
+            "following": users("idol"),
+        },
+    )
+
+
+def codecs() -> dict[str, Codec]:
+    """Return compress and decompress functions of installed codings."""
+    result: dict[str, Codec] = {
+        ContentEncoding.IDENTITY: (bytes, bytes),
+        ContentEncoding.GZIP: (
+            lambda body: gzip.compress(
+                body, compresslevel=ContentEncoding.GZIP_LEVEL
+            ),
+            gzip.decompress,
+        ),
+    }
+    if brotli is not None:
+        result[ContentEncoding.BR] = (
+            lambda body: brotli.compress(
+                body, quality=ContentEncoding.BR_QUALITY
+            ),
+            brotli.decompress,
+        )
+    if zstandard is not None:
+        result[ContentEncoding.ZSTD] = (
+            zstandard.ZstdCompressor(
+                level=ContentEncoding.ZSTD_LEVEL
+            ).compress,
+            zstandard.ZstdDecompressor().decompress,
+        )
+    return result
+
+
+def measure(func: Callable[[], Any]) -> float:
+    """Return mean time of a call in ms."""
+    return timeit.timeit(func, number=ROUNDS) / ROUNDS * 1000
+
+
+def bench(name: str, model: pydantic.BaseModel) -> None:
+    """Print encode, decode time and stored bytes of every combination."""
+    print(f"\n{name}")
+    print(
+        f"{'serializer':<10} {'coding':<9} {'bytes':>9} {'enc ms':>8}"
+        f" {'dec ms':>8}"
+    )
+    for serializer in available_serializers().values():
+        body = serializer.dumps(model)
+        dumps_ms = measure(lambda: serializer.dumps(model))
+        loads_ms = measure(lambda: serializer.loads(body))
+        for coding, (compress, decompress) in codecs().items():
+            stored = compress(body)
+            print(
+                f"{serializer.name:<10} {coding:<9} {len(stored):>9}"
+                f" {dumps_ms + measure(lambda: compress(body)):>8.3f}"
+                f" {loads_ms + measure(lambda: decompress(stored)):>8.3f}"
+            )
+
+
+def main() -> None:
+    """Print the tables for a feed page and a user profile."""
+    missing = [
+        package
+        for package, module in (("brotli", brotli), ("zstandard", zstandard))
+        if module is None
+    ]
+    if "orjson" not in available_serializers():
+        missing.append("orjson")
+    if missing:
+        print(f"not installed, skipped: {', '.join(missing)}")
+    bench("GetAllTweets", GetAllTweets.model_validate_json(make_payload()))
+    bench("UserProfile", make_profile())
+
+
+if __name__ == "__main__":
+    main()
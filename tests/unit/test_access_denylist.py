@@ -0,0 +1,43 @@
+"""Test bloom filter and denylist of access tokens."""
+
+from uuid import uuid4
+
+from src.core.controllers.depends.utils import access_denylist
+from src.core.controllers.depends.utils.bloom_filter import BloomFilter
+
+
+def test_bloom_filter_error_rate() -> None:
+    """Test added items are always found, others rarely."""
+    bloom = BloomFilter(capacity=10_000, error_rate=0.01)
+    added = [uuid4().hex for _ in range(10_000)]
+    for item in added:
+        bloom.add(item)
+
+    false_positives = sum(uuid4().hex in bloom for _ in range(10_000))
+
+    assert all(item in bloom for item in added)
+    assert false_positives < 200
+    assert len(bloom) == 10_000
+
+
+async def test_is_access_denied_checks_redis_only_on_hit(monkeypatch) -> None:
+    """Test filter miss skips Redis, hit is confirmed by Redis."""
+    calls = []
+
+    class FakeRedis:
+        async def exists(self, key: str) -> int:
+            calls.append(key)
+            return 1
+
+    async def setup_redis() -> FakeRedis:
+        return FakeRedis()
+
+    monkeypatch.setattr(access_denylist, "setup_redis", setup_redis)
+    monkeypatch.setattr(
+        access_denylist, "_denied", access_denylist.new_denylist_filter()
+    )
+    access_denylist._denied.add("denied")
+
+    assert not await access_denylist.is_access_denied("allowed")
+    assert await access_denylist.is_access_denied("denied")
+    assert calls == ["jwt-denied:denied"]
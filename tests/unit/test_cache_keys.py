@@ -0,0 +1,178 @@
+"""Test cache keys and ETags of cache_get_response."""
+
+from typing import Annotated
+
+import pydantic
+from fastapi import Depends, FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from src.core.controllers.depends.utils import redis_chash
+from src.core.controllers.depends.utils.connect_db import get_session
+from src.core.controllers.depends.utils.redis_chash import (
+    cache_get_response,
+    check_etag,
+    gen_etag,
+    get_request_key,
+    set_response_headers,
+)
+from src.core.settings.const import CacheConf
+
+
+def make_request(
+    path: str = "/api/users/1",
+    query: bytes = b"",
+    path_params: dict | None = None,
+    headers: list[tuple[bytes, bytes]] | None = None,
+) -> Request:
+    """Return GET request built from ASGI scope."""
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": query,
+            "path_params": path_params or {},
+            "headers": headers or [],
+        }
+    )
+
+
+def endpoint() -> None:
+    """Fake cached dependency."""
+
+
+def test_request_key_is_deterministic() -> None:
+    """Test key doesn't depend on process hash seed or query order."""
+    key = get_request_key("p", endpoint, make_request(query=b"a=1&b=2"))
+
+    assert key == get_request_key(
+        "p", endpoint, make_request(query=b"b=2&a=1")
+    )
+    assert key == "p:endpoint:" + key.rsplit(":", 1)[1]
+    assert len(key.rsplit(":", 1)[1]) == 32
+
+
+def test_request_key_includes_path_and_principal() -> None:
+    """Test different paths and users don't share a key."""
+    request = make_request(path_params={"id": "1"})
+    key = get_request_key("p", endpoint, request)
+
+    assert key != get_request_key(
+        "p",
+        endpoint,
+        make_request(path="/api/users/2", path_params={"id": "2"}),
+    )
+    assert key != get_request_key("p", endpoint, request, principal="user")
+
+
+def test_etag_is_stable_and_weak() -> None:
+    """Test ETag is the same for the same content in every process."""
+    etag = gen_etag('{"result":true}')
+
+    assert etag == gen_etag('{"result":true}')
+    assert etag != gen_etag('{"result":false}')
+    assert etag.startswith('W/"') and etag.endswith('"')
+
+
+def test_check_etag() -> None:
+    """Test If-None-Match lists and weak comparison."""
+    etag = gen_etag("body")
+    response = Response(headers={"ETag": etag})
+
+    for if_none_match in (etag, etag[2:], f'"other", {etag}', "*"):
+        request = make_request(
+            headers=[(b"if-none-match", if_none_match.encode())]
+        )
+        assert check_etag(request=request, response=response)
+
+    request = make_request(headers=[(b"if-none-match", b'"other"')])
+    assert not check_etag(request=request, response=response)
+    assert not check_etag(request=make_request(), response=response)
+
+
+class Page(pydantic.BaseModel):
+    """Cached response model."""
+
+    items: list[int]
+
+
+def test_etag_guard_skips_session(monkeypatch) -> None:
+    """Test matching If-None-Match gets 304 before the session is opened."""
+    store: dict[str, dict] = {}
+    sessions = []
+
+    async def get_cache(cache_key, fields=(), namespaces=()):
+        entry = store.get(cache_key, {})
+        meta = (
+            CacheConf.FIELD_GENERATION,
+            CacheConf.FIELD_ETAG,
+            CacheConf.FIELD_FRESH_UNTIL,
+        )
+        return (
+            [entry.get(f) for f in meta],
+            [entry.get(f) for f in fields],
+            b"",
+        )
+
+    async def set_cache(cache_key, meta, value, ex):
+        store[cache_key] = {**meta, **value}
+
+    async def acquire_fill_lock(cache_key):
+        return "token"
+
+    async def release_fill_lock(cache_key, token):
+        pass
+
+    async def fake_session():
+        sessions.append(1)
+        yield None
+
+    for name, fake in (
+        ("get_cache", get_cache),
+        ("set_cache", set_cache),
+        ("acquire_fill_lock", acquire_fill_lock),
+        ("release_fill_lock", release_fill_lock),
+        ("get_local_cache", lambda: None),
+    ):
+        monkeypatch.setattr(redis_chash, name, fake)
+
+    @cache_get_response(expire=10, prefix_key="page")
+    async def get_page(
+        session: Annotated[None, Depends(get_session)],
+        request: Request,
+        response: Response,
+    ) -> Page:
+        return Page(items=list(range(100)))
+
+    app = FastAPI()
+
+    @app.get("/page")
+    async def page(data: Annotated[Page, Depends(get_page)]) -> Page:
+        return data
+
+    app.dependency_overrides[get_session] = fake_session
+    client = TestClient(app)
+
+    etag = client.get("/page").headers["etag"]
+    assert sessions == [1]
+
+    response = client.get("/page", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.headers["cache-control"] == "no-cache"
+    assert sessions == [1]
+
+    response = client.get("/page", headers={"If-None-Match": '"other"'})
+    assert response.status_code == 200
+    assert sessions == [1, 1]
+
+
+def test_response_headers_revalidate() -> None:
+    """Test clients always revalidate, per-user bodies stay private."""
+    public, private = Response(), Response()
+
+    set_response_headers(response=public, etag='"a"')
+    set_response_headers(response=private, etag='"a"', private=True)
+
+    assert public.headers["cache-control"] == "no-cache"
+    assert private.headers["cache-control"] == "private, no-cache"
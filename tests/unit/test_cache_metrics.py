@@ -0,0 +1,40 @@
+"""Test cache metrics and keyspace prefixes."""
+
+from src.core.controllers.depends.metrics.cache_stats import keyspace_prefix
+from src.core.controllers.depends.utils.cache_metrics import CacheMetrics
+from src.core.settings.const import CacheConf, TimelineConf
+
+
+def test_metrics_render() -> None:
+    """Test counters, cumulative histogram and sizes are rendered."""
+    metrics = CacheMetrics(latency_buckets=(0.001, 0.01))
+    metrics.inc("GET /api/tweets", "HIT")
+    metrics.inc("GET /api/tweets", "HIT")
+    metrics.observe_latency("GET /api/tweets", "read", 0.0005)
+    metrics.observe_latency("GET /api/tweets", "read", 0.5)
+    metrics.observe_size("GET /api/tweets", 100)
+    metrics.observe_size("GET /api/tweets", 300)
+
+    text = metrics.render(gauges={"breaker_open": 0})
+
+    assert 'prefix="GET /api/tweets",event="HIT"} 2' in text
+    assert 'op="read",le="0.001"} 1' in text
+    assert 'op="read",le="+Inf"} 2' in text
+    assert "value_bytes_sum{pid=" in text
+    assert 'prefix="GET /api/tweets"} 400' in text
+    assert "value_bytes_max{pid=" in text
+    assert "microblog_cache_breaker_open{pid=" in text
+
+
+def test_keyspace_prefix() -> None:
+    """Test keys are grouped by the known prefixes."""
+    assert (
+        keyspace_prefix(f"{CacheConf.PREFIX_GET_TWEETS}:get_tweets_data:ab")
+        == CacheConf.PREFIX_GET_TWEETS
+    )
+    assert (
+        keyspace_prefix(f"{CacheConf.META_PREFIX}:GET x:ab")
+        == CacheConf.META_PREFIX
+    )
+    assert keyspace_prefix(TimelineConf.CELEBRITIES_KEY) == TimelineConf.PREFIX
+    assert keyspace_prefix("unknown") == "other"
@@ -0,0 +1,67 @@
+"""Test serializers of cached responses."""
+
+import datetime
+import decimal
+import uuid
+
+import pydantic
+import pytest
+
+from src.core.controllers.depends.utils.cache_serializers import (
+    CacheSerializer,
+    OrjsonSerializer,
+    get_cache_serializer,
+)
+from src.core.validators import UserProfile
+
+PROFILE = UserProfile(
+    result=True,
+    user={
+        "id": "1",
+        "name": "author",
+        "followers": [{"id": "2", "name": "fan"}],
+        "following": [],
+    },
+)
+
+
+class Event(pydantic.BaseModel):
+    """Model with fields converted by pydantic's JSON mode."""
+
+    id: uuid.UUID
+    created_at: datetime.datetime
+    price: decimal.Decimal
+
+
+EVENT = Event(
+    id=uuid.UUID("3fa85f64-5717-4562-b3fc-2c963f66afa6"),
+    created_at=datetime.datetime(
+        2024, 10, 6, 12, 30, 15, 123000, tzinfo=datetime.UTC
+    ),
+    price=decimal.Decimal("1.50"),
+)
+
+
+def test_json_serializer_round_trip() -> None:
+    """Test default serializer dumps the model as pydantic JSON."""
+    serializer = CacheSerializer()
+
+    body = serializer.dumps(PROFILE)
+
+    assert body == PROFILE.model_dump_json().encode()
+    assert UserProfile(**serializer.loads(body)) == PROFILE
+
+
+def test_orjson_serializer_same_body() -> None:
+    """Test orjson body is the same, so ETags don't change with it."""
+    pytest.importorskip("orjson")
+
+    for model in (PROFILE, EVENT):
+        assert OrjsonSerializer().dumps(model) == CacheSerializer().dumps(
+            model
+        )
+
+
+def test_cache_serializer_fallback() -> None:
+    """Test cache falls back to JSON for missing serializers."""
+    assert type(get_cache_serializer("unknown")) is CacheSerializer
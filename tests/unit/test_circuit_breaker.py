@@ -0,0 +1,51 @@
+"""Test circuit breaker of optional backends."""
+
+import time
+
+from src.core.controllers.depends.utils.circuit_breaker import CircuitBreaker
+
+
+def test_breaker_opens_after_threshold() -> None:
+    """Test circuit opens only after consecutive failures."""
+    breaker = CircuitBreaker(threshold=3, cooldown=10)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+
+    assert breaker.allow()
+
+    breaker.record_failure()
+
+    assert breaker.is_open
+    assert not breaker.allow()
+
+
+def test_breaker_probe_after_cooldown(monkeypatch) -> None:
+    """Test one probe per cooldown, success closes the circuit."""
+    breaker = CircuitBreaker(threshold=1, cooldown=10)
+    breaker.record_failure()
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_success()
+
+    assert not breaker.is_open
+    assert breaker.allow()
+
+
+def test_breaker_failed_probe_reopens(monkeypatch) -> None:
+    """Test failed probe starts a new cooldown."""
+    breaker = CircuitBreaker(threshold=5, cooldown=10)
+    for _ in range(5):
+        breaker.record_failure()
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    breaker.allow()
+    breaker.record_failure()
+
+    assert not breaker.allow()
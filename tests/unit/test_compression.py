@@ -0,0 +1,40 @@
+"""Test precompressed bodies and Accept-Encoding negotiation."""
+
+import pytest
+
+from src.core.controllers.depends.utils.compression import (
+    choose_encoding,
+    compress_variants,
+    decompress_gzip,
+)
+
+AVAILABLE = ("br", "gzip")
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        (None, "identity"),
+        ("", "identity"),
+        ("gzip, deflate", "gzip"),
+        ("gzip, deflate, br", "br"),
+        ("br;q=0, gzip", "gzip"),
+        ("gzip;q=0.5, br;q=0.4", "gzip"),
+        ("*", "br"),
+        ("gzip;q=0, br;q=0", "identity"),
+        ("deflate", "identity"),
+    ],
+)
+def test_choose_encoding(accept_encoding: str | None, expected: str) -> None:
+    """Test coding is chosen by client quality, then server preference."""
+    assert choose_encoding(accept_encoding, AVAILABLE) == expected
+
+
+def test_compress_variants_round_trip() -> None:
+    """Test gzip variant is always stored and decompresses to the body."""
+    body = b'{"result":true,"tweets":[]}' * 100
+
+    variants = compress_variants(body)
+
+    assert len(variants["gzip"]) < len(body)
+    assert decompress_gzip(variants["gzip"]) == body
@@ -0,0 +1,87 @@
+"""Test streamed export of tweets."""
+
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.core.controllers.depends.tweets.get_tweets import get_tweets_stream
+from src.core.controllers.depends.utils.pagination import decode_cursor
+
+START = datetime(2024, 10, 6, 12, 30, 15)
+
+
+def make_stream(total: int, fail_after: int | None = None):
+    """Return engine and crud streaming `total` tweets in batches of 2."""
+    tweets = [
+        SimpleNamespace(
+            id=f"3fa85f64-5717-4562-b3fc-2c963f66a{i:03}",
+            created_at=START - timedelta(minutes=i),
+            content="text",
+            attachments=[],
+            owner=SimpleNamespace(id="author", name="author"),
+            like_count=0,
+            likes=[],
+        )
+        for i in range(total)
+    ]
+
+    async def stream_tweets(session, cursor, limit):
+        for start in range(0, min(limit, total), 2):
+            if fail_after is not None and start >= fail_after:
+                raise SQLAlchemyError("connection lost")
+            stop = min(start + 2, limit)
+            yield tweets[start:stop]
+
+    @asynccontextmanager
+    async def get_scoped_session():
+        yield SimpleNamespace(expunge_all=lambda: None)
+
+    engine = SimpleNamespace(get_scoped_session=get_scoped_session)
+    crud = SimpleNamespace(tweets=SimpleNamespace(stream_tweets=stream_tweets))
+    return engine, crud, tweets
+
+
+async def read_body(chunks) -> bytes:
+    """Return the streamed body."""
+    return b"".join([chunk async for chunk in chunks])
+
+
+@pytest.mark.parametrize("total", [0, 3, 4])
+async def test_export_stops_at_limit(total: int) -> None:
+    """Test body is valid JSON, `next_cursor` is set only if tweets remain."""
+    engine, crud, tweets = make_stream(total)
+
+    body = json.loads(
+        await read_body(
+            await get_tweets_stream(
+                engine=engine, crud=crud, limit=3, cursor=None
+            )
+        )
+    )
+
+    assert [tweet["id"] for tweet in body["tweets"]] == [
+        tweet.id for tweet in tweets[:3]
+    ]
+    if total > 3:
+        assert decode_cursor(body["next_cursor"]) == (
+            tweets[2].created_at,
+            tweets[2].id,
+        )
+    else:
+        assert body["next_cursor"] is None
+
+
+async def test_export_aborts_on_db_error() -> None:
+    """Test DB error mid-stream aborts the body instead of closing it."""
+    engine, crud, _ = make_stream(6, fail_after=2)
+
+    with pytest.raises(SQLAlchemyError):
+        await read_body(
+            await get_tweets_stream(
+                engine=engine, crud=crud, limit=5, cursor=None
+            )
+        )
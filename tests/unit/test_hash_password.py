@@ -0,0 +1,53 @@
+"""Test bcrypt runs off the event loop with bounded concurrency."""
+
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from src.core.controllers.depends.utils import hash_password
+
+
+@pytest.fixture(autouse=True)
+def hash_slots(monkeypatch) -> asyncio.Semaphore:
+    """Give every test its own semaphore of one slot."""
+    slots = asyncio.Semaphore(1)
+    monkeypatch.setattr(hash_password, "get_hash_slots", lambda: slots)
+    return slots
+
+
+async def test_hash_pwd_async_round_trip() -> None:
+    """Test hashing runs in the pool thread and validates."""
+    password_hash = await hash_password.hash_pwd_async("secret")
+
+    assert await hash_password.validate_pwd_async("secret", password_hash)
+    assert not await hash_password.validate_pwd_async("wrong", password_hash)
+
+
+async def test_run_in_hash_pool_keeps_loop_free() -> None:
+    """Test event loop runs other tasks while bcrypt works."""
+    started, release = threading.Event(), threading.Event()
+
+    def slow() -> str:
+        started.set()
+        release.wait(timeout=5)
+        return threading.current_thread().name
+
+    task = asyncio.create_task(hash_password.run_in_hash_pool(slow))
+    while not started.is_set():
+        await asyncio.sleep(0.001)
+    release.set()
+
+    assert (await task).startswith("bcrypt")
+
+
+async def test_run_in_hash_pool_queue_timeout(hash_slots) -> None:
+    """Test caller is rejected with 503 if no thread frees in time."""
+    await hash_slots.acquire()
+
+    with pytest.raises(HTTPException) as error:
+        await hash_password.run_in_hash_pool(str, queue_timeout=0.01)
+
+    assert error.value.status_code == 503
+    assert error.value.headers == {"Retry-After": "1"}
@@ -0,0 +1,73 @@
+"""Test in-process L1 cache."""
+
+import time
+
+from src.core.controllers.depends.utils.local_cache import (
+    CachedEntry,
+    LocalCache,
+)
+
+
+def _entry(size: int = 10, namespaces: tuple[str, ...] = ()) -> CachedEntry:
+    return CachedEntry(
+        etag='W/"tag"', variants={"gzip": b"x" * size}, namespaces=namespaces
+    )
+
+
+def test_local_cache_lru_eviction() -> None:
+    """Test least recently used entry is evicted first."""
+    cache = LocalCache(max_entries=2, max_bytes=1000, ttl=60)
+    cache.set("a", _entry(), cache.epoch)
+    cache.set("b", _entry(), cache.epoch)
+    cache.get("a")
+    cache.set("c", _entry(), cache.epoch)
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_local_cache_size_limit() -> None:
+    """Test cache stays within max bytes and skips too big entries."""
+    cache = LocalCache(max_entries=10, max_bytes=25, ttl=60)
+    cache.set("a", _entry(10), cache.epoch)
+    cache.set("b", _entry(10), cache.epoch)
+    cache.set("c", _entry(10), cache.epoch)
+    cache.set("big", _entry(30), cache.epoch)
+
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.get("big") is None
+
+
+def test_local_cache_ttl(monkeypatch) -> None:
+    """Test expired entry is a miss."""
+    cache = LocalCache(max_entries=10, max_bytes=1000, ttl=5)
+    cache.set("a", _entry(), cache.epoch)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 6)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_local_cache_invalidate() -> None:
+    """Test namespace invalidation drops only its entries."""
+    cache = LocalCache(max_entries=10, max_bytes=1000, ttl=60)
+    cache.set("feed", _entry(namespaces=("feed",)), cache.epoch)
+    cache.set("me", _entry(namespaces=("user:1",)), cache.epoch)
+
+    cache.invalidate(["feed"])
+
+    assert cache.get("feed") is None
+    assert cache.get("me") is not None
+
+
+def test_local_cache_stale_epoch() -> None:
+    """Test entry read before an invalidation isn't stored after it."""
+    cache = LocalCache(max_entries=10, max_bytes=1000, ttl=60)
+    epoch = cache.epoch
+    cache.invalidate(["feed"])
+    cache.set("feed", _entry(namespaces=("feed",)), epoch)
+
+    assert cache.get("feed") is None
@@ -0,0 +1,197 @@
+"""Test keyset pagination cursors."""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException, status
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from src.core.controllers.depends.tweets.get_tweets import get_home_tweets_data
+from src.core.controllers.depends.utils.pagination import (
+    decode_cursor,
+    decode_id_cursor,
+    decode_rank_cursor,
+    encode_cursor,
+    encode_id_cursor,
+    encode_rank_cursor,
+)
+from src.core.models_orm.crud_models.tweet_crud import Tweets
+
+
+def test_cursor_round_trip() -> None:
+    """Test decode_cursor(encode_cursor()) returns the same sort key."""
+    created_at = datetime(2024, 10, 6, 12, 30, 15, 123456)
+    id_row = "3fa85f64-5717-4562-b3fc-2c963f66afa6"
+
+    cursor = encode_cursor(created_at=created_at, id_row=id_row)
+
+    assert isinstance(cursor, str)
+    assert decode_cursor(cursor) == (created_at, id_row)
+
+
+def test_rank_cursor_round_trip() -> None:
+    """Test decode_rank_cursor(encode_rank_cursor()) returns the same key."""
+    created_at = datetime(2024, 10, 6, 12, 30, 15)
+    id_row = "3fa85f64-5717-4562-b3fc-2c963f66afa6"
+
+    cursor = encode_rank_cursor(rank=42, created_at=created_at, id_row=id_row)
+
+    assert decode_rank_cursor(cursor) == (42, created_at, id_row)
+    with pytest.raises(HTTPException):
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize("rank", [0.1 + 0.2, 1e-12, 3.0e-5 / 7, 0.0])
+def test_rank_cursor_keeps_float_exact(rank: float) -> None:
+    """Test float score survives the cursor bit for bit."""
+    created_at = datetime(2024, 10, 6, 12, 30, 15, 5)
+    id_row = "3fa85f64-5717-4562-b3fc-2c963f66afa6"
+
+    cursor = encode_rank_cursor(
+        rank=rank, created_at=created_at, id_row=id_row
+    )
+
+    assert decode_rank_cursor(cursor)[0] == rank
+
+
+@pytest.mark.parametrize("rank", [float("nan"), float("inf")])
+def test_rank_cursor_rejects_not_finite(rank: float) -> None:
+    """Test NaN or infinite rank raises HTTP 422."""
+    cursor = encode_rank_cursor(
+        rank=rank,
+        created_at=datetime(2024, 10, 6),
+        id_row="3fa85f64-5717-4562-b3fc-2c963f66afa6",
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        decode_rank_cursor(cursor)
+    assert exc.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_cursor_id_is_bound_as_uuid() -> None:
+    """Test cursor id is compared as UUID, PostgreSQL lacks uuid < varchar."""
+    queries = []
+
+    class FakeSession:
+        async def scalars(self, query):
+            queries.append(query)
+            return SimpleNamespace(all=lambda: [])
+
+    await Tweets.get_tweets(
+        session=FakeSession(),
+        limit=10,
+        cursor=(datetime(2024, 10, 6), "3fa85f64-5717-4562-b3fc-2c963f66afa6"),
+    )
+    sql = str(queries[0].compile(dialect=asyncpg.dialect()))
+
+    assert "(tweets.created_at, tweets.id) < ($1::TIMESTAMP" in sql
+    assert "$2::UUID)" in sql
+
+
+async def test_home_query_is_ordered_by_score() -> None:
+    """Test home page is sorted and continued on (score, created_at, id).
+
+    Each followed author's tweets are cut to the page before the merge.
+    """
+    queries = []
+
+    class FakeSession:
+        async def execute(self, query):
+            queries.append(query)
+            return SimpleNamespace(all=lambda: [])
+
+    rows = await Tweets.get_home_tweets(
+        session=FakeSession(),
+        id_user="3fa85f64-5717-4562-b3fc-2c963f66afa6",
+        limit=10,
+        cursor=(
+            0.5,
+            datetime(2024, 10, 6),
+            "3fa85f64-5717-4562-b3fc-2c963f66afa6",
+        ),
+    )
+    sql = str(queries[0].compile(dialect=postgresql.dialect()))
+
+    assert rows == []
+    assert "FROM followers JOIN LATERAL (SELECT" in sql
+    assert (
+        "WHERE tweets.author = followers.follower_id AND "
+        "(tweets.score, tweets.created_at, tweets.id) < ("
+    ) in sql
+    assert (
+        "ORDER BY tweets.score DESC, tweets.created_at DESC, tweets.id DESC"
+        in sql
+    )
+    assert (
+        "ORDER BY top.score DESC, top.created_at DESC, top.id DESC \n LIMIT"
+        in sql
+    )
+
+
+async def test_home_cursor_continues_after_last_row() -> None:
+    """Test next cursor holds the last row's score and is passed back."""
+    start = datetime(2024, 10, 6, 12, 30, 15)
+    tweets = [
+        SimpleNamespace(
+            id=f"3fa85f64-5717-4562-b3fc-2c963f66afa{i}",
+            created_at=start - timedelta(hours=i),
+            content="text",
+            attachments=[],
+            owner=SimpleNamespace(id="author", name="author"),
+            like_count=0,
+            likes=[],
+        )
+        for i in range(3)
+    ]
+    scores = [0.9, 0.1 + 0.2, 0.3]
+    cursors = []
+
+    async def get_home_tweets(session, id_user, limit, cursor):
+        cursors.append(cursor)
+        return list(zip(tweets, scores))[:limit]
+
+    async def get_liked_tweet_ids(session, id_user, ids):
+        return set()
+
+    crud = SimpleNamespace(
+        tweets=SimpleNamespace(
+            get_home_tweets=get_home_tweets,
+            get_liked_tweet_ids=get_liked_tweet_ids,
+        )
+    )
+
+    page = await get_home_tweets_data(
+        id_user="me", session=None, crud=crud, limit=2, cursor=None
+    )
+    await get_home_tweets_data(
+        id_user="me", session=None, crud=crud, limit=2, cursor=page.next_cursor
+    )
+
+    assert [tweet.id for tweet in page.tweets] == [t.id for t in tweets[:2]]
+    assert cursors == [None, (scores[1], tweets[1].created_at, tweets[1].id)]
+
+
+def test_id_cursor_round_trip() -> None:
+    """Test decode_id_cursor(encode_id_cursor()) returns the same key."""
+    cursor = encode_id_cursor(id_row=1234)
+
+    assert decode_id_cursor(cursor) == 1234
+    with pytest.raises(HTTPException):
+        decode_id_cursor(encode_cursor(datetime(2024, 10, 6), "1"))
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor",
+        encode_cursor(datetime(2024, 10, 6), "invalid-uuid"),
+        "MjAyNC0xMC0wNg==",
+    ],
+)
+def test_invalid_cursor(cursor: str) -> None:
+    """Test malformed cursor raises HTTP 422."""
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor)
+    assert exc.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
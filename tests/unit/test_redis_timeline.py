@@ -0,0 +1,304 @@
+"""Test Redis timeline helpers."""
+
+import datetime
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from redis import asyncio as aioredis
+
+from src.core.controllers.depends.tweets import get_tweets
+from src.core.controllers.depends.utils import redis_timeline
+from src.core.controllers.depends.utils.redis_timeline import (
+    fan_out_tweet,
+    from_score,
+    mark_celebrity,
+    timeline_key,
+    to_score,
+)
+from src.core.settings.const import TimelineConf
+
+START = datetime.datetime(2024, 10, 6, 12, 30, 15)
+
+
+def _bound(value: str) -> tuple[float, bool]:
+    if value.startswith("("):
+        return float(value[1:]), True
+    return float(value), False
+
+
+class FakePipeline:
+    """Pipeline of FakeRedis, commands run on execute."""
+
+    def __init__(self, redis: "FakeRedis") -> None:
+        self.redis = redis
+        self.commands: list = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+    def __getattr__(self, name: str):
+        def queue(*args, **kwargs) -> None:
+            self.commands.append((getattr(self.redis, name), args, kwargs))
+
+        return queue
+
+    async def execute(self) -> list:
+        return [await command(*a, **kw) for command, a, kw in self.commands]
+
+
+class FakeRedis:
+    """Redis with the sorted and plain set commands of timelines."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.sets: dict[str, set[str]] = {}
+
+    def _check(self) -> None:
+        if self.fail:
+            raise aioredis.ConnectionError("down")
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def register_script(self, script: str):
+        async def fan_out(keys, args, client) -> None:
+            # Same steps as the Lua script, run in the pipeline.
+            async def run() -> int:
+                score, member, max_len = args
+                if keys[0] in self.zsets:
+                    await self.zadd(keys[0], {member: score})
+                    await self.zremrangebyrank(keys[0], 0, -max_len - 1)
+                return 0
+
+            client.commands.append((run, (), {}))
+
+        return fan_out
+
+    async def exists(self, key: str) -> int:
+        self._check()
+        return int(key in self.zsets or key in self.sets)
+
+    async def delete(self, key: str) -> int:
+        self._check()
+        return int(self.zsets.pop(key, None) is not None)
+
+    async def zadd(self, key: str, mapping: dict[str, float]) -> int:
+        self._check()
+        self.zsets.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    async def zremrangebyrank(self, key: str, start: int, end: int) -> int:
+        self._check()
+        ordered = sorted(self.zsets[key].items(), key=lambda i: (i[1], i[0]))
+        stop = (len(ordered) + end if end < 0 else end) + 1
+        for member, _ in ordered[start:stop]:
+            del self.zsets[key][member]
+        return max(stop - start, 0)
+
+    async def zrevrangebyscore(
+        self, key, max, min, start=None, num=None, withscores=False
+    ) -> list:
+        self._check()
+        high, high_open = _bound(str(max))
+        low, low_open = _bound(str(min))
+        items = sorted(
+            (
+                (member, score)
+                for member, score in self.zsets.get(key, {}).items()
+                if (score < high if high_open else score <= high)
+                and (score > low if low_open else score >= low)
+            ),
+            key=lambda i: (i[1], i[0]),
+            reverse=True,
+        )
+        if num is not None:
+            stop = start + num
+            items = items[start:stop]
+        return items
+
+    async def sadd(self, key: str, *members: str) -> int:
+        self._check()
+        self.sets.setdefault(key, set()).update(members)
+        return len(members)
+
+    async def smismember(self, key: str, members: list[str]) -> list[int]:
+        self._check()
+        return [int(m in self.sets.get(key, set())) for m in members]
+
+
+def make_tweet(author: str, created_at: datetime.datetime):
+    """Return tweet with the fields read by the serializer."""
+    return SimpleNamespace(
+        id=str(uuid.uuid4()),
+        author=author,
+        created_at=created_at,
+        content="text",
+        attachments=[],
+        owner=SimpleNamespace(id=author, name=author),
+        like_count=0,
+        likes=[],
+    )
+
+
+def make_crud(tweets: list, followed_ids: list[str]):
+    """Return crud reading the tweets list."""
+
+    def newest(items):
+        return sorted(items, key=lambda t: (t.created_at, t.id), reverse=True)
+
+    async def get_followed_ids(id_user, session):
+        return followed_ids
+
+    async def get_authors_tweet_keys(session, authors_ids, limit):
+        return [
+            (t.id, t.created_at)
+            for t in newest(t for t in tweets if t.author in authors_ids)
+        ][:limit]
+
+    async def get_tweets_by_ids(session, ids):
+        return [t for t in tweets if t.id in ids]
+
+    async def get_authors_tweets(session, authors_ids, limit, cursor=None):
+        return [
+            t
+            for t in newest(t for t in tweets if t.author in authors_ids)
+            if cursor is None or (t.created_at, t.id) < cursor
+        ][:limit]
+
+    async def get_liked_tweet_ids(session, id_user, ids):
+        return set()
+
+    return SimpleNamespace(
+        users=SimpleNamespace(get_followed_ids=get_followed_ids),
+        tweets=SimpleNamespace(
+            get_authors_tweet_keys=get_authors_tweet_keys,
+            get_tweets_by_ids=get_tweets_by_ids,
+            get_authors_tweets=get_authors_tweets,
+            get_liked_tweet_ids=get_liked_tweet_ids,
+        ),
+    )
+
+
+@pytest.fixture
+def fake_redis(monkeypatch) -> FakeRedis:
+    """Return FakeRedis used by the timeline helpers."""
+    redis = FakeRedis()
+
+    async def setup_redis() -> FakeRedis:
+        return redis
+
+    monkeypatch.setattr(redis_timeline, "setup_redis", setup_redis)
+    return redis
+
+
+async def read_all_pages(crud, limit: int) -> list[str]:
+    """Return tweet ids of the home timeline read page by page."""
+    ids: list[str] = []
+    cursor = None
+    while True:
+        page = await get_tweets.get_materialized_home_tweets(
+            id_user="me", session=None, crud=crud, limit=limit, cursor=cursor
+        )
+        ids.extend(tweet.id for tweet in page.tweets)
+        if page.next_cursor is None:
+            return ids
+        cursor = page.next_cursor
+
+
+def test_score_round_trip() -> None:
+    """Test naive UTC creation time survives ZSET score conversion."""
+    created_at = datetime.datetime(2024, 10, 6, 12, 30, 15, 123000)
+
+    assert from_score(to_score(created_at)) == created_at
+
+
+def test_score_order() -> None:
+    """Test newer tweets have higher score."""
+    older = datetime.datetime(2024, 10, 6, 12, 30, 15)
+    newer = older + datetime.timedelta(microseconds=1000)
+
+    assert to_score(newer) > to_score(older)
+
+
+def test_timeline_key() -> None:
+    """Test timeline key is per user."""
+    assert timeline_key("a") != timeline_key("b")
+    assert timeline_key("a").endswith(":a")
+
+
+async def test_fan_out_only_to_built_timelines(fake_redis) -> None:
+    """Test tweet is pushed to existing timelines, missing stay missing."""
+    fake_redis.zsets[timeline_key("built")] = {"old": to_score(START)}
+
+    await fan_out_tweet(
+        id_tweet="new",
+        created_at=START + datetime.timedelta(seconds=1),
+        follower_ids=["built", "missing"],
+        max_len=1,
+    )
+
+    assert fake_redis.zsets == {
+        timeline_key("built"): {"new": to_score(START) + 1}
+    }
+
+
+async def test_mark_celebrity_ignores_redis_error(fake_redis) -> None:
+    """Test failed Redis doesn't fail the posted tweet."""
+    fake_redis.fail = True
+
+    await mark_celebrity(id_author="author")
+
+
+async def test_rebuild_on_miss_and_cursor(fake_redis) -> None:
+    """Test missing timeline is rebuilt, pages merge celebrities in order."""
+    tweets = [
+        make_tweet("friend", START + datetime.timedelta(seconds=i // 2))
+        for i in range(7)
+    ] + [
+        make_tweet("star", START + datetime.timedelta(seconds=i))
+        for i in range(3)
+    ]
+    fake_redis.sets[TimelineConf.CELEBRITIES_KEY] = {"star"}
+    crud = make_crud(tweets, followed_ids=["friend", "star"])
+    expected = [
+        t.id
+        for t in sorted(
+            tweets, key=lambda t: (t.created_at, t.id), reverse=True
+        )
+    ]
+
+    assert await read_all_pages(crud, limit=3) == expected
+    assert set(fake_redis.zsets[timeline_key("me")]) == {
+        t.id for t in tweets if t.author == "friend"
+    }
+    assert await read_all_pages(crud, limit=2) == expected
+
+
+async def test_unfollowed_authors_are_skipped(fake_redis) -> None:
+    """Test tweets left in the timeline by unfollowed users are skipped."""
+    kept = make_tweet("friend", START)
+    gone = make_tweet("former", START)
+    fake_redis.zsets[timeline_key("me")] = {
+        kept.id: to_score(START),
+        gone.id: to_score(START),
+    }
+    crud = make_crud([kept, gone], followed_ids=["friend"])
+
+    assert await read_all_pages(crud, limit=5) == [kept.id]
+
+
+async def test_redis_down_reads_from_db(fake_redis) -> None:
+    """Test timeline is read from DB in the same order if Redis fails."""
+    tweets = [
+        make_tweet("friend", START + datetime.timedelta(seconds=i))
+        for i in range(5)
+    ]
+    fake_redis.fail = True
+    crud = make_crud(tweets, followed_ids=["friend"])
+
+    assert await read_all_pages(crud, limit=2) == [t.id for t in tweets[::-1]]
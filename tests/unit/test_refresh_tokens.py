@@ -0,0 +1,377 @@
+"""Test device binding, rotation and revocation of refresh tokens."""
+
+import datetime
+import time
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from jwt.exceptions import InvalidTokenError
+from redis import asyncio as aioredis
+from sqlalchemy.dialects import postgresql
+from starlette.requests import Request
+
+from src.core.controllers.auth.auth import auth
+from src.core.controllers.depends.auth import check_token, logout_user
+from src.core.controllers.depends.auth.check_token import (
+    refresh_device,
+    up_tokens_by_refresh,
+)
+from src.core.controllers.depends.utils import jwt_token, refresh_tokens
+from src.core.controllers.depends.utils.connect_db import get_crud, get_session
+from src.core.controllers.depends.utils.refresh_tokens import (
+    device_fingerprint,
+    revoked_key,
+    rotated_key,
+    token_ttl,
+)
+from src.core.models_orm.crud_models.auth_crud import AuthUsers
+from src.core.settings.routes_path import AuthRoutes
+
+
+def _request(**headers: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "headers": [
+                (name.replace("_", "-").lower().encode(), value.encode())
+                for name, value in headers.items()
+            ],
+        }
+    )
+
+
+def test_device_fingerprint_prefers_header() -> None:
+    """Test explicit fingerprint wins over User-Agent."""
+    browser = _request(user_agent="browser")
+
+    assert device_fingerprint(browser) == device_fingerprint(browser)
+    assert device_fingerprint(
+        _request(user_agent="browser", x_device_fingerprint="device")
+    ) == device_fingerprint(_request(x_device_fingerprint="device"))
+    assert device_fingerprint(browser) != device_fingerprint(
+        _request(user_agent="other")
+    )
+
+
+def test_refresh_device() -> None:
+    """Test refresh token is accepted only from its device."""
+    request = _request(user_agent="browser")
+    token = {
+        "type": "refresh_token",
+        "sub": "1",
+        "jti": "abc",
+        "fp": device_fingerprint(request),
+    }
+
+    assert refresh_device(token, request) == ("1", "abc", token["fp"])
+    for bad in (
+        token | {"type": "access_token"},
+        token | {"jti": None},
+        token | {"fp": device_fingerprint(_request(user_agent="other"))},
+    ):
+        with pytest.raises(InvalidTokenError):
+            refresh_device(bad, request)
+
+
+def test_token_ttl() -> None:
+    """Test revocation lasts until the token expires."""
+    assert 59 <= token_ttl({"exp": int(time.time()) + 60}) <= 61
+    assert token_ttl({"exp": int(time.time()) - 60}) == 1
+
+
+class FakePipeline:
+    """Pipeline of FakeRedis, commands run on execute."""
+
+    def __init__(self, redis: "FakeRedis") -> None:
+        self.redis = redis
+        self.commands: list = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+    def set(self, *args, **kwargs) -> None:
+        self.commands.append((args, kwargs))
+
+    async def execute(self) -> list:
+        return [await self.redis.set(*a, **kw) for a, kw in self.commands]
+
+
+class FakeRedis:
+    """Redis with the string commands of refresh tokens."""
+
+    def __init__(self) -> None:
+        self.fail = False
+        self.values: dict[str, str] = {}
+
+    def _check(self) -> None:
+        if self.fail:
+            raise aioredis.ConnectionError("down")
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def set(self, key: str, value, ex: int | None = None) -> bool:
+        self._check()
+        self.values[key] = str(value)
+        return True
+
+    async def get(self, key: str) -> str | None:
+        self._check()
+        return self.values.get(key)
+
+    async def exists(self, key: str) -> int:
+        self._check()
+        return int(key in self.values)
+
+
+class FakeAuthUsers:
+    """`users_auth_ip` rows as current jti by user and fingerprint."""
+
+    def __init__(self) -> None:
+        self.rows: dict[tuple[str, str], str] = {}
+
+    async def rotate_refresh_token(
+        self, user_id, fingerprint, old_jti, new_jti, session
+    ) -> bool:
+        if self.rows.get((user_id, fingerprint)) != old_jti:
+            return False
+        self.rows[(user_id, fingerprint)] = new_jti
+        return True
+
+    async def logout_user(self, user_id, fingerprint, session) -> list[str]:
+        jti = self.rows.pop((user_id, fingerprint), None)
+        return [jti] if jti else []
+
+
+class FakeCrud:
+    """Crud with the auth methods of refresh tokens."""
+
+    def __init__(self) -> None:
+        self.auth_users = FakeAuthUsers()
+
+
+class FakeSession:
+    """Session recording executed statements."""
+
+    def __init__(self, scalar=None) -> None:
+        self.statements: list = []
+        self._scalar = scalar
+
+    async def scalar(self, statement):
+        self.statements.append(statement)
+        return self._scalar
+
+    async def execute(self, statement) -> None:
+        self.statements.append(statement)
+
+    async def commit(self) -> None:
+        pass
+
+    def sql(self) -> str:
+        return str(self.statements[0].compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def fake_redis(monkeypatch) -> FakeRedis:
+    """Return FakeRedis used by the refresh token helpers."""
+    redis = FakeRedis()
+
+    async def setup_redis() -> FakeRedis:
+        return redis
+
+    monkeypatch.setattr(refresh_tokens, "setup_redis", setup_redis)
+    return redis
+
+
+@pytest.fixture
+def issued(monkeypatch) -> list[dict]:
+    """Return refresh claims of the issued token pairs."""
+    claims: list[dict] = []
+
+    def response(payload: dict, refresh_claims: dict) -> dict:
+        claims.append(refresh_claims)
+        return refresh_claims
+
+    monkeypatch.setattr(check_token, "response", response)
+    return claims
+
+
+def _refresh(jti: str, request: Request) -> dict:
+    return {
+        "type": "refresh_token",
+        "sub": "1",
+        "jti": jti,
+        "fp": device_fingerprint(request),
+    }
+
+
+async def test_rotate_refresh_token_compare_and_set() -> None:
+    """Test token is replaced only if `old_jti` is the current one."""
+    current = FakeSession(scalar="3fa85f64-5717-4562-b3fc-2c963f66afa6")
+    stale = FakeSession(scalar=None)
+    kwargs = {"user_id": "1", "fingerprint": "fp", "old_jti": "a"}
+
+    assert await AuthUsers.rotate_refresh_token(
+        new_jti="b", session=current, **kwargs
+    )
+    assert not await AuthUsers.rotate_refresh_token(
+        new_jti="b", session=stale, **kwargs
+    )
+    sql = current.sql()
+    assert sql.startswith("UPDATE users_auth_ip SET refresh_token=")
+    assert "users_auth_ip.refresh_token = %(refresh_token_1)s" in sql
+    assert "RETURNING users_auth_ip.id" in sql
+
+
+async def test_save_refresh_token_upserts() -> None:
+    """Test login replaces the device's token instead of adding a row."""
+    session = FakeSession()
+
+    assert await AuthUsers.save_refresh_token(
+        user_id="1", fingerprint="fp", jti="a", session=session
+    )
+    assert (
+        "ON CONFLICT ON CONSTRAINT uq_users_auth_ip_user_id_fingerprint "
+        "DO UPDATE SET refresh_token = excluded.refresh_token"
+    ) in session.sql()
+
+
+async def test_refresh_rotates_token(fake_redis, issued) -> None:
+    """Test refresh issues new jti and revokes the used one."""
+    request = _request(user_agent="browser")
+    crud = FakeCrud()
+    crud.auth_users.rows[("1", device_fingerprint(request))] = "a"
+
+    await up_tokens_by_refresh(
+        request=request, token=_refresh("a", request), crud=crud, session=None
+    )
+
+    next_jti = issued[0]["jti"]
+    assert crud.auth_users.rows == {
+        ("1", device_fingerprint(request)): next_jti
+    }
+    assert revoked_key("a") in fake_redis.values
+    assert fake_redis.values[rotated_key("a")] == next_jti
+
+
+async def test_concurrent_refresh_shares_successor(fake_redis, issued) -> None:
+    """Test reuse within the grace window gets the same new token."""
+    request = _request(user_agent="browser")
+    crud = FakeCrud()
+    crud.auth_users.rows[("1", device_fingerprint(request))] = "a"
+
+    for _ in range(2):
+        await up_tokens_by_refresh(
+            request=request,
+            token=_refresh("a", request),
+            crud=crud,
+            session=None,
+        )
+
+    assert issued[0]["jti"] == issued[1]["jti"]
+    assert crud.auth_users.rows == {
+        ("1", device_fingerprint(request)): issued[0]["jti"]
+    }
+
+
+@pytest.mark.parametrize("redis_down", [False, True])
+async def test_reuse_ends_session(fake_redis, issued, redis_down) -> None:
+    """Test reuse after the grace window revokes the device's token.
+
+    With Redis down the replay is caught by the compare-and-set.
+    """
+    request = _request(user_agent="browser")
+    crud = FakeCrud()
+    crud.auth_users.rows[("1", device_fingerprint(request))] = "b"
+    fake_redis.values[revoked_key("a")] = "1"
+    fake_redis.fail = redis_down
+
+    with pytest.raises(HTTPException) as e:
+        await up_tokens_by_refresh(
+            request=request,
+            token=_refresh("a", request),
+            crud=crud,
+            session=None,
+        )
+
+    assert e.value.status_code == 401
+    assert crud.auth_users.rows == {}
+    assert issued == []
+    assert (revoked_key("b") in fake_redis.values) is not redis_down
+
+
+async def test_logout_revokes_device(fake_redis, issued, monkeypatch) -> None:
+    """Test logout revokes both tokens, reuse gets no successor then."""
+    denied: list[str] = []
+
+    async def deny_access_token(jti: str, ttl: int) -> bool:
+        denied.append(jti)
+        return True
+
+    monkeypatch.setattr(logout_user, "deny_access_token", deny_access_token)
+    request = _request(user_agent="browser")
+    crud = FakeCrud()
+    crud.auth_users.rows[("1", device_fingerprint(request))] = "a"
+    await up_tokens_by_refresh(
+        request=request, token=_refresh("a", request), crud=crud, session=None
+    )
+    next_jti = issued[0]["jti"]
+
+    assert await logout_user.logout_device(
+        request=request,
+        access_token={"type": "access_token", "sub": "1", "jti": "access"},
+        token=_refresh(next_jti, request),
+        crud=crud,
+        session=None,
+    )
+    assert crud.auth_users.rows == {}
+    assert revoked_key(next_jti) in fake_redis.values
+    assert denied == ["access"]
+    with pytest.raises(HTTPException):
+        await up_tokens_by_refresh(
+            request=request,
+            token=_refresh("a", request),
+            crud=crud,
+            session=None,
+        )
+
+
+async def test_logout_with_expired_access_token(
+    fake_redis, monkeypatch
+) -> None:
+    """Test expired or missing access token doesn't block logout."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    monkeypatch.setattr(jwt_token, "get_private_key", lambda: key)
+    monkeypatch.setattr(jwt_token, "get_public_key", key.public_key)
+    request = _request(user_agent="testclient")
+    crud = FakeCrud()
+    app = FastAPI()
+    app.include_router(auth)
+    app.dependency_overrides[get_crud] = lambda: crud
+    app.dependency_overrides[get_session] = lambda: None
+    client = TestClient(app)
+    expired = jwt_token.encode_jwt(
+        payload={"type": "access_token", "sub": "1", "jti": "access"},
+        expire_delta=datetime.timedelta(seconds=-1),
+    )
+
+    for headers in ({"Authorization": f"Bearer {expired}"}, {}):
+        crud.auth_users.rows[("1", device_fingerprint(request))] = "a"
+        client.cookies.set(
+            "refresh_token",
+            jwt_token.create_token(
+                payload=_refresh("a", request), type_token="refresh_token"
+            ),
+        )
+
+        response = client.delete(AuthRoutes.DEL_LOGOUT_USER, headers=headers)
+
+        assert response.status_code == 200
+        assert crud.auth_users.rows == {}
+        assert revoked_key("a") in fake_redis.values
+        del fake_redis.values[revoked_key("a")]
@@ -0,0 +1,99 @@
+"""Test coalescing of concurrent cache misses and refreshes."""
+
+import asyncio
+
+import pytest
+
+from src.core.controllers.depends.utils import redis_chash
+from src.core.controllers.depends.utils.local_cache import CachedEntry
+
+ENTRY = CachedEntry(etag='W/"tag"', variants={"gzip": b"body"})
+
+
+@pytest.fixture
+def fill_lock(monkeypatch) -> dict[str, bool]:
+    """Replace the Redis fill lock with a flag."""
+    lock = {"held": False}
+
+    async def acquire(cache_key: str) -> str | None:
+        return None if lock["held"] else "token"
+
+    async def release(cache_key: str, token: str) -> None:
+        pass
+
+    monkeypatch.setattr(redis_chash, "acquire_fill_lock", acquire)
+    monkeypatch.setattr(redis_chash, "release_fill_lock", release)
+    return lock
+
+
+async def test_single_flight_one_fill_per_worker(fill_lock) -> None:
+    """Test concurrent misses of one worker share one fill."""
+    calls = []
+
+    async def fill() -> CachedEntry:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return ENTRY
+
+    async def poll() -> None:
+        return None
+
+    results = await asyncio.gather(
+        *(redis_chash.single_flight("key", fill, poll) for _ in range(10))
+    )
+
+    assert len(calls) == 1
+    assert all(entry is ENTRY for entry, _ in results)
+    assert [status for _, status in results].count("MISS") == 1
+
+
+async def test_single_flight_waits_for_other_worker(fill_lock) -> None:
+    """Test lock held by another worker makes the request poll."""
+    fill_lock["held"] = True
+
+    async def fill() -> CachedEntry:
+        raise AssertionError("filled despite the lock")
+
+    async def poll() -> CachedEntry:
+        return ENTRY
+
+    assert await redis_chash.single_flight("key", fill, poll) == (
+        ENTRY,
+        "HIT",
+    )
+
+
+async def test_single_flight_shares_errors(fill_lock) -> None:
+    """Test followers get the leader's error and the key is released."""
+
+    async def fill() -> CachedEntry:
+        await asyncio.sleep(0.01)
+        raise ValueError("db error")
+
+    async def poll() -> None:
+        return None
+
+    results = await asyncio.gather(
+        *(redis_chash.single_flight("key", fill, poll) for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert "key" not in redis_chash._inflight
+
+
+async def test_revalidate_once_per_key(fill_lock) -> None:
+    """Test stale hits of one key start a single background refresh."""
+    calls = []
+
+    async def refresh() -> CachedEntry:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return ENTRY
+
+    for _ in range(5):
+        redis_chash.revalidate_in_background("key", refresh)
+    await asyncio.gather(*redis_chash._background_tasks)
+
+    assert len(calls) == 1
+    assert "key" not in redis_chash._revalidating
@@ -0,0 +1,62 @@
+"""Test in-process cache of verified JWT payloads."""
+
+import time
+
+import pytest
+from jwt.exceptions import InvalidTokenError
+
+from src.core.controllers.depends.utils import jwt_token
+from src.core.controllers.depends.utils.token_cache import VerifiedTokenCache
+
+
+def _payload(ttl: int = 60) -> dict:
+    return {"sub": "1", "type": "access_token", "exp": int(time.time()) + ttl}
+
+
+def test_token_cache_expires_at_exp(monkeypatch) -> None:
+    """Test token is a miss once its `exp` has passed."""
+    cache = VerifiedTokenCache(max_entries=10)
+    payload = _payload(ttl=5)
+    cache.set("token", payload)
+    now = time.time()
+
+    assert cache.get("token") == payload
+    monkeypatch.setattr(time, "time", lambda: now + 6)
+    assert cache.get("token") is None
+    assert len(cache) == 0
+
+
+def test_token_cache_lru_and_copies() -> None:
+    """Test cache is bounded and callers can't change cached payloads."""
+    cache = VerifiedTokenCache(max_entries=2)
+    for token in ("a", "b", "c"):
+        cache.set(token, _payload())
+
+    cache.get("b").pop("sub")
+
+    assert cache.get("a") is None
+    assert cache.get("b")["sub"] == "1"
+    assert len(cache) == 2
+
+
+def test_decode_jwt_cached_verifies_once(monkeypatch) -> None:
+    """Test repeat token skips verification, invalid one isn't cached."""
+    calls = []
+
+    def decode_jwt(jwt_token: str) -> dict:
+        calls.append(jwt_token)
+        if jwt_token == "bad":
+            raise InvalidTokenError
+        return _payload()
+
+    monkeypatch.setattr(jwt_token, "decode_jwt", decode_jwt)
+    cache = VerifiedTokenCache(max_entries=10)
+    monkeypatch.setattr(jwt_token, "get_verified_tokens", lambda: cache)
+
+    jwt_token.decode_jwt_cached("good")
+    jwt_token.decode_jwt_cached("good")
+    for _ in range(2):
+        with pytest.raises(InvalidTokenError):
+            jwt_token.decode_jwt_cached("bad")
+
+    assert calls == ["good", "bad", "bad"]
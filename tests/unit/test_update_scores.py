@@ -0,0 +1,60 @@
+"""Test scoring job of tweets."""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from src.core.jobs import update_scores as job
+
+START = datetime(2024, 10, 6, 12, 30, 15)
+
+
+def patch_job(monkeypatch, batches: list) -> list:
+    """Make the job read `batches` and return the `after` it passed."""
+    calls: list = []
+    results = iter(batches)
+
+    async def expire_scores(session):
+        return 0
+
+    async def update_scores(session, after, batch_size):
+        calls.append(after)
+        return next(results)
+
+    @asynccontextmanager
+    async def get_scoped_session():
+        yield None
+
+    async def get_engine(url, echo):
+        return SimpleNamespace(get_scoped_session=get_scoped_session)
+
+    crud = SimpleNamespace(
+        tweets=SimpleNamespace(
+            expire_scores=expire_scores, update_scores=update_scores
+        )
+    )
+    monkeypatch.setattr(job, "create_crud_helper", lambda: crud)
+    monkeypatch.setattr(job, "get_engine", get_engine)
+    return calls
+
+
+async def test_update_scores_walks_batches(monkeypatch) -> None:
+    """Test each batch continues after the last key of the previous one."""
+    first = (START, "3fa85f64-5717-4562-b3fc-2c963f66afa6")
+    second = (
+        START + timedelta(hours=1),
+        "0d5f3b52-1e8c-4b67-9a3a-6f1c2b7d8e90",
+    )
+    calls = patch_job(monkeypatch, [(first, 2), (second, 2), (None, 0)])
+
+    assert await job.update_scores(batch_size=2) == 4
+    assert calls == [None, first, second]
+
+
+async def test_update_scores_stops_on_failed_batch(monkeypatch) -> None:
+    """Test DB error stops the run with the tweets scored so far."""
+    first = (START, "3fa85f64-5717-4562-b3fc-2c963f66afa6")
+    calls = patch_job(monkeypatch, [(first, 2), None])
+
+    assert await job.update_scores(batch_size=2) == 2
+    assert calls == [None, first]